@@ -0,0 +1,14 @@
+"""
+Benchmark suite for 가송장 생성기
+
+Run from the repository root:
+    python -m benchmarks run                      # all stages, default sizes
+    python -m benchmarks run --quick              # small sizes for a fast check
+    python -m benchmarks run --stages generate,check --sizes 1000,100000 -o current.json
+    python -m benchmarks compare benchmarks/baseline.json current.json
+    python -m benchmarks history-scale --sizes 1000000,10000000
+    python -m benchmarks startup --budget-window 1.0   # exits 1 if cold start is over budget
+
+Results are written as JSON (see benchmarks.harness); compare exits with
+status 1 when any stage is slower than the baseline beyond the threshold.
+"""
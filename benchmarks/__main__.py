@@ -0,0 +1,267 @@
+"""
+Benchmark suite command line
+
+Commands:
+    run         Run stage benchmarks and write JSON results
+    saturation  Measure generation as today's keyspace fills up
+    history-scale
+                Measure history load/register/save latency and memory at 1M-50M numbers
+    startup     Measure cold start (first window, ready-to-generate) and import costs
+    compare     Compare results against a stored baseline and flag regressions
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add repository root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.harness import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_results,
+    load_results,
+    print_comparison_table,
+    print_summary_table,
+    save_results,
+)
+
+DEFAULT_SIZES = (1000, 10000, 100000, 800000)
+QUICK_SIZES = (100, 1000, 10000)
+DEFAULT_REPEAT = 5
+
+
+def _parse_list(value: str) -> list:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run selected stage benchmarks"""
+    from benchmarks.stages import STAGES
+    from src.utils.logger import get_logger
+
+    if not args.verbose:
+        get_logger().setLevel(logging.WARNING)
+
+    stages = _parse_list(args.stages) if args.stages else list(STAGES)
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"❌ Unknown stages: {', '.join(unknown)} (available: {', '.join(STAGES)})")
+        return 2
+
+    if args.sizes:
+        sizes = [int(size) for size in _parse_list(args.sizes)]
+    else:
+        sizes = list(QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    repeat = args.repeat or (3 if args.quick else DEFAULT_REPEAT)
+
+    print("=" * 70)
+    print("🚀 가송장 생성기 - BENCHMARK SUITE")
+    print("=" * 70)
+    print(f"  Stages: {', '.join(stages)}")
+    print(f"  Sizes:  {', '.join(f'{size:,}' for size in sizes)}  (repeat: {repeat})")
+    print()
+
+    workdir = tempfile.mkdtemp(prefix="gasongjang_bench_")
+    results = {}
+    try:
+        for stage in stages:
+            results[stage] = {}
+            for size in sizes:
+                start = time.perf_counter()
+                summary = STAGES[stage](size, repeat, workdir)
+                results[stage][str(size)] = summary
+                print(
+                    f"  {stage:<14} {size:>8,}: median {summary['median']:.4f}s, "
+                    f"p95 {summary['p95']:.4f}s  ({time.perf_counter() - start:.1f}s total)"
+                )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print()
+    print_summary_table(results)
+    save_results(args.output, results, {'repeat': repeat, 'sizes': sizes, 'stages': stages})
+    print()
+    print(f"💾 Results saved to: {args.output}")
+    return 0
+
+
+def saturation_command(args: argparse.Namespace) -> int:
+    """Run the keyspace-saturation benchmark"""
+    from benchmarks.saturation import (
+        DEFAULT_BATCH_SIZES,
+        DEFAULT_OCCUPANCIES,
+        print_saturation_table,
+        run_saturation,
+    )
+    from src.utils.logger import get_logger
+
+    if not args.verbose:
+        get_logger().setLevel(logging.CRITICAL)
+
+    occupancies = [float(value) for value in _parse_list(args.occupancies)] if args.occupancies \
+        else list(DEFAULT_OCCUPANCIES)
+    batch_sizes = [int(value) for value in _parse_list(args.batches)] if args.batches \
+        else list(DEFAULT_BATCH_SIZES)
+
+    print("=" * 70)
+    print("🚀 가송장 생성기 - KEYSPACE SATURATION")
+    print("=" * 70)
+
+    workdir = tempfile.mkdtemp(prefix="gasongjang_bench_")
+    try:
+        results = run_saturation(workdir, occupancies, batch_sizes, args.repeat)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_saturation_table(results)
+    save_results(args.output, results, {
+        'repeat': args.repeat, 'occupancies': occupancies, 'batch_sizes': batch_sizes,
+    })
+    print()
+    print(f"💾 Results saved to: {args.output}")
+    return 0
+
+
+def history_scale_command(args: argparse.Namespace) -> int:
+    """Run the history-scale benchmark"""
+    from benchmarks.history_scale import (
+        DEFAULT_LAYOUTS,
+        DEFAULT_SIZES as HISTORY_SIZES,
+        print_history_scale_table,
+        run_history_scale,
+    )
+
+    sizes = [int(size) for size in _parse_list(args.sizes)] if args.sizes else list(HISTORY_SIZES)
+    layouts = _parse_list(args.layouts) if args.layouts else list(DEFAULT_LAYOUTS)
+    unknown = [layout for layout in layouts if layout not in DEFAULT_LAYOUTS]
+    if unknown:
+        print(f"❌ Unknown layouts: {', '.join(unknown)} (available: {', '.join(DEFAULT_LAYOUTS)})")
+        return 2
+
+    print("=" * 70)
+    print("🚀 가송장 생성기 - HISTORY SCALE")
+    print("=" * 70)
+    print(f"  Layouts: {', '.join(layouts)}")
+    print(f"  Sizes:   {', '.join(f'{size:,}' for size in sizes)}")
+    print()
+
+    workdir = tempfile.mkdtemp(prefix="gasongjang_bench_", dir=args.workdir)
+    try:
+        results = run_history_scale(workdir, sizes, layouts, timeout=args.timeout)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_history_scale_table(results)
+    save_results(args.output, results, {'sizes': sizes, 'layouts': layouts})
+    print()
+    print(f"💾 Results saved to: {args.output}")
+    return 0
+
+
+def startup_command(args: argparse.Namespace) -> int:
+    """Run the startup benchmark and check it against the budget"""
+    from benchmarks.startup import check_budget, measure_startup, print_startup_report
+
+    print("=" * 70)
+    print("🚀 가송장 생성기 - STARTUP")
+    print("=" * 70)
+    print(f"  Runs: {args.repeat}  (history: {args.history_size:,} numbers)")
+    print()
+
+    report = measure_startup(args.repeat, args.history_size)
+    print_startup_report(report)
+    save_results(args.output, report['results'], {
+        'repeat': args.repeat, 'history_size': args.history_size, 'imports': report['imports'],
+    })
+    print()
+    print(f"💾 Results saved to: {args.output}")
+
+    violations = check_budget(report['results'], args.budget_window, args.budget_ready)
+    if violations:
+        print()
+        for violation in violations:
+            print(f"🔴 {violation}")
+        return 1
+    print(f"✅ Within budget (first window {args.budget_window:.2f}s, ready {args.budget_ready:.2f}s)")
+    return 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """Compare results against a baseline"""
+    rows = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+        metric=args.metric,
+    )
+    if not rows:
+        print("⚠️  No overlapping stages/sizes to compare")
+        return 0
+
+    print(f"📊 {args.current} vs {args.baseline} ({args.metric}, threshold {args.threshold:.0%})")
+    regressions, improvements = print_comparison_table(rows)
+    print()
+    print(f"  {regressions} regressions, {improvements} improvements, {len(rows)} comparisons")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    """Benchmark suite entry point"""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="가송장 생성기 benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run stage benchmarks")
+    run.add_argument("--stages", help="Comma-separated stages (default: all)")
+    run.add_argument("--sizes", help="Comma-separated sizes (default: 1000,10000,100000,800000)")
+    run.add_argument("--repeat", type=int, help=f"Timed runs per size (default: {DEFAULT_REPEAT})")
+    run.add_argument("--quick", action="store_true", help="Small sizes and fewer runs")
+    run.add_argument("-o", "--output", default="benchmark_results.json", help="Results JSON path")
+    run.add_argument("-v", "--verbose", action="store_true", help="Show application log output")
+    run.set_defaults(func=run_command)
+
+    saturation = commands.add_parser("saturation", help="Measure generation near keyspace exhaustion")
+    saturation.add_argument("--occupancies", help="Comma-separated fill levels (default: 0,0.5,0.9,0.99,0.999)")
+    saturation.add_argument("--batches", help="Comma-separated batch sizes (default: 1,100,1000,10000)")
+    saturation.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per combination")
+    saturation.add_argument("-o", "--output", default="saturation_results.json", help="Results JSON path")
+    saturation.add_argument("-v", "--verbose", action="store_true", help="Show application log output")
+    saturation.set_defaults(func=saturation_command)
+
+    history = commands.add_parser("history-scale", help="Measure history operations at 1M-50M numbers")
+    history.add_argument("--sizes", help="Comma-separated stored counts (default: 1000000,10000000,50000000)")
+    history.add_argument("--layouts", help="Comma-separated layouts: json, archive (default: both)")
+    history.add_argument("--workdir", help="Directory for fixtures (default: system temp; needs several GB)")
+    history.add_argument("--timeout", type=float, default=3600, help="Seconds per worker before giving up")
+    history.add_argument("-o", "--output", default="history_scale_results.json", help="Results JSON path")
+    history.set_defaults(func=history_scale_command)
+
+    from benchmarks.startup import DEFAULT_FIRST_WINDOW_BUDGET, DEFAULT_READY_BUDGET
+    startup = commands.add_parser("startup", help="Measure cold start and check the startup budget")
+    startup.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Application starts to time")
+    startup.add_argument("--history-size", type=int, default=0, help="Numbers in the seeded history")
+    startup.add_argument("--budget-window", type=float, default=DEFAULT_FIRST_WINDOW_BUDGET,
+                         help=f"Max median seconds to first window (default: {DEFAULT_FIRST_WINDOW_BUDGET})")
+    startup.add_argument("--budget-ready", type=float, default=DEFAULT_READY_BUDGET,
+                         help=f"Max median seconds to ready-to-generate (default: {DEFAULT_READY_BUDGET})")
+    startup.add_argument("-o", "--output", default="startup_results.json", help="Results JSON path")
+    startup.set_defaults(func=startup_command)
+
+    compare = commands.add_parser("compare", help="Compare results against a baseline")
+    compare.add_argument("baseline", help="Baseline results JSON")
+    compare.add_argument("current", help="Current results JSON")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                         help="Relative slowdown counted as regression (default: 0.10)")
+    compare.add_argument("--metric", choices=("median", "p95"), default="median")
+    compare.set_defaults(func=compare_command)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
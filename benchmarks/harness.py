@@ -0,0 +1,214 @@
+"""
+Benchmark Harness
+
+Shared timing, statistics, result storage and baseline comparison for the
+benchmark suite.
+
+Result file format (JSON):
+{
+  "meta": {"timestamp", "python", "platform", "machine", "cpu_count", ...},
+  "results": {
+    "<stage>": {
+      "<size>": {"runs": [...], "median": s, "p95": s, "min": s, "max": s,
+                 "per_item_us": us, ...extra metrics}
+    }
+  }
+}
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_REGRESSION_THRESHOLD = 0.10  # 10% slower than baseline median
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Samples
+        pct: Percentile in [0, 100]
+
+    Returns:
+        float: Percentile value
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(runs: List[float], size: int) -> Dict[str, Any]:
+    """
+    Build summary statistics for repeated runs
+
+    Args:
+        runs: Elapsed seconds per run
+        size: Items processed per run
+
+    Returns:
+        dict: runs, median, p95, min, max, per_item_us
+    """
+    median = statistics.median(runs)
+    return {
+        'runs': [round(run, 6) for run in runs],
+        'median': median,
+        'p95': percentile(runs, 95),
+        'min': min(runs),
+        'max': max(runs),
+        'per_item_us': median / size * 1e6 if size else 0.0,
+    }
+
+
+def measure(
+    func: Callable[[Any], Any],
+    size: int,
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None,
+    teardown: Optional[Callable[[Any], None]] = None,
+    warmup: int = 1
+) -> Dict[str, Any]:
+    """
+    Time func(setup()) repeatedly, excluding setup and teardown
+
+    Args:
+        func: Function under test, receives the setup result
+        size: Items processed per call (for per-item cost)
+        repeat: Number of timed runs
+        setup: Builds fresh input for each run (untimed)
+        teardown: Cleans up after each run (untimed)
+        warmup: Untimed runs before measuring
+
+    Returns:
+        dict: Summary statistics (see summarize)
+    """
+    runs: List[float] = []
+    for iteration in range(warmup + repeat):
+        state = setup() if setup else None
+        gc.collect()
+        start = time.perf_counter()
+        func(state)
+        elapsed = time.perf_counter() - start
+        if teardown:
+            teardown(state)
+        if iteration >= warmup:
+            runs.append(elapsed)
+    return summarize(runs, size)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe the machine and interpreter the results came from"""
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(path: str, results: Dict[str, Dict[str, Dict[str, Any]]], meta: Dict[str, Any]) -> None:
+    """
+    Write results as JSON
+
+    Args:
+        path: Output path
+        results: {stage: {size: summary}}
+        meta: Run metadata (merged with environment_info())
+    """
+    payload = {'meta': {**environment_info(), **meta}, 'results': results}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a results JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    metric: str = 'median'
+) -> List[Dict[str, Any]]:
+    """
+    Compare two result files stage by stage and size by size
+
+    Args:
+        baseline: Loaded baseline results
+        current: Loaded current results
+        threshold: Relative slowdown that counts as a regression (0.10 = 10%)
+        metric: Statistic to compare ('median' or 'p95')
+
+    Returns:
+        list: One row per (stage, size) present in both, with ratio and status
+              ('regression', 'improvement' or 'ok')
+    """
+    rows = []
+    for stage, sizes in current.get('results', {}).items():
+        base_sizes = baseline.get('results', {}).get(stage, {})
+        for size, summary in sizes.items():
+            base = base_sizes.get(size)
+            if not base or metric not in base or metric not in summary or not base[metric]:
+                continue
+
+            ratio = summary[metric] / base[metric]
+            if ratio > 1 + threshold:
+                status = 'regression'
+            elif ratio < 1 - threshold:
+                status = 'improvement'
+            else:
+                status = 'ok'
+
+            rows.append({
+                'stage': stage,
+                'size': size,
+                'baseline': base[metric],
+                'current': summary[metric],
+                'ratio': ratio,
+                'status': status,
+            })
+    return rows
+
+
+def print_summary_table(results: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    """Print median/p95 per stage and size"""
+    print(f"  {'stage':<22}{'size':>10}{'median (s)':>14}{'p95 (s)':>12}{'µs/item':>12}")
+    print("  " + "-" * 68)
+    for stage, sizes in results.items():
+        for size, summary in sizes.items():
+            print(
+                f"  {stage:<22}{size:>10}{summary['median']:>14.4f}"
+                f"{summary['p95']:>12.4f}{summary['per_item_us']:>12.2f}"
+            )
+
+
+def print_comparison_table(rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Print comparison rows
+
+    Returns:
+        tuple[int, int]: (regressions, improvements)
+    """
+    icons = {'regression': '🔴', 'improvement': '🟢', 'ok': '  '}
+    print(f"  {'stage':<22}{'size':>10}{'baseline':>12}{'current':>12}{'ratio':>9}")
+    print("  " + "-" * 65)
+    for row in rows:
+        print(
+            f"{icons[row['status']]}{row['stage']:<22}{row['size']:>10}"
+            f"{row['baseline']:>12.4f}{row['current']:>12.4f}{row['ratio']:>8.2f}x"
+        )
+    regressions = sum(1 for row in rows if row['status'] == 'regression')
+    improvements = sum(1 for row in rows if row['status'] == 'improvement')
+    return regressions, improvements
@@ -0,0 +1,290 @@
+"""
+History-scale Benchmark
+
+Measures UniquenessChecker at 1M-50M stored numbers for two storage layouts:
+
+- json:     Legacy layout, every number in the JSON history file and the hot set
+            (retention disabled)
+- archive:  Today's numbers in the JSON hot file, past days in the compact
+            archive (default retention)
+
+For each layout and size a fresh worker process:
+- Loads the history (constructor: _load_history + archive index)
+- Registers single numbers (register_number, including its save)
+- Registers a batch of 1,000 numbers (register_batch, including its save)
+- Saves the history (_write_history)
+- Reports latency for each step plus RSS after load and peak RSS
+
+Running each size in its own process keeps peak RSS honest. A worker that
+runs out of memory or crashes is reported as failed, which is exactly the
+point where a layout stops being usable on our PCs.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.history_store import write_store
+from src.core.keyspace import compose_number, day_key
+from benchmarks.harness import summarize
+
+DEFAULT_SIZES = (1_000_000, 10_000_000, 50_000_000)
+DEFAULT_LAYOUTS = ('json', 'archive')
+NUMBERS_PER_DAY = 100_000
+SINGLE_REGISTRATIONS = 3
+BATCH_REGISTRATION_SIZE = 1000
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Get this process's peak resident set size
+
+    Returns:
+        Optional[float]: Peak RSS in MB, or None if the platform can't report it
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Get this process's current resident set size in MB (None if unavailable)"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+def _fixture_days(size: int, seed: int = 11) -> Iterator[Tuple[str, List[int]]]:
+    """
+    Yield (day, sorted indices) for `size` numbers, oldest day first
+
+    Every past day holds NUMBERS_PER_DAY numbers; today holds the remainder.
+    """
+    rng = random.Random(seed)
+    past_days = (size - 1) // NUMBERS_PER_DAY
+    today = datetime.now()
+    for offset in range(past_days, 0, -1):
+        yield day_key(today - timedelta(days=offset)), sorted(rng.sample(range(810000), NUMBERS_PER_DAY))
+    yield day_key(today), sorted(rng.sample(range(810000), size - past_days * NUMBERS_PER_DAY))
+
+
+def write_fixture(workdir: str, layout: str, size: int) -> str:
+    """
+    Write a history of `size` numbers in the given layout (streamed, bounded memory)
+
+    Args:
+        workdir: Directory for the history files
+        layout: 'json' or 'archive'
+        size: Stored numbers
+
+    Returns:
+        str: History file path
+    """
+    history_file = os.path.join(workdir, f"history_{layout}_{size}.json")
+    archive_file = history_file + ".archive"
+    for leftover in (history_file, archive_file):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+    today = day_key(datetime.now())
+    hot_days: List[Tuple[str, List[int]]] = []
+
+    def archived_days() -> Iterator[Tuple[str, List[int]]]:
+        for day, indices in _fixture_days(size):
+            if layout == 'archive' and day != today:
+                yield day, indices
+            else:
+                hot_days.append((day, indices))
+
+    if layout == 'archive':
+        write_store(archive_file, archived_days())
+    else:
+        hot_days = _fixture_days(size)
+
+    with open(history_file, 'w', encoding='utf-8') as f:
+        f.write('[')
+        first = True
+        for day, indices in hot_days:
+            for index in indices:
+                f.write(('' if first else ',') + '"' + compose_number(day, index) + '"')
+                first = False
+        f.write(']')
+
+    return history_file
+
+
+def measure_worker(layout: str, history_file: str) -> Dict[str, Any]:
+    """
+    Run the measurements inside a worker process
+
+    Args:
+        layout: 'json' or 'archive'
+        history_file: Fixture written by write_fixture
+
+    Returns:
+        dict: Latencies (seconds) and memory (MB)
+    """
+    from src.core.uniqueness_checker import UniquenessChecker
+
+    retention = None if layout == 'json' else 0
+    rss_before = current_rss_mb()
+
+    start = time.perf_counter()
+    checker = UniquenessChecker(history_file=history_file, retention_days=retention)
+    load = time.perf_counter() - start
+    rss_loaded = current_rss_mb()
+
+    today = day_key(datetime.now())
+    used_today = checker.snapshot_day(today)
+    free = (compose_number(today, index) for index in range(810000))
+    free = (number for number in free if number not in used_today)
+
+    singles = []
+    for _ in range(SINGLE_REGISTRATIONS):
+        number = next(free)
+        start = time.perf_counter()
+        checker.register_number(number)
+        singles.append(time.perf_counter() - start)
+
+    batch = [next(free) for _ in range(BATCH_REGISTRATION_SIZE)]
+    start = time.perf_counter()
+    checker.register_batch(batch)
+    register_batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checker._write_history()
+    save = time.perf_counter() - start
+
+    return {
+        'load': load,
+        'register_number': singles,
+        'register_batch': register_batch,
+        'save': save,
+        'stored': checker.get_count(),
+        'rss_before_mb': rss_before,
+        'rss_loaded_mb': rss_loaded,
+        'peak_rss_mb': peak_rss_mb(),
+        'history_file_mb': os.path.getsize(history_file) / (1024 * 1024),
+        'archive_file_mb': (
+            os.path.getsize(history_file + ".archive") / (1024 * 1024)
+            if os.path.exists(history_file + ".archive") else 0.0
+        ),
+    }
+
+
+def run_history_scale(
+    workdir: str,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    layouts: Sequence[str] = DEFAULT_LAYOUTS,
+    timeout: float = 3600
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Run the history-scale benchmark for every layout and size
+
+    Args:
+        workdir: Scratch directory for fixtures
+        sizes: Stored numbers per scenario
+        layouts: Storage layouts to compare
+        timeout: Seconds before a worker is considered hung
+
+    Returns:
+        dict: {"history_<step>[<layout>]": {"<size>": summary}} in the suite's JSON format;
+              failed workers are reported under "history_failed[<layout>]"
+    """
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    for layout in layouts:
+        for size in sizes:
+            history_file = write_fixture(workdir, layout, size)
+            command = [sys.executable, "-m", "benchmarks.history_scale", "--worker", layout, history_file]
+            try:
+                completed = subprocess.run(
+                    command, cwd=repo_root, capture_output=True, text=True, timeout=timeout
+                )
+                failed = completed.returncode != 0
+                reason = completed.stderr.strip().splitlines()[-1:] if failed else []
+            except subprocess.TimeoutExpired:
+                failed, reason = True, ["timeout"]
+            finally:
+                for leftover in (history_file, history_file + ".archive"):
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
+
+            if failed:
+                results.setdefault(f"history_failed[{layout}]", {})[str(size)] = {
+                    'returncode': None if reason == ["timeout"] else completed.returncode,
+                    'reason': reason[0] if reason else "killed (likely out of memory)",
+                }
+                continue
+
+            data = json.loads(completed.stdout.strip().splitlines()[-1])
+            memory = {
+                'rss_loaded_mb': data['rss_loaded_mb'],
+                'peak_rss_mb': data['peak_rss_mb'],
+                'history_file_mb': data['history_file_mb'],
+                'archive_file_mb': data['archive_file_mb'],
+            }
+            steps = {
+                'history_load': ([data['load']], size),
+                'history_register_number': (data['register_number'], 1),
+                'history_register_batch': ([data['register_batch']], BATCH_REGISTRATION_SIZE),
+                'history_save': ([data['save']], size),
+            }
+            for step, (runs, items) in steps.items():
+                results.setdefault(f"{step}[{layout}]", {})[str(size)] = {**summarize(runs, items), **memory}
+
+    return results
+
+
+def print_history_scale_table(results: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    """Print latency and memory per layout and size"""
+    print(f"  {'step':<34}{'stored':>12}{'median (s)':>12}{'RSS (MB)':>10}{'peak (MB)':>11}")
+    print("  " + "-" * 79)
+    for stage, sizes in results.items():
+        for size, summary in sizes.items():
+            if 'median' not in summary:
+                print(f"  {stage:<34}{int(size):>12,}  ❌ {summary['reason']}")
+                continue
+            rss = summary['rss_loaded_mb']
+            peak = summary['peak_rss_mb']
+            print(
+                f"  {stage:<34}{int(size):>12,}{summary['median']:>12.4f}"
+                f"{rss if rss is not None else float('nan'):>10.0f}"
+                f"{peak if peak is not None else float('nan'):>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    # Worker entry point: python -m benchmarks.history_scale --worker <layout> <history_file>
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        from src.utils.logger import get_logger
+        import logging
+
+        get_logger().setLevel(logging.CRITICAL)
+        print(json.dumps(measure_worker(sys.argv[2], sys.argv[3])))
+        sys.exit(0)
+    print("Use: python -m benchmarks history-scale")
+    sys.exit(2)
@@ -0,0 +1,133 @@
+"""
+Keyspace-saturation Benchmark
+
+Pre-fills today's history to a given occupancy of the daily keyspace
+(810,000 numbers, or this site's shard) and measures generate_and_register
+for typical batch sizes:
+
+- Wall time (median / p95)
+- Random draws per batch and retries per generated number
+- Failure rate (capacity exhausted or retry budget exceeded)
+
+This is the tail behavior of peak days (Chuseok, 11.11), when most of the
+day's numbers are already issued and random draws increasingly collide.
+
+Results use the suite's JSON format with one stage per occupancy level
+("saturation@0.9") and batch sizes as sizes, so they can be compared with
+`python -m benchmarks compare`.
+"""
+
+import os
+import random
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from src.core.keyspace import compose_number, day_key
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from benchmarks.harness import percentile
+
+DEFAULT_OCCUPANCIES = (0.0, 0.5, 0.9, 0.99, 0.999)
+DEFAULT_BATCH_SIZES = (1, 100, 1000, 10000)
+
+
+def prefilled_days(occupancy: float, generator: TrackingNumberGenerator, seed: int = 7) -> Dict[str, frozenset]:
+    """
+    Build today's history partition at the requested occupancy
+
+    Args:
+        occupancy: Fraction of the generator's daily capacity already issued
+        generator: Generator whose keyspace shard is filled
+        seed: Sampling seed
+
+    Returns:
+        dict: {today: frozenset of issued numbers}
+    """
+    today = day_key(datetime.now())
+    partition = generator.partition
+    used = int(partition.capacity * occupancy)
+    positions = random.Random(seed).sample(range(partition.capacity), used)
+    numbers = frozenset(
+        compose_number(today, partition.position_to_index(today, position)) for position in positions
+    )
+    return {today: numbers} if numbers else {}
+
+
+def run_saturation(
+    workdir: str,
+    occupancies: Sequence[float] = DEFAULT_OCCUPANCIES,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    repeat: int = 5
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Measure generation at each occupancy level and batch size
+
+    Args:
+        workdir: Scratch directory for history files
+        occupancies: Fractions of the daily keyspace pre-filled
+        batch_sizes: Numbers requested per batch
+        repeat: Runs per (occupancy, batch size), each from the same pre-filled state
+
+    Returns:
+        dict: {"saturation@<occupancy>": {"<batch>": summary}}
+    """
+    generator = TrackingNumberGenerator()
+    history_file = os.path.join(workdir, "saturation.json")
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for occupancy in occupancies:
+        base_days = prefilled_days(occupancy, generator)
+        stage = f"saturation@{occupancy:g}"
+        results[stage] = {}
+
+        for batch_size in batch_sizes:
+            runs: List[float] = []
+            attempts: List[int] = []
+            failures = 0
+
+            for _ in range(repeat):
+                checker = UniquenessChecker(history_file=history_file, retention_days=None)
+                checker._save_history = lambda: True  # measure generation, not file I/O
+                checker._days = dict(base_days)
+
+                start = time.perf_counter()
+                try:
+                    generator.generate_and_register(batch_size, checker)
+                except RuntimeError:
+                    failures += 1
+                runs.append(time.perf_counter() - start)
+                attempts.append(generator.last_attempts)
+
+            median = statistics.median(runs)
+            median_attempts = statistics.median(attempts)
+            results[stage][str(batch_size)] = {
+                'runs': [round(run, 6) for run in runs],
+                'median': median,
+                'p95': percentile(runs, 95),
+                'min': min(runs),
+                'max': max(runs),
+                'per_item_us': median / batch_size * 1e6,
+                'occupancy': occupancy,
+                'attempts_median': median_attempts,
+                'attempts_max': max(attempts),
+                'retries_per_number': max(median_attempts - batch_size, 0) / batch_size,
+                'failure_rate': failures / repeat,
+            }
+
+    return results
+
+
+def print_saturation_table(results: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    """Print timing, retries and failures per occupancy and batch size"""
+    print(f"  {'occupancy':>10}{'batch':>8}{'median (s)':>12}{'p95 (s)':>10}"
+          f"{'draws':>10}{'retries/num':>13}{'failures':>10}")
+    print("  " + "-" * 73)
+    for stage, sizes in results.items():
+        for size, summary in sizes.items():
+            print(
+                f"  {summary['occupancy']:>10.1%}{size:>8}{summary['median']:>12.4f}"
+                f"{summary['p95']:>10.4f}{summary['attempts_median']:>10.0f}"
+                f"{summary['retries_per_number']:>13.2f}{summary['failure_rate']:>10.0%}"
+            )
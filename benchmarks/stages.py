@@ -0,0 +1,345 @@
+"""
+Per-stage Benchmarks
+
+Each benchmark times one pipeline stage at a given size and returns the
+summary produced by harness.measure():
+
+- generate:      TrackingNumberGenerator.generate_batch against an empty history
+- check:         UniquenessChecker.check_batch against a history of the same size
+- register:      UniquenessChecker.register_batch (in memory, save deferred)
+- save_history:  Writing the history file
+- load_history:  Constructing UniquenessChecker from an existing history file
+- upload:        ExcelUploadHandler.read_excel + extract_special_codes
+- export:        ExcelExportHandler.create_output with formatting
+- end_to_end:    Upload → generate_and_register → export
+- pipeline:      The same workflow as concurrent stages (ExcelPipeline)
+- read_<format>_<backend>:
+                 Reading the 주문고유코드 column of a marketplace-shaped export
+                 (24 mixed columns, codes in the second) with one reader
+                 backend. A stage exists per installed backend and format;
+                 .xls fixtures need xlwt and are capped at 65,535 rows, the
+                 format's limit
+- ingest_batch / ingest_batch_serial:
+                 parallel_ingest.ingest_files over a batch of 8 marketplace
+                 exports of `size` rows each (projected reader), with one
+                 process per core / in-process; batches under
+                 INGEST_PARALLEL_MIN_BYTES are read in-process by both
+- parse_pool / parse_spawn:
+                 Reading one marketplace export in another process: on an
+                 already warm WorkerPool / in a freshly spawned process (what
+                 each file costs without the pool)
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import random
+import shutil
+from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from openpyxl import Workbook
+
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from src.handlers.excel_uploader import ExcelUploadHandler
+from src.handlers.excel_exporter import ExcelExportHandler
+from src.handlers.parallel_ingest import ingest_files, read_source
+from src.handlers.pipeline import ExcelPipeline
+from src.handlers.reader_backends import READER_BACKENDS
+from src.handlers.worker_pool import WorkerPool
+from src.utils.constants import INGEST_CHUNK_SIZE
+from benchmarks.harness import measure
+
+
+def make_numbers(size: int, seed: int = 1234, day: str = "20251104") -> List[str]:
+    """
+    Build distinct, well-formed tracking numbers for one day without the generator
+
+    Args:
+        size: Count (at most 810,000)
+        seed: Shuffle seed
+        day: YYYYMMDD day key
+
+    Returns:
+        List[str]: Tracking numbers
+    """
+    indices = random.Random(seed).sample(range(810000), size)
+    year, month, dd = day[:4], day[4:6], day[6:8]
+    return [f"{year}{i // 900 + 100:03d}{month}{i % 900 + 100:03d}{dd}" for i in indices]
+
+
+def make_codes(size: int) -> List[str]:
+    """Build order codes shaped like marketplace 주문고유코드 values"""
+    return [f"D{i:08X}" for i in range(size)]
+
+
+def input_workbook(workdir: str, size: int) -> str:
+    """
+    Get (creating once) an input xlsx with `size` order rows
+
+    Args:
+        workdir: Cache directory
+        size: Data rows
+
+    Returns:
+        str: Path to workbook
+    """
+    path = os.path.join(workdir, f"input_{size}.xlsx")
+    if not os.path.exists(path):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(['주문번호', '주문고유코드', '상품명'])
+        for i, code in enumerate(make_codes(size)):
+            sheet.append([f"ORD{i:07d}", code, f"상품{i % 50}"])
+        workbook.save(path)
+    return path
+
+
+XLS_MAX_ROWS = 65535  # Data rows that fit under the header in an .xls sheet
+INGEST_BATCH_FILES = 8  # Files per ingest_batch run (one per core of a packing PC)
+
+MARKETPLACE_HEADER = [
+    '주문번호', '주문고유코드', '상품주문번호', '주문일시', '결제일시', '상품명', '옵션정보', '수량',
+    '상품가격', '옵션가격', '할인금액', '결제금액', '배송비', '구매자명', '구매자연락처', '수취인명',
+    '수취인연락처', '우편번호', '배송지', '배송메세지', '택배사', '송장번호', '판매채널', '메모',
+]
+
+
+def marketplace_row(i: int) -> List[Any]:
+    """One order row shaped like a marketplace export (text, numbers, dates, blanks)"""
+    ordered = datetime(2025, 11, 4, 9) + timedelta(seconds=37 * i)
+    return [
+        f"2025110{i % 9 + 1}{i:08d}", f"D{i:08X}", 2025110400000000 + i, ordered, ordered + timedelta(minutes=3),
+        f"[무료배송] 상품{i % 500} 세트 구성 상품명이 긴 경우", f"색상: {'블랙' if i % 2 else '화이트'} / 사이즈: {i % 5 + 1}",
+        i % 3 + 1, 12900 + (i % 40) * 100, (i % 4) * 500, 1000 if i % 7 == 0 else 0, 13900 + (i % 40) * 100,
+        3000 if i % 5 else 0, f"구매자{i % 1000}", f"010-{i % 9000 + 1000}-{(i * 7) % 9000 + 1000}",
+        f"수취인{i % 1000}", f"010-{(i * 3) % 9000 + 1000}-{i % 9000 + 1000}", f"{i % 90000 + 10000:05d}",
+        f"서울특별시 강남구 테헤란로 {i % 500 + 1}길 {i % 90 + 1}, {i % 20 + 1}층", "문 앞에 놓아주세요" if i % 3 else None,
+        None, None, "스마트스토어", None,
+    ]
+
+
+def marketplace_workbook(workdir: str, size: int, extension: str = ".xlsx") -> str:
+    """
+    Get (creating once) a marketplace-shaped export with `size` order rows
+
+    Args:
+        workdir: Cache directory
+        size: Data rows (capped at XLS_MAX_ROWS for .xls)
+        extension: ".xlsx" or ".xls" (.xls needs xlwt)
+
+    Returns:
+        str: Path to workbook
+    """
+    path = os.path.join(workdir, f"marketplace_{size}{extension}")
+    if os.path.exists(path):
+        return path
+
+    if extension == ".xls":
+        import xlwt
+        workbook = xlwt.Workbook()
+        sheet = workbook.add_sheet("Sheet1")
+        date_style = xlwt.easyxf(num_format_str="yyyy-mm-dd hh:mm:ss")
+        for column, name in enumerate(MARKETPLACE_HEADER):
+            sheet.write(0, column, name)
+        for i in range(min(size, XLS_MAX_ROWS)):
+            for column, value in enumerate(marketplace_row(i)):
+                if isinstance(value, datetime):
+                    sheet.write(i + 1, column, value, date_style)
+                elif value is not None:
+                    sheet.write(i + 1, column, value)
+        workbook.save(path)
+    else:
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet1")
+        sheet.append(MARKETPLACE_HEADER)
+        for i in range(size):
+            sheet.append(marketplace_row(i))
+        workbook.save(path)
+    return path
+
+
+def _reader_stage(extension: str, backend: str) -> Callable[[int, int, str], Dict[str, Any]]:
+    """Build the read benchmark for one backend and format"""
+
+    def bench_read(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+        path = marketplace_workbook(workdir, size, extension)
+        rows = min(size, XLS_MAX_ROWS) if extension == ".xls" else size
+
+        def read(_):
+            for _block in ExcelUploadHandler.iter_special_codes(path, INGEST_CHUNK_SIZE, backend=backend):
+                pass
+
+        return measure(read, rows, repeat)
+
+    bench_read.__doc__ = f"Time reading the code column of a {extension} export with the {backend} backend"
+    return bench_read
+
+
+def _reader_stages() -> Dict[str, Callable[[int, int, str], Dict[str, Any]]]:
+    """One read stage per installed backend and format it handles"""
+    formats = ['.xlsx'] + (['.xls'] if importlib.util.find_spec("xlwt") is not None else [])
+    return {
+        f"read_{extension[1:]}_{name}": _reader_stage(extension, name)
+        for extension in formats
+        for name, backend in READER_BACKENDS.items()
+        if backend.is_available() and backend.handles(f"input{extension}")
+    }
+
+
+def _ingest_stage(max_workers: int) -> Callable[[int, int, str], Dict[str, Any]]:
+    """Build the batch ingestion benchmark (max_workers 0: one process per core)"""
+
+    def bench_ingest(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+        source = marketplace_workbook(workdir, size)
+        paths = []
+        for i in range(INGEST_BATCH_FILES):
+            path = os.path.join(workdir, f"batch_{size}_{i}.xlsx")
+            if not os.path.exists(path):
+                shutil.copyfile(source, path)
+            paths.append(path)
+
+        return measure(
+            lambda _: ingest_files(paths, max_workers=max_workers or None, backend="projected"),
+            size * INGEST_BATCH_FILES, repeat
+        )
+
+    bench_ingest.__doc__ = f"Time reading {INGEST_BATCH_FILES} exports of `size` rows with {max_workers or 'all'} processes"
+    return bench_ingest
+
+
+def bench_parse_pool(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time parsing one `size`-row export on an already warm worker pool"""
+    path = marketplace_workbook(workdir, size)
+    pool = WorkerPool(max_workers=1).start()
+    try:
+        return measure(lambda _: pool.parse(path), size, repeat)
+    finally:
+        pool.shutdown()
+
+
+def bench_parse_spawn(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time parsing one `size`-row export in a freshly spawned process"""
+    path = marketplace_workbook(workdir, size)
+
+    def parse(_):
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            executor.submit(read_source, path).result()
+
+    return measure(parse, size, repeat)
+
+
+def _history_file(workdir: str, name: str) -> str:
+    """Get a fresh history path in the work directory"""
+    path = os.path.join(workdir, name)
+    for leftover in (path, path + ".archive"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    return path
+
+
+def bench_generate(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time generation of `size` numbers against an empty history"""
+    generator = TrackingNumberGenerator()
+    return measure(lambda _: generator.generate_batch(size), size, repeat)
+
+
+def bench_check(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time check_batch of `size` numbers against `size` stored numbers"""
+    checker = UniquenessChecker(history_file=_history_file(workdir, "check.json"), retention_days=None)
+    checker.claim_batch(make_numbers(size, seed=1))
+    probe = make_numbers(size, seed=2)
+    return measure(lambda _: checker.check_batch(probe), size, repeat)
+
+
+def bench_register(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time in-memory register_batch of `size` numbers into a fresh checker"""
+    numbers = make_numbers(size)
+
+    def setup():
+        checker = UniquenessChecker(history_file=_history_file(workdir, "register.json"), retention_days=None)
+        checker._save_history = lambda: True  # isolate in-memory registration from file I/O
+        return checker
+
+    return measure(lambda checker: checker.register_batch(numbers), size, repeat, setup=setup)
+
+
+def bench_save_history(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time writing a history file holding `size` numbers"""
+    checker = UniquenessChecker(history_file=_history_file(workdir, "save.json"), retention_days=None)
+    checker.claim_batch(make_numbers(size))
+    return measure(lambda _: checker._write_history(), size, repeat)
+
+
+def bench_load_history(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time loading a history file holding `size` numbers"""
+    path = _history_file(workdir, "load.json")
+    UniquenessChecker(history_file=path, retention_days=None).claim_batch(make_numbers(size))
+    return measure(lambda _: UniquenessChecker(history_file=path, retention_days=None), size, repeat)
+
+
+def bench_upload(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time reading an input workbook with `size` rows and extracting codes"""
+    path = input_workbook(workdir, size)
+
+    def upload(_):
+        df = ExcelUploadHandler.read_excel(path)
+        ExcelUploadHandler.extract_special_codes(df)
+
+    return measure(upload, size, repeat)
+
+
+def bench_export(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time writing a formatted output workbook with `size` rows"""
+    codes = make_codes(size)
+    numbers = make_numbers(size)
+    output = os.path.join(workdir, "export.xlsx")
+    return measure(lambda _: ExcelExportHandler.create_output(codes, numbers, output), size, repeat)
+
+
+def bench_end_to_end(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time upload → generate and register → export for `size` rows"""
+    path = input_workbook(workdir, size)
+    output = os.path.join(workdir, "end_to_end.xlsx")
+
+    def setup():
+        return UniquenessChecker(history_file=_history_file(workdir, "e2e.json"), retention_days=None)
+
+    def run(checker):
+        df = ExcelUploadHandler.read_excel(path)
+        codes = ExcelUploadHandler.extract_special_codes(df)
+        numbers = TrackingNumberGenerator().generate_and_register(len(codes), checker)
+        ExcelExportHandler.create_output(codes, numbers, output)
+
+    return measure(run, size, repeat, setup=setup)
+
+
+def bench_pipeline(size: int, repeat: int, workdir: str) -> Dict[str, Any]:
+    """Time the pipelined upload → generate and register → export for `size` rows"""
+    path = input_workbook(workdir, size)
+    output = os.path.join(workdir, "pipeline.xlsx")
+
+    def setup():
+        return UniquenessChecker(history_file=_history_file(workdir, "pipeline.json"), retention_days=None)
+
+    return measure(lambda checker: ExcelPipeline(path, output, checker=checker).run(), size, repeat, setup=setup)
+
+
+STAGES: Dict[str, Callable[[int, int, str], Dict[str, Any]]] = {
+    'generate': bench_generate,
+    'check': bench_check,
+    'register': bench_register,
+    'save_history': bench_save_history,
+    'load_history': bench_load_history,
+    'upload': bench_upload,
+    'export': bench_export,
+    'end_to_end': bench_end_to_end,
+    'pipeline': bench_pipeline,
+    **_reader_stages(),
+    'ingest_batch': _ingest_stage(0),
+    'ingest_batch_serial': _ingest_stage(1),
+    'parse_pool': bench_parse_pool,
+    'parse_spawn': bench_parse_spawn,
+}
@@ -0,0 +1,236 @@
+"""
+Startup Benchmark
+
+Measures cold start of main.py the way an operator experiences it, each run
+in a fresh interpreter started from an empty working directory (optionally
+seeded with a history of a given size):
+
+- imports:       Interpreter start → `import main` finished
+- first_window:  Interpreter start → MainWindow shown and first paint processed
+- ready:         Interpreter start → the window reports ready (heavy modules
+                 imported and the uniqueness history loaded in the background),
+                 so the workflow buttons are enabled
+
+Also produces an import-time breakdown from `python -X importtime`:
+per-module cumulative cost (the slowest import subtrees) and self time summed
+per top-level package.
+
+check_budget() compares the medians against first-window / ready budgets so
+startup regressions fail the CLI (exit status 1) and the integration test.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+DEFAULT_REPEAT = 5
+DEFAULT_FIRST_WINDOW_BUDGET = 1.0  # seconds
+DEFAULT_READY_BUDGET = 5.0  # seconds
+IMPORT_BREAKDOWN_TOP = 15
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the measured interpreter; prints "<marker> <epoch seconds>" lines
+PROBE_SCRIPT = """
+import sys, time
+import main
+print("imports", time.time(), flush=True)
+
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv)
+window = main.MainWindow()
+window.show()
+app.processEvents()
+print("first_window", time.time(), flush=True)
+
+deadline = time.time() + 60
+while not window.is_ready:
+    if time.time() > deadline:
+        sys.exit("window never became ready")
+    app.processEvents()
+    time.sleep(0.002)
+print("ready", time.time(), flush=True)
+
+window.close()
+"""
+
+
+def _probe_environment() -> Dict[str, str]:
+    """Environment for measured interpreters: repo importable, no display needed"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = REPO_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    return env
+
+
+def _seed_history(workdir: str, history_size: int) -> None:
+    """Write a history of `history_size` numbers where the app will look for it"""
+    from benchmarks.history_scale import write_fixture
+    from src.utils.constants import HISTORY_FILE, HISTORY_ARCHIVE_SUFFIX
+
+    fixture = write_fixture(workdir, 'archive', history_size)
+    os.replace(fixture, os.path.join(workdir, HISTORY_FILE))
+    if os.path.exists(fixture + HISTORY_ARCHIVE_SUFFIX):
+        os.replace(fixture + HISTORY_ARCHIVE_SUFFIX, os.path.join(workdir, HISTORY_FILE + HISTORY_ARCHIVE_SUFFIX))
+
+
+def run_probe(workdir: str, timeout: float = 120) -> Dict[str, float]:
+    """
+    Start the application once in a fresh interpreter and time its milestones
+
+    Args:
+        workdir: Working directory (where the app reads its history)
+        timeout: Seconds before the run is abandoned
+
+    Returns:
+        dict: Seconds from process start to each milestone
+
+    Raises:
+        RuntimeError: If the probe exits with an error or misses a milestone
+    """
+    start = time.time()
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE_SCRIPT],
+        cwd=workdir, env=_probe_environment(), capture_output=True, text=True, timeout=timeout
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup probe failed: {completed.stderr.strip()[-500:]}")
+
+    milestones = {}
+    for line in completed.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] in ('imports', 'first_window', 'ready'):
+            milestones[parts[0]] = float(parts[1]) - start
+
+    missing = {'imports', 'first_window', 'ready'} - set(milestones)
+    if missing:
+        raise RuntimeError(f"Startup probe missed milestones: {', '.join(sorted(missing))}")
+    return milestones
+
+
+def import_breakdown(workdir: str, top: int = IMPORT_BREAKDOWN_TOP) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Profile `import main` with -X importtime
+
+    Args:
+        workdir: Working directory for the profiled interpreter
+        top: Rows to keep per table
+
+    Returns:
+        dict: 'cumulative' - slowest modules by cumulative import time (µs),
+              'packages'   - self time summed per top-level package (µs)
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=workdir, env=_probe_environment(), capture_output=True, text=True, timeout=120
+    )
+
+    modules = []
+    packages: Dict[str, int] = defaultdict(int)
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        module = name.strip()
+        modules.append({'module': module, 'self_us': int(self_us), 'cumulative_us': int(cumulative_us), 'depth': depth})
+        packages[module.split('.')[0]] += int(self_us)
+
+    modules.sort(key=lambda row: row['cumulative_us'], reverse=True)
+    ranked_packages = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        'cumulative': modules[:top],
+        'packages': [{'package': name, 'self_us': us} for name, us in ranked_packages[:top]],
+    }
+
+
+def measure_startup(repeat: int = DEFAULT_REPEAT, history_size: int = 0) -> Dict[str, Any]:
+    """
+    Measure cold start over several fresh interpreters
+
+    Args:
+        repeat: Timed application starts
+        history_size: Numbers in the seeded history (0 for a first-run install)
+
+    Returns:
+        dict: {'results': {"startup_<milestone>": {"<history_size>": summary}},
+               'imports': import_breakdown()}
+    """
+    from benchmarks.harness import summarize
+
+    workdir = tempfile.mkdtemp(prefix="gasongjang_startup_")
+    try:
+        if history_size:
+            _seed_history(workdir, history_size)
+
+        runs: Dict[str, List[float]] = defaultdict(list)
+        for _ in range(repeat):
+            for milestone, seconds in run_probe(workdir).items():
+                runs[milestone].append(seconds)
+
+        breakdown = import_breakdown(workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {
+        f"startup_{milestone}": {str(history_size): summarize(values, 1)}
+        for milestone, values in runs.items()
+    }
+    return {'results': results, 'imports': breakdown}
+
+
+def check_budget(
+    results: Dict[str, Dict[str, Dict[str, Any]]],
+    first_window_budget: float = DEFAULT_FIRST_WINDOW_BUDGET,
+    ready_budget: Optional[float] = DEFAULT_READY_BUDGET
+) -> List[str]:
+    """
+    Compare median startup milestones against budgets
+
+    Args:
+        results: 'results' part of measure_startup()
+        first_window_budget: Maximum seconds to first window
+        ready_budget: Maximum seconds to ready-to-generate (None to skip)
+
+    Returns:
+        List[str]: One message per exceeded budget (empty if within budget)
+    """
+    budgets = {'startup_first_window': first_window_budget, 'startup_ready': ready_budget}
+    violations = []
+    for stage, budget in budgets.items():
+        if budget is None:
+            continue
+        for size, summary in results.get(stage, {}).items():
+            if summary['median'] > budget:
+                violations.append(
+                    f"{stage} (history {int(size):,}): median {summary['median']:.2f}s exceeds budget {budget:.2f}s"
+                )
+    return violations
+
+
+def print_startup_report(report: Dict[str, Any]) -> None:
+    """Print milestone medians and the import-time breakdown"""
+    print(f"  {'milestone':<24}{'history':>12}{'median (s)':>12}{'p95 (s)':>10}{'max (s)':>10}")
+    print("  " + "-" * 68)
+    for stage, sizes in report['results'].items():
+        for size, summary in sizes.items():
+            print(
+                f"  {stage:<24}{int(size):>12,}{summary['median']:>12.3f}"
+                f"{summary['p95']:>10.3f}{summary['max']:>10.3f}"
+            )
+
+    print()
+    print("  Slowest imports (cumulative)")
+    for row in report['imports']['cumulative']:
+        print(f"    {row['cumulative_us'] / 1000:>9.1f} ms  {row['module']}")
+
+    print()
+    print("  Import self time by package")
+    for row in report['imports']['packages']:
+        print(f"    {row['self_us'] / 1000:>9.1f} ms  {row['package']}")
@@ -10,6 +10,7 @@ Author: ChangHee Lee
 Version: 1.0.0
 """
 
+import multiprocessing
 import sys
 from PyQt5.QtWidgets import QApplication
 
@@ -53,4 +54,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Ingestion worker processes in the frozen build
     sys.exit(main())
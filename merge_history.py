@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+History Merge Tool for 가송장 생성기
+
+Combines number history files from several PCs into one compacted store and
+reports numbers that were issued on more than one machine.
+
+Usage:
+    python merge_history.py -o merged_history.gsjh pc1.json pc2.json pc3.gsjh
+    python merge_history.py -o merged_history.gsjh --duplicates dupes.csv pc*.json
+
+Inputs may be legacy JSON history files (number_history.json, export_history
+output) or compact stores written by this tool. The merged store can be used
+directly as a history file.
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.core.history_store import merge_stores, HistoryStoreError
+
+
+def main() -> int:
+    """Run history merge"""
+    parser = argparse.ArgumentParser(description="Merge tracking number history files")
+    parser.add_argument("sources", nargs="+", help="History files to merge")
+    parser.add_argument("-o", "--output", required=True, help="Merged compact store path")
+    parser.add_argument("--duplicates", help="Write cross-machine duplicates to this CSV file")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    try:
+        report = merge_stores(args.sources, args.output)
+    except (HistoryStoreError, OSError) as e:
+        print(f"❌ Merge failed: {e}")
+        return 1
+    elapsed = time.perf_counter() - start_time
+
+    print("=" * 70)
+    print("🔀 HISTORY MERGE")
+    print("=" * 70)
+    print(f"  Sources:        {len(report['sources'])}")
+    print(f"  Day partitions: {report['days']:,}")
+    print(f"  Input numbers:  {report['input_numbers']:,}")
+    print(f"  Merged numbers: {report['numbers']:,}")
+    print(f"  Duplicates:     {len(report['duplicates']):,}")
+    print(f"  Time:           {elapsed:.2f}s")
+    print(f"  Output:         {args.output}")
+
+    for duplicate in report['duplicates'][:20]:
+        print(f"  ⚠️  {duplicate['number']}: {', '.join(duplicate['sources'])}")
+    if len(report['duplicates']) > 20:
+        print(f"  ... {len(report['duplicates']) - 20} more")
+
+    if args.duplicates:
+        with open(args.duplicates, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['송장번호', 'sources'])
+            for duplicate in report['duplicates']:
+                writer.writerow([duplicate['number'], ';'.join(duplicate['sources'])])
+        print(f"💾 Duplicates saved to: {args.duplicates}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
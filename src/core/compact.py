@@ -0,0 +1,244 @@
+"""
+Compact Sequences
+
+This module provides memory-compact, read-only sequences for per-session
+data that must stay around between Upload, Generate and Download:
+
+- CompactStrings: order codes stored UTF-8 encoded in one contiguous buffer
+  plus an offsets array (~1 byte per ASCII character + 8 bytes per item,
+  instead of a ~50-byte str object and an 8-byte list slot per code)
+- CompactStrings(spill=True) / spill(): the same, with the buffer in a
+  temporary file that is memory-mapped for reading, so only the offsets stay
+  in memory (used for very large uploads)
+- CompactNumbers: tracking numbers stored as 64-bit integers (8 bytes each
+  instead of a ~63-byte str)
+
+Both behave like a read-only list of str (len, indexing, iteration), so the
+preview model and the exporter use them without converting back. Both
+pickle as their raw arrays, so they cross process boundaries cheaply.
+"""
+
+import mmap
+import os
+import tempfile
+from array import array
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from src.utils.constants import TRACKING_NUMBER_LENGTH
+
+
+class CompactStrings(Sequence[str]):
+    """
+    Read-only sequence of strings in one UTF-8 buffer (in memory or spilled to disk).
+    """
+
+    __slots__ = ('_buffer', '_offsets', '_spill_file')
+
+    def __init__(self, values: Iterable[str] = (), spill: bool = False, spill_dir: Optional[str] = None):
+        """
+        Build from strings (consumed once, e.g. a list or a generator of chunks)
+
+        Args:
+            values: Strings in order
+            spill: Keep the buffer in a temporary file instead of memory
+            spill_dir: Directory for the temporary file (default: system temp)
+        """
+        self._buffer: Union[bytearray, mmap.mmap] = bytearray()
+        self._offsets = array('Q', [0])
+        self._spill_file = None
+        if spill:
+            self.spill(spill_dir)
+        self.extend(values)
+
+    @classmethod
+    def from_buffer(
+        cls,
+        data: bytes,
+        offsets: Iterable[int],
+        spill: bool = False,
+        spill_dir: Optional[str] = None
+    ) -> "CompactStrings":
+        """
+        Build from an already encoded buffer
+
+        Args:
+            data: UTF-8 bytes of all strings, back to back
+            offsets: Start of each string plus the end of the last (first entry 0)
+            spill: Keep the buffer in a temporary file instead of memory
+            spill_dir: Directory for the temporary file (default: system temp)
+
+        Returns:
+            CompactStrings: Sequence over the buffer
+        """
+        strings = cls()
+        strings._offsets = offsets if isinstance(offsets, array) and offsets.typecode == 'Q' else array('Q', offsets)
+        if strings._offsets[-1] != len(data):
+            raise ValueError(f"Offsets end at {strings._offsets[-1]}, buffer has {len(data)} bytes")
+        strings._buffer = bytearray(data)
+        if spill:
+            strings.spill(spill_dir)
+        return strings
+
+    def extend(self, values: Iterable[str]) -> None:
+        """
+        Append strings
+
+        Args:
+            values: Strings in order
+        """
+        encoded = [value.encode('utf-8') for value in values]
+        ends = accumulate(map(len, encoded), initial=self._offsets[-1])
+        next(ends)  # The start offset is already the last entry
+        self._offsets.extend(ends)
+
+        data = b''.join(encoded)
+        if self._spill_file is None:
+            self._buffer += data
+        elif data:
+            self._spill_file.seek(0, os.SEEK_END)
+            self._spill_file.write(data)
+            self._remap()
+
+    def spill(self, spill_dir: Optional[str] = None) -> None:
+        """
+        Move the buffer to a temporary file (no-op if already spilled)
+
+        Args:
+            spill_dir: Directory for the temporary file (default: system temp)
+        """
+        if self._spill_file is not None:
+            return
+        self._spill_file = tempfile.TemporaryFile(prefix="codes_", dir=spill_dir)
+        self._spill_file.write(self._buffer)
+        self._buffer = bytearray()
+        self._remap()
+
+    def _remap(self) -> None:
+        """Map the spill file's current contents for reading"""
+        self._spill_file.flush()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._offsets[-1]:  # A zero-length file can't be mapped
+            self._buffer = mmap.mmap(self._spill_file.fileno(), self._offsets[-1], access=mmap.ACCESS_READ)
+
+    @property
+    def is_spilled(self) -> bool:
+        """True if the buffer lives in a temporary file"""
+        return self._spill_file is not None
+
+    @property
+    def data(self) -> bytes:
+        """Copy of the encoded buffer (see offsets for where each string starts)"""
+        return bytes(self._buffer[:self._offsets[-1]])
+
+    @property
+    def offsets(self) -> array:
+        """Start of each string plus the end of the last"""
+        return self._offsets
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in memory (the buffer unless spilled, plus the offsets)"""
+        buffer_bytes = 0 if self.is_spilled else len(self._buffer)
+        return buffer_bytes + self._offsets.itemsize * len(self._offsets)
+
+    def __reduce__(self):
+        # Pickled as the buffer and offsets (two byte strings, e.g. between
+        # worker processes); a spilled sequence arrives in memory
+        return CompactStrings.from_buffer, (self.data, self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactStrings index out of range")
+        return self._buffer[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        buffer, offsets = self._buffer, self._offsets
+        for i in range(len(offsets) - 1):
+            yield buffer[offsets[i]:offsets[i + 1]].decode('utf-8')
+
+
+class CompactNumbers(Sequence[str]):
+    """
+    Read-only sequence of tracking numbers stored as integers.
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, numbers: Iterable[str] = ()):
+        """
+        Build from tracking-number strings
+
+        Args:
+            numbers: 14-digit tracking numbers
+
+        Raises:
+            ValueError: If a number isn't a 14-digit string
+        """
+        self._values = array('q')
+        self.extend(numbers)
+
+    def extend(self, numbers: Iterable[str]) -> None:
+        """
+        Append tracking numbers
+
+        Args:
+            numbers: 14-digit tracking numbers
+
+        Raises:
+            ValueError: If a number isn't a 14-digit string
+        """
+        numbers = list(numbers)
+        if any(len(number) != TRACKING_NUMBER_LENGTH or not number.isdigit() for number in numbers):
+            raise ValueError(f"Tracking numbers must be {TRACKING_NUMBER_LENGTH}-digit strings")
+        self._values.extend(map(int, numbers))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the integer array"""
+        return self._values.itemsize * len(self._values)
+
+    def chunks(self, size: int) -> Iterator[List[str]]:
+        """
+        Yield the numbers as lists of strings, `size` at a time
+
+        Args:
+            size: Numbers per chunk
+
+        Yields:
+            List[str]: Tracking numbers
+        """
+        for start in range(0, len(self._values), size):
+            yield [f"{value:0{TRACKING_NUMBER_LENGTH}d}" for value in self._values[start:start + size]]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [f"{value:0{TRACKING_NUMBER_LENGTH}d}" for value in self._values[index]]
+        return f"{self._values[index]:0{TRACKING_NUMBER_LENGTH}d}"
+
+    def __iter__(self) -> Iterator[str]:
+        for value in self._values:
+            yield f"{value:0{TRACKING_NUMBER_LENGTH}d}"
@@ -0,0 +1,558 @@
+"""
+History Store
+
+Compact, day-partitioned storage for used tracking numbers, plus a streaming
+merge that reconciles history files collected from several machines.
+
+Every number is stored as its keyspace index inside its day (see keyspace.py),
+so a day is just a sorted array of uint32 values and a year of history costs
+a few bytes per number instead of a Python str in a set.
+
+Compact store format (little-endian):
+- Header: b"GSJH" + format version byte
+- Day records, in ascending day order:
+  - 8 bytes: YYYYMMDD day key (ASCII)
+  - uint32: count of numbers in the day
+  - uint32: payload length in bytes
+  - payload: zlib-compressed array of sorted uint32 keyspace indices
+
+Legacy stores (JSON array of strings, as written by UniquenessChecker and
+export_history) are accepted wherever a store path is expected.
+
+Merging:
+- Legacy sources are first converted to temporary compact stores one at a time
+- Day records of all sources are then streamed in day order (heap merge), so
+  memory is bounded by a single day across all sources
+- Numbers present in more than one source are reported as cross-machine
+  duplicates (issued twice)
+
+Archiving:
+- HistoryArchive keeps frozen past days in a compact store and serves
+  lookups/audits by decompressing single days on demand
+"""
+
+import heapq
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+from src.utils.constants import DAILY_KEYSPACE_SIZE, ARCHIVE_CACHE_DAYS
+from src.utils.logger import get_logger
+from src.core.keyspace import split_number, compose_number
+
+logger = get_logger(__name__)
+
+STORE_MAGIC = b"GSJH"
+STORE_VERSION = 1
+_DAY_HEADER = struct.Struct("<8sII")
+
+
+class HistoryStoreError(Exception):
+    """Custom exception for history store errors"""
+    pass
+
+
+def _to_le_bytes(indices: array) -> bytes:
+    """Serialize a uint32 array as little-endian bytes"""
+    if sys.byteorder != 'little':
+        indices = array('I', indices)
+        indices.byteswap()
+    return indices.tobytes()
+
+
+def _from_le_bytes(data: bytes) -> array:
+    """Deserialize little-endian bytes into a uint32 array"""
+    indices = array('I')
+    indices.frombytes(data)
+    if sys.byteorder != 'little':
+        indices.byteswap()
+    return indices
+
+
+def is_compact_store(path: str) -> bool:
+    """
+    Check whether a file is a compact history store
+
+    Args:
+        path: Path to history file
+
+    Returns:
+        bool: True if the file starts with the compact store header
+    """
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(STORE_MAGIC)) == STORE_MAGIC
+    except OSError:
+        return False
+
+
+def group_by_day(numbers: Iterable[str]) -> Tuple[Dict[str, array], List[str]]:
+    """
+    Group tracking numbers into sorted per-day index arrays
+
+    Args:
+        numbers: Tracking number strings
+
+    Returns:
+        tuple[dict, list]: ({day: sorted uint32 indices}, malformed numbers)
+    """
+    days: Dict[str, Set[int]] = {}
+    invalid: List[str] = []
+
+    for number in numbers:
+        try:
+            day, index = split_number(number)
+        except (TypeError, ValueError):
+            invalid.append(number)
+            continue
+        if len(number) != 14 or not day.isdigit() or not 0 <= index < DAILY_KEYSPACE_SIZE:
+            invalid.append(number)
+            continue
+        days.setdefault(day, set()).add(index)
+
+    return {day: array('I', sorted(indices)) for day, indices in days.items()}, invalid
+
+
+def iter_store_days(path: str) -> Iterator[Tuple[str, array]]:
+    """
+    Stream (day, sorted indices) records from a history store
+
+    Compact stores are read one day at a time. Legacy JSON stores are loaded
+    whole and grouped, since JSON arrays can't be streamed by day.
+
+    Args:
+        path: Path to compact or legacy JSON history file
+
+    Yields:
+        tuple[str, array]: Day key and its sorted uint32 keyspace indices
+
+    Raises:
+        HistoryStoreError: If the file is corrupt or unreadable
+    """
+    if not is_compact_store(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                numbers = json.load(f)
+        except (json.JSONDecodeError, IOError, UnicodeDecodeError) as e:
+            raise HistoryStoreError(f"Failed to read history file {path}: {e}")
+
+        days, invalid = group_by_day(numbers)
+        if invalid:
+            logger.warning(f"Skipped {len(invalid)} malformed numbers in {path}")
+        for day in sorted(days):
+            yield day, days[day]
+        return
+
+    with open(path, 'rb') as f:
+        header = f.read(len(STORE_MAGIC) + 1)
+        if len(header) != len(STORE_MAGIC) + 1 or header[-1] != STORE_VERSION:
+            raise HistoryStoreError(f"Unsupported history store version in {path}")
+
+        while True:
+            record = f.read(_DAY_HEADER.size)
+            if not record:
+                break
+            if len(record) != _DAY_HEADER.size:
+                raise HistoryStoreError(f"Truncated day header in {path}")
+
+            raw_day, count, length = _DAY_HEADER.unpack(record)
+            payload = f.read(length)
+            if len(payload) != length:
+                raise HistoryStoreError(f"Truncated day record in {path}")
+
+            try:
+                indices = _from_le_bytes(zlib.decompress(payload))
+            except zlib.error as e:
+                raise HistoryStoreError(f"Corrupt day record in {path}: {e}")
+            if len(indices) != count:
+                raise HistoryStoreError(f"Day record count mismatch in {path}")
+
+            yield raw_day.decode('ascii'), indices
+
+
+def write_store(path: str, days: Iterable[Tuple[str, Sequence[int]]]) -> int:
+    """
+    Write a compact history store atomically
+
+    Args:
+        path: Destination path
+        days: (day, sorted unique indices) records in ascending day order
+
+    Returns:
+        int: Total numbers written
+
+    Raises:
+        HistoryStoreError: If days are out of order or the file can't be written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix=".history_", suffix=".tmp", dir=directory)
+    total = 0
+    previous_day = ""
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(STORE_MAGIC + bytes([STORE_VERSION]))
+            for day, indices in days:
+                if day <= previous_day:
+                    raise HistoryStoreError(f"Days must be written in ascending order: {day}")
+                previous_day = day
+
+                if not isinstance(indices, array) or indices.typecode != 'I':
+                    indices = array('I', indices)
+                payload = zlib.compress(_to_le_bytes(indices), 6)
+                f.write(_DAY_HEADER.pack(day.encode('ascii'), len(indices), len(payload)))
+                f.write(payload)
+                total += len(indices)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    logger.debug(f"Wrote {total} numbers to compact store {path}")
+    return total
+
+
+def load_store_numbers(path: str) -> Set[str]:
+    """
+    Load every number of a compact store as tracking number strings
+
+    Args:
+        path: Path to compact history store
+
+    Returns:
+        Set[str]: Tracking numbers
+    """
+    numbers: Set[str] = set()
+    for day, indices in iter_store_days(path):
+        numbers.update(compose_number(day, index) for index in indices)
+    return numbers
+
+
+def _merge_day(day: str, records: List[Tuple[int, array]]) -> Tuple[array, Dict[int, List[int]]]:
+    """
+    Merge one day's index arrays from several sources
+
+    Args:
+        day: Day key (for logging)
+        records: (source position, sorted indices) pairs
+
+    Returns:
+        tuple[array, dict]: (merged sorted indices, {duplicate index: source positions})
+    """
+    if len(records) == 1:
+        return records[0][1], {}
+
+    merged: Set[int] = set()
+    duplicated: Set[int] = set()
+    for _, indices in records:
+        duplicated.update(merged.intersection(indices))
+        merged.update(indices)
+
+    owners: Dict[int, List[int]] = {}
+    if duplicated:
+        for source, indices in records:
+            for index in duplicated.intersection(indices):
+                owners.setdefault(index, []).append(source)
+        logger.warning(f"{day}: {len(duplicated)} numbers issued on more than one machine")
+
+    return array('I', sorted(merged)), owners
+
+
+def merge_stores(sources: Sequence[str], output_path: str) -> Dict[str, Any]:
+    """
+    Merge N history stores into a single compacted store
+
+    Args:
+        sources: Paths to compact or legacy JSON history files
+        output_path: Path of the merged compact store
+
+    Returns:
+        dict: Merge report with keys
+            - sources: Input paths
+            - days: Number of day partitions written
+            - input_numbers: Numbers read across all sources
+            - numbers: Unique numbers written
+            - duplicates: [{'number', 'sources'}] issued on several machines
+
+    Raises:
+        HistoryStoreError: If a source is unreadable or the output can't be written
+
+    Example:
+        >>> report = merge_stores(["pc1.json", "pc2.json"], "merged.gsjh")
+        >>> report['numbers'] <= report['input_numbers']
+        True
+    """
+    if not sources:
+        raise HistoryStoreError("No history files to merge")
+
+    temp_dir = tempfile.mkdtemp(prefix="history_merge_")
+    stats = {'input_numbers': 0, 'days': 0}
+    duplicates: List[Dict[str, Any]] = []
+
+    try:
+        # Convert legacy JSON sources one at a time so only one is ever fully in memory
+        compact_sources = []
+        for position, source in enumerate(sources):
+            if is_compact_store(source):
+                compact_sources.append(source)
+            else:
+                converted = os.path.join(temp_dir, f"source_{position}.gsjh")
+                write_store(converted, iter_store_days(source))
+                compact_sources.append(converted)
+
+        def tagged(position: int, path: str) -> Iterator[Tuple[str, int, array]]:
+            for day, indices in iter_store_days(path):
+                yield day, position, indices
+
+        streams = [tagged(position, path) for position, path in enumerate(compact_sources)]
+
+        def merged_days() -> Iterator[Tuple[str, array]]:
+            records = heapq.merge(*streams, key=lambda record: (record[0], record[1]))
+            for day, group in groupby(records, key=lambda record: record[0]):
+                day_records = [(position, indices) for _, position, indices in group]
+                stats['input_numbers'] += sum(len(indices) for _, indices in day_records)
+                stats['days'] += 1
+
+                indices, owners = _merge_day(day, day_records)
+                for index in sorted(owners):
+                    duplicates.append({
+                        'number': compose_number(day, index),
+                        'sources': [sources[position] for position in owners[index]],
+                    })
+                yield day, indices
+
+        total = write_store(output_path, merged_days())
+
+    finally:
+        for name in os.listdir(temp_dir):
+            os.remove(os.path.join(temp_dir, name))
+        os.rmdir(temp_dir)
+
+    report = {
+        'sources': list(sources),
+        'days': stats['days'],
+        'input_numbers': stats['input_numbers'],
+        'numbers': total,
+        'duplicates': duplicates,
+    }
+    logger.info(
+        f"Merged {len(sources)} history files: {total} numbers over {stats['days']} days, "
+        f"{len(duplicates)} cross-machine duplicates"
+    )
+    return report
+
+
+class HistoryArchive:
+    """
+    Read-mostly archive of frozen (past) days in compact store format.
+
+    Only the day index (offsets and counts) is kept in memory; day payloads
+    are decompressed on demand for lookups and audits and kept in a small
+    LRU cache. Lookups use binary search on the sorted index arrays.
+    Lookups are safe from several threads: one lock covers the file, its
+    index and the cache, so a reader never pairs the new file with the old
+    offsets (or the reverse), and no reader has the file open while freeze()
+    replaces it (which Windows refuses).
+    """
+
+    def __init__(self, path: str, cache_days: int = ARCHIVE_CACHE_DAYS):
+        """
+        Initialize archive
+
+        Args:
+            path: Path to archive file (created on first freeze)
+            cache_days: Number of decompressed days to keep in memory
+
+        Raises:
+            HistoryStoreError: If the archive exists but is corrupt
+        """
+        self.path = path
+        self._cache_days = cache_days
+        self._index: Dict[str, Tuple[int, int, int]] = {}  # day -> (offset, count, length)
+        self._cache: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()  # Guards the file, _index and _cache together
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Scan day headers (skipping payloads) to locate every frozen day (call with _lock held)"""
+        index: Dict[str, Tuple[int, int, int]] = {}
+        if not os.path.exists(self.path):
+            self._index = index
+            self._cache = OrderedDict()
+            return
+        if not is_compact_store(self.path):
+            raise HistoryStoreError(f"Not a compact history store: {self.path}")
+
+        with open(self.path, 'rb') as f:
+            header = f.read(len(STORE_MAGIC) + 1)
+            if header[-1] != STORE_VERSION:
+                raise HistoryStoreError(f"Unsupported history store version in {self.path}")
+            while True:
+                record = f.read(_DAY_HEADER.size)
+                if not record:
+                    break
+                if len(record) != _DAY_HEADER.size:
+                    raise HistoryStoreError(f"Truncated day header in {self.path}")
+                raw_day, count, length = _DAY_HEADER.unpack(record)
+                index[raw_day.decode('ascii')] = (f.tell(), count, length)
+                f.seek(length, os.SEEK_CUR)
+
+        # Swap in complete structures so lock-free counts never see a partial index
+        self._index = index
+        self._cache = OrderedDict()
+        logger.debug(f"Indexed {len(self._index)} archived days in {self.path}")
+
+    def days(self) -> List[str]:
+        """Get archived day keys in ascending order"""
+        return sorted(self._index)
+
+    def count(self) -> int:
+        """Get total count of archived numbers"""
+        return sum(count for _, count, _ in self._index.values())
+
+    def day_count(self, day: str) -> int:
+        """Get count of archived numbers for one day"""
+        entry = self._index.get(day)
+        return entry[1] if entry else 0
+
+    def has_day(self, day: str) -> bool:
+        """Check whether a day has been frozen into the archive"""
+        return day in self._index
+
+    def get_day(self, day: str) -> array:
+        """
+        Get the sorted keyspace indices of an archived day
+
+        Args:
+            day: YYYYMMDD day key
+
+        Returns:
+            array: Sorted uint32 indices (empty if the day isn't archived)
+        """
+        with self._lock:
+            cache = self._cache
+            indices = cache.get(day)
+            if indices is not None:
+                cache.move_to_end(day)
+                return indices
+
+            indices = self._read_day(day)
+            if not len(indices):
+                return indices
+
+            cache[day] = indices
+            if len(cache) > self._cache_days:
+                cache.popitem(last=False)
+            return indices
+
+    def _read_day(self, day: str) -> array:
+        """Decompress one day from the file (call with _lock held)"""
+        entry = self._index.get(day)
+        if entry is None:
+            return array('I')
+
+        offset, count, length = entry
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            indices = _from_le_bytes(zlib.decompress(f.read(length)))
+        if len(indices) != count:
+            raise HistoryStoreError(f"Day record count mismatch in {self.path}")
+        return indices
+
+    def contains(self, number: str) -> bool:
+        """
+        Check whether a number is in the archive
+
+        Args:
+            number: 14-digit tracking number
+
+        Returns:
+            bool: True if the number was frozen into the archive
+        """
+        try:
+            day, index = split_number(number)
+        except ValueError:
+            return False
+        if day not in self._index:
+            return False
+
+        indices = self.get_day(day)
+        position = bisect_left(indices, index)
+        return position < len(indices) and indices[position] == index
+
+    def iter_day_numbers(self, day: str) -> Iterator[str]:
+        """
+        Iterate archived numbers of one day (for audits)
+
+        Args:
+            day: YYYYMMDD day key
+
+        Yields:
+            str: Tracking numbers in ascending keyspace order
+        """
+        for index in self.get_day(day):
+            yield compose_number(day, index)
+
+    def iter_numbers(self) -> Iterator[str]:
+        """Iterate every archived number, day by day"""
+        # Read each day under the lock (bypassing the cache) rather than holding
+        # the file open for the whole iteration, so a freeze can replace it
+        for day in self.days():
+            with self._lock:
+                indices = self._read_day(day)
+            for index in indices:
+                yield compose_number(day, index)
+
+    def freeze(self, days: Dict[str, array]) -> int:
+        """
+        Merge frozen days into the archive
+
+        Args:
+            days: {day: sorted indices} to add (merged with already-archived days)
+
+        Returns:
+            int: Total numbers in the archive after the freeze
+        """
+        if not days:
+            return self.count()
+
+        new_records = ((day, days[day]) for day in sorted(days))
+        existing = iter_store_days(self.path) if self._index else iter(())
+
+        def merged() -> Iterator[Tuple[str, array]]:
+            records = heapq.merge(existing, new_records, key=lambda record: record[0])
+            for day, group in groupby(records, key=lambda record: record[0]):
+                arrays = [indices for _, indices in group]
+                if len(arrays) == 1:
+                    yield day, arrays[0]
+                else:
+                    yield day, array('I', sorted(set().union(*arrays)))
+
+        # Lookups wait for the swap: they'd otherwise read the new file at the
+        # old index's offsets. The merge has read (and closed) the old file by
+        # the time write_store replaces it.
+        with self._lock:
+            total = write_store(self.path, merged())
+            self._build_index()
+        logger.info(f"Archived {len(days)} days; archive now holds {total} numbers")
+        return total
+
+    def clear(self) -> None:
+        """Delete the archive file"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._build_index()
@@ -0,0 +1,191 @@
+"""
+History Writer
+
+This module persists the uniqueness history from a dedicated background thread
+so that registering numbers never waits on a full history dump.
+
+Behavior:
+- Callers mark the history dirty; each mark bumps a version counter
+- The writer thread coalesces marks and saves once the debounce interval has
+  passed since the first unsaved change
+- flush() forces an immediate save and blocks until every change made before
+  the call is durable (used before exporting files that reference new numbers)
+- close() flushes and stops the thread (called from MainWindow.closeEvent and
+  at interpreter exit)
+
+Durability ordering:
+- A save started for version V writes a snapshot taken after V was marked,
+  so once flush() returns True every number registered before it is on disk
+"""
+
+import atexit
+import threading
+import time
+from typing import Callable, Optional
+
+from src.utils.constants import HISTORY_SAVE_DEBOUNCE_SECONDS
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HistoryWriter:
+    """
+    Debounced background writer that calls a save function off the caller's thread.
+    """
+
+    def __init__(
+        self,
+        save_func: Callable[[], bool],
+        debounce_seconds: float = HISTORY_SAVE_DEBOUNCE_SECONDS
+    ):
+        """
+        Initialize writer and start its thread
+
+        Args:
+            save_func: Function that snapshots and writes the history, returning success
+            debounce_seconds: Delay after the first unsaved change before writing
+        """
+        self._save_func = save_func
+        self._debounce_seconds = debounce_seconds
+
+        self._condition = threading.Condition()
+        self._dirty_version = 0
+        self._durable_version = 0
+        self._dirty_since: Optional[float] = None
+        self._flush_requested = False
+        self._stopping = False
+        self._attempts = 0
+        self._last_save_ok = True
+
+        self._thread = threading.Thread(target=self._run, name="HistoryWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self._close_at_exit)
+
+        logger.info(f"Started background history writer (debounce: {debounce_seconds}s)")
+
+    def mark_dirty(self) -> int:
+        """
+        Record that the history changed and schedule a save
+
+        Returns:
+            int: Version that becomes durable once saved
+        """
+        with self._condition:
+            self._dirty_version += 1
+            if self._dirty_since is None:
+                self._dirty_since = time.monotonic()
+            self._condition.notify_all()
+            return self._dirty_version
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if there are changes not yet written to disk"""
+        with self._condition:
+            return self._durable_version < self._dirty_version
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Save now and wait until all changes made so far are durable
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if every change up to this call is on disk
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            target = self._dirty_version
+            if self._durable_version >= target:
+                return True
+            if not self._thread.is_alive():
+                logger.error("History writer is not running; changes are not durable")
+                return False
+
+            self._flush_requested = True
+            attempts_before = self._attempts
+            self._condition.notify_all()
+
+            while self._durable_version < target:
+                # A save attempted after our request failed: report instead of spinning
+                if self._attempts > attempts_before and not self._last_save_ok:
+                    return False
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    logger.warning("Timed out waiting for history flush")
+                    return False
+                self._condition.wait(remaining)
+
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush pending changes and stop the writer thread
+
+        Args:
+            timeout: Maximum seconds to wait for the final save
+
+        Returns:
+            bool: True if all changes were saved
+        """
+        if not self._thread.is_alive():
+            return not self.is_dirty
+
+        saved = self.flush(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self._close_at_exit)
+
+        logger.info("Stopped background history writer")
+        return saved
+
+    def _close_at_exit(self) -> None:
+        """Interpreter-exit hook: save anything the application didn't flush"""
+        if self.is_dirty:
+            logger.warning("Flushing unsaved history changes at exit")
+            self.close()
+
+    def _run(self) -> None:
+        """Writer thread main loop"""
+        while True:
+            with self._condition:
+                while not self._stopping and self._durable_version >= self._dirty_version:
+                    self._condition.wait()
+                if self._durable_version >= self._dirty_version:
+                    return
+
+                # Debounce: coalesce changes unless a flush or shutdown is pending
+                while not (self._flush_requested or self._stopping):
+                    remaining = self._dirty_since + self._debounce_seconds - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                target = self._dirty_version
+                self._flush_requested = False
+                self._dirty_since = None
+
+            try:
+                saved = self._save_func()
+            except Exception as e:
+                logger.error(f"Background history save failed: {e}", exc_info=True)
+                saved = False
+
+            with self._condition:
+                self._attempts += 1
+                self._last_save_ok = saved
+                if saved:
+                    self._durable_version = max(self._durable_version, target)
+                elif self._dirty_since is None:
+                    # Retry after another debounce interval
+                    self._dirty_since = time.monotonic()
+                self._condition.notify_all()
+
+            if not saved and self._stopping:
+                logger.error("Giving up on unsaved history changes at shutdown")
+                return
@@ -0,0 +1,294 @@
+"""
+Keyspace Partitioning
+
+This module describes the daily tracking number keyspace and splits it between
+installations so that several sites can generate numbers without coordinating.
+
+Keyspace:
+- Each day owns 900 x 900 = 810,000 numbers (random1, random2 in 100-999)
+- Within its day a number is identified by
+  index = (random1 - 100) * 900 + (random2 - 100), in [0, 810000)
+
+Sharding:
+- Every installation is configured with a node ID and the total node count
+- A keyed, per-day Feistel permutation shuffles the 810,000 indices
+- Node K owns every permuted position p with p % node_count == K
+- Shards are disjoint and together cover the whole day, so sites never collide
+- All sites must share the same node count and shard key
+
+Configuration (environment variables, read by get_keyspace_partition()):
+- GASONGJANG_NODE_ID: This installation's shard (0-based, default 0)
+- GASONGJANG_NODE_COUNT: Total number of sites (default 1 = no sharding)
+- GASONGJANG_SHARD_KEY: Shared secret for the permutation
+"""
+
+import hashlib
+import os
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.utils.constants import (
+    RANDOM_SEGMENT_MIN,
+    RANDOM_SEGMENT_SPAN,
+    DAILY_KEYSPACE_SIZE,
+    DEFAULT_NODE_ID,
+    DEFAULT_NODE_COUNT,
+    DEFAULT_SHARD_KEY,
+    SHARD_FEISTEL_ROUNDS,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def day_key(value: Union[date, datetime]) -> str:
+    """
+    Build the YYYYMMDD partition key for a date
+
+    Args:
+        value: Date or datetime
+
+    Returns:
+        str: Day key, e.g. "20251104"
+    """
+    return f"{value.year}{value.month:02d}{value.day:02d}"
+
+
+def number_day(number: str) -> str:
+    """
+    Extract the YYYYMMDD day key from a tracking number
+
+    Args:
+        number: 14-digit tracking number (YYYY + RRR + MM + RRR + DD)
+
+    Returns:
+        str: Day key, e.g. "20251104"
+    """
+    return number[:4] + number[7:9] + number[12:14]
+
+
+def number_index(number: str) -> int:
+    """
+    Get the position of a tracking number inside its day's keyspace
+
+    Args:
+        number: 14-digit tracking number
+
+    Returns:
+        int: Index in [0, 810000) for well-formed numbers
+    """
+    random1 = int(number[4:7]) - RANDOM_SEGMENT_MIN
+    random2 = int(number[9:12]) - RANDOM_SEGMENT_MIN
+    return random1 * RANDOM_SEGMENT_SPAN + random2
+
+
+def split_number(number: str) -> Tuple[str, int]:
+    """
+    Split a tracking number into (day key, index)
+
+    Args:
+        number: 14-digit tracking number
+
+    Returns:
+        tuple[str, int]: (day key, index within the day)
+    """
+    return number_day(number), number_index(number)
+
+
+def compose_number(day: str, index: int) -> str:
+    """
+    Build a tracking number from a day key and keyspace index
+
+    Args:
+        day: YYYYMMDD day key
+        index: Index in [0, 810000)
+
+    Returns:
+        str: 14-digit tracking number
+    """
+    random1, random2 = divmod(index, RANDOM_SEGMENT_SPAN)
+    return (
+        f"{day[:4]}{random1 + RANDOM_SEGMENT_MIN:03d}"
+        f"{day[4:6]}{random2 + RANDOM_SEGMENT_MIN:03d}{day[6:8]}"
+    )
+
+
+class KeyspacePartition:
+    """
+    Deterministic, keyed partition of the daily keyspace between sites.
+
+    The permutation is a balanced Feistel network over the (random1, random2)
+    grid, so it is a bijection on [0, 810000) without cycle walking. Round
+    functions are lookup tables derived from BLAKE2b(key, day, round) and
+    cached per day, which keeps the per-number cost to a few list lookups.
+    """
+
+    def __init__(
+        self,
+        node_id: int = DEFAULT_NODE_ID,
+        node_count: int = DEFAULT_NODE_COUNT,
+        key: str = DEFAULT_SHARD_KEY
+    ):
+        """
+        Initialize partition
+
+        Args:
+            node_id: This installation's shard (0 <= node_id < node_count)
+            node_count: Total number of sites sharing the keyspace
+            key: Shared secret used to derive the per-day permutation
+
+        Raises:
+            ValueError: If the node configuration is invalid
+        """
+        if node_count < 1 or node_count > DAILY_KEYSPACE_SIZE:
+            raise ValueError(f"node_count must be between 1 and {DAILY_KEYSPACE_SIZE}, got {node_count}")
+        if not 0 <= node_id < node_count:
+            raise ValueError(f"node_id must be in [0, {node_count}), got {node_id}")
+
+        self.node_id = node_id
+        self.node_count = node_count
+        self._key = hashlib.blake2b(key.encode('utf-8'), digest_size=32).digest()
+        self._round_tables: Dict[str, List[List[int]]] = {}
+
+        # Positions p = node_id, node_id + node_count, ... below the keyspace size
+        self.capacity = (DAILY_KEYSPACE_SIZE - node_id + node_count - 1) // node_count
+
+        if self.is_sharded:
+            logger.info(
+                f"Keyspace shard {node_id}/{node_count}: {self.capacity} numbers per day"
+            )
+
+    @classmethod
+    def from_environment(cls) -> "KeyspacePartition":
+        """
+        Build partition from GASONGJANG_* environment variables
+
+        Returns:
+            KeyspacePartition: Configured partition (unsharded if unset)
+
+        Raises:
+            ValueError: If the environment holds an invalid configuration
+        """
+        try:
+            node_id = int(os.environ.get("GASONGJANG_NODE_ID", DEFAULT_NODE_ID))
+            node_count = int(os.environ.get("GASONGJANG_NODE_COUNT", DEFAULT_NODE_COUNT))
+        except ValueError as e:
+            raise ValueError(f"Invalid shard configuration in environment: {e}")
+
+        key = os.environ.get("GASONGJANG_SHARD_KEY", DEFAULT_SHARD_KEY)
+        return cls(node_id=node_id, node_count=node_count, key=key)
+
+    @property
+    def is_sharded(self) -> bool:
+        """True if the keyspace is split between more than one site"""
+        return self.node_count > 1
+
+    def _tables_for(self, day: str) -> List[List[int]]:
+        """
+        Get (and cache) the Feistel round tables for a day
+
+        Args:
+            day: YYYYMMDD day key
+
+        Returns:
+            list: One 900-entry lookup table per round
+        """
+        tables = self._round_tables.get(day)
+        if tables is None:
+            tables = []
+            for round_no in range(SHARD_FEISTEL_ROUNDS):
+                seed = f"{day}:{round_no}".encode('ascii')
+                table = []
+                for value in range(RANDOM_SEGMENT_SPAN):
+                    digest = hashlib.blake2b(
+                        seed + value.to_bytes(2, 'big'), key=self._key, digest_size=4
+                    ).digest()
+                    table.append(int.from_bytes(digest, 'big') % RANDOM_SEGMENT_SPAN)
+                tables.append(table)
+            self._round_tables[day] = tables
+        return tables
+
+    def _permute(self, day: str, position: int) -> int:
+        """Map a permuted position to a keyspace index"""
+        left, right = divmod(position, RANDOM_SEGMENT_SPAN)
+        for table in self._tables_for(day):
+            left, right = right, (left + table[right]) % RANDOM_SEGMENT_SPAN
+        return left * RANDOM_SEGMENT_SPAN + right
+
+    def _unpermute(self, day: str, index: int) -> int:
+        """Map a keyspace index back to its permuted position"""
+        left, right = divmod(index, RANDOM_SEGMENT_SPAN)
+        for table in reversed(self._tables_for(day)):
+            left, right = (right - table[left]) % RANDOM_SEGMENT_SPAN, left
+        return left * RANDOM_SEGMENT_SPAN + right
+
+    def position_to_index(self, day: str, position: int) -> int:
+        """
+        Map a position inside this shard to a keyspace index
+
+        Args:
+            day: YYYYMMDD day key
+            position: Shard-local position in [0, capacity)
+
+        Returns:
+            int: Keyspace index in [0, 810000) owned by this shard
+        """
+        if not self.is_sharded:
+            return position
+        return self._permute(day, position * self.node_count + self.node_id)
+
+    def owner_of_index(self, day: str, index: int) -> int:
+        """
+        Get the node ID that owns a keyspace index on a given day
+
+        Args:
+            day: YYYYMMDD day key
+            index: Keyspace index in [0, 810000)
+
+        Returns:
+            int: Owning node ID
+        """
+        if not self.is_sharded:
+            return 0
+        return self._unpermute(day, index) % self.node_count
+
+    def owns(self, number: str) -> bool:
+        """
+        Check whether a tracking number belongs to this shard
+
+        Args:
+            number: 14-digit tracking number
+
+        Returns:
+            bool: True if this installation may issue the number
+        """
+        if not self.is_sharded:
+            return True
+
+        day, index = split_number(number)
+        if not 0 <= index < DAILY_KEYSPACE_SIZE:
+            return False
+        return self.owner_of_index(day, index) == self.node_id
+
+    def describe(self) -> str:
+        """Human-readable shard description for logs and reports"""
+        if not self.is_sharded:
+            return "unsharded"
+        return f"shard {self.node_id}/{self.node_count}"
+
+
+# Singleton instance for application-wide use
+_partition_instance: Optional[KeyspacePartition] = None
+
+
+def get_keyspace_partition() -> KeyspacePartition:
+    """
+    Get singleton KeyspacePartition configured from the environment
+
+    Returns:
+        KeyspacePartition: Global partition instance
+    """
+    global _partition_instance
+    if _partition_instance is None:
+        _partition_instance = KeyspacePartition.from_environment()
+    return _partition_instance
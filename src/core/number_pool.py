@@ -0,0 +1,339 @@
+"""
+Number Pool
+
+This module keeps a per-day pool of pre-generated tracking numbers so that
+on-demand requests (single orders, small batches from packing stations) are
+served without drawing random numbers or touching the history.
+
+Behavior:
+- Pool numbers are registered in the uniqueness history (and flushed) before
+  they enter the pool, so no other job can ever issue them
+- take() hands out numbers from the front of the pool; requests larger than
+  the pool are topped up with normal generation
+- Refills and on-demand top-ups draw from separate generators (random
+  sources aren't thread-safe), so the refiller never shares a buffer with
+  the threads calling take()
+- A background refiller tops the pool up to NUMBER_POOL_TARGET_SIZE whenever
+  it falls below NUMBER_POOL_LOW_WATER_MARK
+- At midnight the pool rolls over: yesterday's unserved numbers are dropped
+  and the pool is refilled for the new day
+
+Persistence (number_pool.json):
+- {"day": "YYYYMMDD", "numbers": [...], "lease": n}
+- numbers[:lease] may already have been handed out. take() extends the lease
+  in blocks of NUMBER_POOL_LEASE_BLOCK and writes it before serving, so a
+  restart resumes after the lease: served numbers are never reissued and at
+  most one block of unserved numbers is skipped
+
+Usage:
+- Library API for on-demand callers: build a NumberPool with the shared
+  checker, start() it, serve through take() (or
+  TrackingNumberGenerator(pool=...).issue()) and close() it on shutdown.
+  The desktop app doesn't use it; its batches are generated per file
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from src.core.keyspace import day_key, number_day
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from src.utils.constants import (
+    NUMBER_POOL_FILE,
+    NUMBER_POOL_TARGET_SIZE,
+    NUMBER_POOL_LOW_WATER_MARK,
+    NUMBER_POOL_LEASE_BLOCK,
+    NUMBER_POOL_RETRY_SECONDS,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _seconds_until_midnight() -> float:
+    """Seconds until the next day starts (local time)"""
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max((midnight - now).total_seconds(), 0.0)
+
+
+class NumberPool:
+    """
+    Persistent per-day pool of registered, not yet issued tracking numbers.
+    """
+
+    def __init__(
+        self,
+        checker: UniquenessChecker,
+        generator: Optional[TrackingNumberGenerator] = None,
+        pool_file: Optional[str] = None,
+        target_size: int = NUMBER_POOL_TARGET_SIZE,
+        low_water_mark: int = NUMBER_POOL_LOW_WATER_MARK,
+        lease_block: int = NUMBER_POOL_LEASE_BLOCK
+    ):
+        """
+        Initialize pool and load unserved numbers from the pool file
+
+        Args:
+            checker: Uniqueness checker the pool registers its numbers in
+            generator: Generator used for refills (default: new generator); on-demand
+                       top-ups use a second one on the same keyspace shard
+            pool_file: Path to pool file (default: number_pool.json from constants)
+            target_size: Numbers a refill tops the pool up to
+            low_water_mark: Refill when fewer numbers than this remain
+            lease_block: Numbers leased per pool-file write when serving
+
+        Raises:
+            ValueError: If low_water_mark exceeds target_size
+        """
+        if low_water_mark > target_size:
+            raise ValueError(f"Low-water mark {low_water_mark} exceeds target size {target_size}")
+
+        self.checker = checker
+        self.generator = generator or TrackingNumberGenerator()
+        # Own random source for take()'s top-ups; the refiller uses self.generator
+        self._demand_generator = TrackingNumberGenerator(partition=self.generator.partition)
+        self._demand_lock = threading.Lock()
+        self.pool_file = pool_file or NUMBER_POOL_FILE
+        self.target_size = target_size
+        self.low_water_mark = low_water_mark
+        self.lease_block = lease_block
+
+        self._condition = threading.Condition()
+        self._refill_lock = threading.Lock()  # One refill at a time
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self._day = day_key(datetime.now())
+        self._numbers: List[str] = []
+        self._cursor = 0  # Next number to serve
+        self._lease = 0  # numbers[:lease] may have been served (persisted)
+        self._load_pool()
+
+    @property
+    def size(self) -> int:
+        """Numbers available to serve for today"""
+        with self._condition:
+            self._roll_over()
+            return len(self._numbers) - self._cursor
+
+    def _load_pool(self) -> None:
+        """Load today's unserved numbers, skipping everything that may have been served"""
+        if not os.path.exists(self.pool_file):
+            logger.info(f"No number pool found at {self.pool_file}, starting empty")
+            return
+
+        try:
+            with open(self.pool_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            day, numbers, lease = state['day'], state['numbers'], int(state['lease'])
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError) as e:
+            logger.error(f"Failed to load number pool: {e}. Starting empty.")
+            return
+
+        if day != self._day:
+            logger.info(f"Discarded number pool from {day} ({max(len(numbers) - lease, 0)} unserved)")
+            return
+
+        self._numbers = [number for number in numbers[lease:] if number_day(number) == day]
+        logger.info(f"Loaded {len(self._numbers)} pooled numbers for {day}")
+
+    def _write_pool(self) -> bool:
+        """
+        Write the pool state atomically (call with the condition held)
+
+        Returns:
+            bool: True if the pool file was written
+        """
+        state = {'day': self._day, 'numbers': self._numbers, 'lease': self._lease}
+
+        temp_path = None
+        try:
+            pool_path = Path(self.pool_file)
+            pool_path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, temp_path = tempfile.mkstemp(prefix=".pool_", suffix=".tmp", dir=str(pool_path.parent))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.pool_file)
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save number pool: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    def _roll_over(self) -> bool:
+        """
+        Drop the pool if the day changed (call with the condition held)
+
+        Returns:
+            bool: True if the pool was rolled over
+        """
+        today = day_key(datetime.now())
+        if today == self._day:
+            return False
+
+        logger.info(f"Number pool rolled over to {today}; dropped {len(self._numbers) - self._cursor} unserved")
+        self._day = today
+        self._numbers = []
+        self._cursor = 0
+        self._lease = 0
+        self._write_pool()
+        self._condition.notify_all()
+        return True
+
+    def take(self, count: int = 1) -> List[str]:
+        """
+        Issue numbers from the pool
+
+        Served numbers are already registered; requests beyond what the pool
+        holds are generated and registered on the spot.
+
+        Args:
+            count: Numbers to issue
+
+        Returns:
+            List[str]: Issued tracking numbers
+
+        Raises:
+            ValueError: If count is negative or zero
+            RuntimeError: If the pool is empty and generation fails
+
+        Example:
+            >>> pool = NumberPool(get_uniqueness_checker())
+            >>> pool.refill()
+            2000
+            >>> len(pool.take(3))
+            3
+        """
+        if count <= 0:
+            raise ValueError(f"Count must be positive, got {count}")
+
+        with self._condition:
+            self._roll_over()
+            served_from_pool = min(count, len(self._numbers) - self._cursor)
+            end = self._cursor + served_from_pool
+
+            if end > self._lease:
+                # Persist the lease before serving so a restart can't reissue these numbers
+                previous_lease = self._lease
+                self._lease = min(len(self._numbers), end + self.lease_block)
+                if not self._write_pool():
+                    self._lease = previous_lease
+                    served_from_pool = 0
+                    end = self._cursor
+
+            numbers = self._numbers[self._cursor:end]
+            self._cursor = end
+
+            if len(self._numbers) - self._cursor < self.low_water_mark:
+                self._condition.notify_all()
+
+        shortfall = count - len(numbers)
+        if shortfall:
+            logger.info(f"Number pool short by {shortfall}; generating on demand")
+            with self._demand_lock:
+                numbers.extend(self._demand_generator.generate_and_register(shortfall, self.checker))
+
+        return numbers
+
+    def refill(self) -> int:
+        """
+        Top the pool up to the target size (runs on the caller's thread)
+
+        Returns:
+            int: Numbers added to the pool
+
+        Raises:
+            RuntimeError: If today's remaining capacity or retries run out
+        """
+        with self._refill_lock:
+            with self._condition:
+                self._roll_over()
+                day = self._day
+                needed = self.target_size - (len(self._numbers) - self._cursor)
+            if needed <= 0:
+                return 0
+
+            # Register first so the numbers are taken before anyone can be handed them
+            numbers = self.generator.generate_and_register(needed, self.checker)
+            if not self.checker.flush():
+                logger.error("History flush failed; pooled numbers are not durable yet")
+
+            with self._condition:
+                self._roll_over()
+                fresh = [number for number in numbers if number_day(number) == self._day]
+                if self._day != day:
+                    logger.info("Day changed during refill; keeping only numbers for the new day")
+
+                # Compact served numbers away before appending
+                self._lease = max(self._lease - self._cursor, 0)
+                self._numbers = self._numbers[self._cursor:] + fresh
+                self._cursor = 0
+                self._write_pool()
+                self._condition.notify_all()
+
+        logger.info(f"Refilled number pool with {len(fresh)} numbers")
+        return len(fresh)
+
+    def start(self) -> "NumberPool":
+        """
+        Start the background refiller
+
+        Returns:
+            NumberPool: self, for chaining
+        """
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="NumberPoolRefiller", daemon=True)
+            self._thread.start()
+
+        logger.info(
+            f"Started number pool refiller (target: {self.target_size}, low-water mark: {self.low_water_mark})"
+        )
+        return self
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background refiller (unserved numbers stay in the pool file)
+
+        Args:
+            timeout: Maximum seconds to wait for a running refill
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        logger.info("Stopped number pool refiller")
+
+    def _run(self) -> None:
+        """Refiller thread main loop"""
+        while True:
+            with self._condition:
+                while not self._stopping and not self._roll_over():
+                    if len(self._numbers) - self._cursor < self.low_water_mark:
+                        break
+                    # Wake at midnight even if nobody takes numbers
+                    self._condition.wait(_seconds_until_midnight() + 1)
+                if self._stopping:
+                    return
+
+            try:
+                self.refill()
+            except Exception as e:
+                logger.error(f"Number pool refill failed: {e}", exc_info=True)
+                with self._condition:
+                    if not self._stopping:
+                        self._condition.wait(NUMBER_POOL_RETRY_SECONDS)
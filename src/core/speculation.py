@@ -0,0 +1,165 @@
+"""
+Speculative Generation
+
+This module pre-generates a file's tracking numbers in the background as soon
+as the file is loaded, so pressing 🔄 hands them over immediately.
+
+Behavior:
+- start() reserves `count` numbers chunk by chunk on a daemon thread; the
+  reservation is held in UniquenessChecker memory only (nothing is saved)
+- The ship date is pinned when the batch is created; commit() stops the
+  reservation (waiting only for the chunk in flight, at most
+  GENERATION_CLAIM_CHUNK_SIZE numbers), registers what was reserved, and
+  generates the rest normally with progress reported, so pressing 🔄 before
+  a large reservation finishes doesn't wait for all of it. If the date
+  changed since, the whole reservation is released and the batch is
+  generated for today
+- cancel() stops the thread and releases every reserved number, so choosing
+  a different file never burns keyspace
+"""
+
+import threading
+from datetime import date
+from typing import Callable, List, Optional
+
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from src.utils.constants import GENERATION_CLAIM_CHUNK_SIZE
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SpeculativeBatch:
+    """
+    Background reservation of a batch's numbers, committed or released later.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        checker: UniquenessChecker,
+        generator: Optional[TrackingNumberGenerator] = None
+    ):
+        """
+        Initialize speculative batch (call start() to begin reserving)
+
+        Args:
+            count: Numbers the batch will need
+            checker: Shared uniqueness checker holding the reservation
+            generator: Generator to draw numbers with (default: new generator)
+        """
+        self.count = count
+        self.checker = checker
+        self.generator = generator or TrackingNumberGenerator()
+        self.ship_date = date.today()
+
+        self._reserved: List[str] = []
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._stopping = threading.Event()  # Set by commit(): keep what's reserved, reserve no more
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def reserved_count(self) -> int:
+        """Numbers reserved so far"""
+        with self._lock:
+            return len(self._reserved)
+
+    def start(self) -> "SpeculativeBatch":
+        """
+        Start reserving numbers on a background thread
+
+        Returns:
+            SpeculativeBatch: self, for chaining
+        """
+        self._thread = threading.Thread(target=self._run, name="SpeculativeBatch", daemon=True)
+        self._thread.start()
+        logger.info(f"Started speculative generation of {self.count} numbers")
+        return self
+
+    def _run(self) -> None:
+        """Reserve the batch in chunks until done, cancelled or out of numbers"""
+        try:
+            while not self._cancelled.is_set() and not self._stopping.is_set():
+                with self._lock:
+                    needed = min(self.count - len(self._reserved), GENERATION_CLAIM_CHUNK_SIZE)
+                if needed <= 0:
+                    break
+
+                chunk = self.generator.generate_and_reserve(needed, self.checker, ship_date=self.ship_date)
+                with self._lock:
+                    if self._cancelled.is_set():
+                        # cancel() already released what it saw; give this chunk back too
+                        self.checker.release(chunk)
+                        break
+                    self._reserved.extend(chunk)
+        except (RuntimeError, ValueError) as e:
+            # Not fatal (includes the ship date passing at midnight): commit()
+            # generates whatever the reservation is missing
+            logger.warning(f"Speculative generation stopped early: {e}")
+
+    def commit(self, callback: Optional[Callable[[int, int], None]] = None) -> List[str]:
+        """
+        Register the reserved numbers and generate any shortfall
+
+        A reservation still running is stopped after its current chunk; the
+        numbers it didn't reach are generated here, with progress reported.
+
+        Args:
+            callback: Function(current, total) called as numbers are registered
+
+        Returns:
+            List[str]: `count` registered numbers
+
+        Raises:
+            RuntimeError: If the batch was cancelled, or the shortfall can't be generated
+        """
+        if self._cancelled.is_set():
+            raise RuntimeError("Speculative batch was cancelled")
+        self._stopping.set()
+        if self._thread is not None:
+            # At most the chunk in flight; the rest is generated below (the
+            # generator's random source isn't shared between threads)
+            self._thread.join()
+
+        with self._lock:
+            reserved, self._reserved = self._reserved, []
+
+        if self.ship_date != date.today():
+            # Numbers reserved before midnight carry yesterday's date
+            self.checker.release(reserved)
+            logger.info(f"Released {len(reserved)} speculative numbers reserved before the date changed")
+            reserved = []
+
+        numbers = self.checker.commit_reservation(reserved)
+        if callback:
+            callback(len(numbers), self.count)
+
+        shortfall = self.count - len(numbers)
+        if shortfall > 0:
+            logger.info(f"Speculative batch short by {shortfall}; generating the rest")
+            committed = len(numbers)
+            numbers.extend(self.generator.generate_and_register(
+                shortfall,
+                self.checker,
+                callback=(lambda current, total: callback(committed + current, self.count)) if callback else None
+            ))
+
+        logger.info(f"Committed speculative batch: {len(numbers)} numbers")
+        return numbers
+
+    def cancel(self) -> int:
+        """
+        Stop reserving and give every reserved number back
+
+        Returns:
+            int: Count of numbers released
+        """
+        self._cancelled.set()
+        with self._lock:
+            reserved, self._reserved = self._reserved, []
+        released = self.checker.release(reserved) if reserved else 0
+
+        logger.info(f"Cancelled speculative batch, released {released} numbers")
+        return released
@@ -12,21 +12,126 @@ Format: YYYY + RRR + MM + RRR + DD
 - DD: Current day (2 digits, 01-31)
 
 Example: 20253291170804 = 2025 + 329 + 11 + 708 + 04
+
+Randomness:
+- Random segments come from a pluggable RandomSource; the default draws
+  bulk blocks from os.urandom (see random_source), and a seeded source
+  makes runs reproducible in tests and benchmarks
+
+Generation sessions:
+- A GenerationSession pins the ship date once per batch and precomputes the
+  date fragments, so a batch running across midnight never mixes two dates
+  and the hot loop only formats the random segments
+- Ship dates may be up to MAX_SHIP_DAYS_AHEAD days in the future, so numbers
+  for tomorrow's dispatch can be issued during today's quiet hours
+
+Multi-site sharding:
+- When a KeyspacePartition with several nodes is configured, random1/random2
+  are drawn only from this installation's shard of the day's keyspace
 """
 
-import secrets
-from datetime import datetime
-from typing import List, Set, Optional, Callable
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Set, Optional, Callable, TYPE_CHECKING
 
 from src.utils.constants import (
     TRACKING_NUMBER_LENGTH,
     MAX_RETRY_ATTEMPTS,
+    GENERATION_CLAIM_CHUNK_SIZE,
+    RANDOM_SEGMENT_MIN,
+    RANDOM_SEGMENT_SPAN,
+    DAILY_KEYSPACE_SIZE,
+    MAX_SHIP_DAYS_AHEAD,
 )
 from src.utils.validators import validate_tracking_number
+from src.core.keyspace import KeyspacePartition, get_keyspace_partition, day_key
+from src.core.random_source import RandomSource, SystemRandomSource
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from src.core.uniqueness_checker import UniquenessChecker
+    from src.core.number_pool import NumberPool
+
 logger = get_logger(__name__)
 
+# "100".."999", indexed by segment offset 0..899
+_SEGMENTS = [f"{value:03d}" for value in range(RANDOM_SEGMENT_MIN, RANDOM_SEGMENT_MIN + RANDOM_SEGMENT_SPAN)]
+
+
+class GenerationSession:
+    """
+    Generates numbers for one pinned ship date.
+
+    The year, month and day fragments are formatted once; each number costs
+    one random draw, one divmod and a string concatenation.
+    """
+
+    def __init__(self, generator: "TrackingNumberGenerator", ship_date: Optional[date] = None):
+        """
+        Initialize session
+
+        Args:
+            generator: Generator providing the random source and keyspace shard
+            ship_date: Date printed in the numbers (default: today)
+
+        Raises:
+            ValueError: If ship_date is in the past or more than MAX_SHIP_DAYS_AHEAD days ahead
+        """
+        today = date.today()
+        ship_date = ship_date or today
+        if isinstance(ship_date, datetime):
+            ship_date = ship_date.date()
+        if ship_date < today:
+            raise ValueError(f"Ship date {ship_date} is in the past")
+        if ship_date > today + timedelta(days=MAX_SHIP_DAYS_AHEAD):
+            raise ValueError(f"Ship date {ship_date} is more than {MAX_SHIP_DAYS_AHEAD} days ahead")
+
+        self.ship_date = ship_date
+        self.day = day_key(ship_date)
+        self._year = self.day[:4]
+        self._month = self.day[4:6]
+        self._dd = self.day[6:8]
+
+        partition = generator.partition
+        self._random_source = generator.random_source
+        self._partition = partition if partition.is_sharded else None
+        self._bound = partition.capacity if partition.is_sharded else DAILY_KEYSPACE_SIZE
+
+        # Fragments are fixed for the session, so one check covers every number it generates
+        sample = self._compose(0)
+        if not validate_tracking_number(sample):
+            logger.error(f"Ship date {ship_date} produces invalid tracking numbers: {sample}")
+            raise ValueError(f"Ship date {ship_date} produces invalid tracking numbers")
+
+    def _compose(self, draw: int) -> str:
+        """Format the number for a random draw (shard position or keyspace index)"""
+        if self._partition is not None:
+            draw = self._partition.position_to_index(self.day, draw)
+        random1, random2 = divmod(draw, RANDOM_SEGMENT_SPAN)
+        # Format: YYYY + RRR + MM + RRR + DD
+        return self._year + _SEGMENTS[random1] + self._month + _SEGMENTS[random2] + self._dd
+
+    def generate(self) -> str:
+        """
+        Generate a single tracking number for the session's ship date
+
+        Returns:
+            str: 14-digit tracking number
+        """
+        return self._compose(self._random_source.randbelow(self._bound))
+
+    def generate_many(self, count: int) -> List[str]:
+        """
+        Generate `count` tracking numbers (may contain duplicates)
+
+        Args:
+            count: Numbers to generate
+
+        Returns:
+            List[str]: Tracking numbers for the session's ship date
+        """
+        compose = self._compose
+        return [compose(draw) for draw in self._random_source.randbelow_many(self._bound, count)]
+
 
 class TrackingNumberGenerator:
     """
@@ -41,23 +146,60 @@ class TrackingNumberGenerator:
     Example: 20253291170804 = 2025 + 329 + 11 + 708 + 04
     """
 
-    def __init__(self):
-        """Initialize generator"""
-        logger.info("Initialized TrackingNumberGenerator with date-based format")
+    def __init__(
+        self,
+        partition: Optional[KeyspacePartition] = None,
+        pool: Optional["NumberPool"] = None,
+        random_source: Optional[RandomSource] = None
+    ):
+        """
+        Initialize generator
+
+        Args:
+            partition: Keyspace shard to draw from (default: configured from environment)
+            pool: Pre-generated number pool that issue() serves from (optional)
+            random_source: Source of random segments (default: buffered os.urandom)
+        """
+        self.partition = partition or get_keyspace_partition()
+        self.pool = pool
+        self.random_source = random_source or SystemRandomSource()
+        self.last_attempts = 0  # Random draws used by the most recent batch (retries = attempts - count)
+        logger.info(
+            f"Initialized TrackingNumberGenerator with date-based format ({self.partition.describe()})"
+        )
+
+    def get_daily_capacity(self) -> int:
+        """
+        Get how many distinct numbers this generator can issue per day
+
+        Returns:
+            int: 810,000 unsharded, or this shard's share of the keyspace
+        """
+        return self.partition.capacity
 
-    @staticmethod
-    def _generate_random_3digits() -> int:
+    def session(self, ship_date: Optional[date] = None) -> GenerationSession:
         """
-        Generate random 3-digit number (100-999)
+        Start a generation session pinned to a ship date
+
+        Args:
+            ship_date: Date printed in the numbers (default: today)
 
         Returns:
-            int: Random 3-digit number
+            GenerationSession: Session generating numbers for that date
+
+        Raises:
+            ValueError: If ship_date is in the past or too far ahead
+
+        Example:
+            >>> session = TrackingNumberGenerator().session(date.today() + timedelta(days=1))
+            >>> session.generate()[-2:] == f"{session.ship_date.day:02d}"
+            True
         """
-        return secrets.randbelow(900) + 100
+        return GenerationSession(self, ship_date)
 
     def generate(self) -> str:
         """
-        Generate a single tracking number
+        Generate a single tracking number for today
 
         Returns:
             str: 14-digit tracking number
@@ -70,33 +212,21 @@ class TrackingNumberGenerator:
             >>> number.isdigit()
             True
         """
-        # Get current date components
-        now = datetime.now()
-        year = now.year
-        month = now.month
-        day = now.day
+        return self.session().generate()
 
-        # Generate two random 3-digit numbers
-        random1 = self._generate_random_3digits()
-        random2 = self._generate_random_3digits()
-
-        # Format: YYYY + RRR + MM + RRR + DD
-        tracking_number = f"{year}{random1:03d}{month:02d}{random2:03d}{day:02d}"
-
-        # Validate before returning
-        if not validate_tracking_number(tracking_number):
-            logger.error(f"Generated invalid tracking number: {tracking_number}")
-            raise ValueError(f"Generated invalid tracking number: {tracking_number}")
-
-        return tracking_number
-
-    def generate_batch(self, count: int, used_numbers: Optional[Set[str]] = None) -> List[str]:
+    def generate_batch(
+        self,
+        count: int,
+        used_numbers: Optional[Set[str]] = None,
+        ship_date: Optional[date] = None
+    ) -> List[str]:
         """
         Generate a batch of unique tracking numbers
 
         Args:
             count: Number of tracking numbers to generate
             used_numbers: Set of already-used numbers to avoid (optional)
+            ship_date: Date printed in the numbers (default: today)
 
         Returns:
             List[str]: List of unique tracking numbers
@@ -115,13 +245,14 @@ class TrackingNumberGenerator:
             raise ValueError(f"Count must be positive, got {count}")
 
         # Delegate to generate_with_progress without callback (DRY principle)
-        return self.generate_with_progress(count, used_numbers, callback=None)
+        return self.generate_with_progress(count, used_numbers, callback=None, ship_date=ship_date)
 
     def generate_with_progress(
         self,
         count: int,
         used_numbers: Optional[Set[str]] = None,
-        callback: Optional[Callable[[int, int], None]] = None
+        callback: Optional[Callable[[int, int], None]] = None,
+        ship_date: Optional[date] = None
     ) -> List[str]:
         """
         Generate batch with progress callback for UI updates
@@ -130,31 +261,46 @@ class TrackingNumberGenerator:
             count: Number of tracking numbers to generate
             used_numbers: Set of already-used numbers to avoid
             callback: Function(current, total) called on progress updates
+            ship_date: Date printed in the numbers (default: today, pinned for the whole batch)
 
         Returns:
             List[str]: List of unique tracking numbers
+
+        Raises:
+            RuntimeError: If count exceeds the daily capacity or retries run out
         """
+        self.last_attempts = 0
         if used_numbers is None:
             used_numbers = set()
 
+        capacity = self.get_daily_capacity()
+        if count > capacity:
+            error_msg = f"Requested {count} numbers but daily capacity is {capacity} ({self.partition.describe()})"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        session = self.session(ship_date)
         generated = []
+        seen: Set[str] = set()  # O(1) duplicate check within the batch
         attempts = 0
         max_total_attempts = count * MAX_RETRY_ATTEMPTS
 
-        logger.info(f"Starting batch generation with progress: count={count}")
+        logger.info(f"Starting batch generation with progress: count={count}, ship date {session.day}")
 
         while len(generated) < count and attempts < max_total_attempts:
-            number = self.generate()
+            draws = session.generate_many(min(count - len(generated), max_total_attempts - attempts))
+            attempts += len(draws)
 
-            if number not in generated and number not in used_numbers:
-                generated.append(number)
+            for number in draws:
+                if number not in seen and number not in used_numbers:
+                    seen.add(number)
+                    generated.append(number)
 
-                # Call progress callback
-                if callback:
-                    callback(len(generated), count)
-
-            attempts += 1
+                    # Call progress callback
+                    if callback:
+                        callback(len(generated), count)
 
+        self.last_attempts = attempts
         if len(generated) < count:
             error_msg = f"Failed to generate {count} unique numbers. Only generated {len(generated)}."
             logger.error(error_msg)
@@ -163,6 +309,255 @@ class TrackingNumberGenerator:
         logger.info(f"Batch generation complete: {len(generated)} numbers")
         return generated
 
+    def generate_and_register(
+        self,
+        count: int,
+        checker: "UniquenessChecker",
+        callback: Optional[Callable[[int, int], None]] = None,
+        ship_date: Optional[date] = None,
+        session: Optional[GenerationSession] = None
+    ) -> List[str]:
+        """
+        Generate numbers and claim them in the shared history, chunk by chunk
+
+        Candidates are generated against a lock-free snapshot of today's
+        history and then claimed atomically, so several jobs can run in
+        parallel against the same checker without ever receiving the same number.
+
+        Args:
+            count: Number of tracking numbers to generate
+            checker: Shared uniqueness checker to claim numbers in
+            callback: Function(current, total) called after each claimed chunk
+            ship_date: Date printed in the numbers (default: today, pinned for the whole batch)
+            session: Session opened earlier to generate with instead of ship_date;
+                     a run split over several calls keeps its date past midnight
+
+        Returns:
+            List[str]: Registered unique tracking numbers
+
+        Raises:
+            ValueError: If count is negative or zero
+            RuntimeError: If remaining capacity or retries run out
+        """
+        return self._generate_and_acquire(
+            count, checker, checker.claim_batch, callback, [], "registered", ship_date, session
+        )
+
+    def issue(self, count: int = 1, checker: Optional["UniquenessChecker"] = None) -> List[str]:
+        """
+        Issue registered numbers for on-demand requests
+
+        With a pool configured, numbers come straight from it (no random draws
+        or history access on the request path); otherwise they are generated
+        and registered in the checker.
+
+        Args:
+            count: Numbers to issue
+            checker: Uniqueness checker to register in (required without a pool)
+
+        Returns:
+            List[str]: Registered tracking numbers
+
+        Raises:
+            ValueError: If count is not positive, or neither pool nor checker is given
+            RuntimeError: If numbers can't be generated
+        """
+        if self.pool is not None:
+            return self.pool.take(count)
+        if checker is None:
+            raise ValueError("A uniqueness checker is required when no number pool is configured")
+        return self.generate_and_register(count, checker)
+
+    def generate_and_reserve(
+        self,
+        count: int,
+        checker: "UniquenessChecker",
+        callback: Optional[Callable[[int, int], None]] = None,
+        ship_date: Optional[date] = None
+    ) -> List[str]:
+        """
+        Generate numbers and reserve them in the shared history without registering
+
+        Used for speculative generation: the numbers are withheld from other
+        jobs until checker.commit_reservation() registers them or
+        checker.release() gives them back.
+
+        Args:
+            count: Number of tracking numbers to generate
+            checker: Shared uniqueness checker to reserve numbers in
+            callback: Function(current, total) called after each reserved chunk
+            ship_date: Date printed in the numbers (default: today, pinned for the whole batch)
+
+        Returns:
+            List[str]: Reserved unique tracking numbers
+
+        Raises:
+            ValueError: If count is negative or zero
+            RuntimeError: If remaining capacity or retries run out (nothing stays reserved)
+        """
+        reserved: List[str] = []
+        try:
+            return self._generate_and_acquire(
+                count, checker, checker.reserve, callback, reserved, "reserved", ship_date
+            )
+        except RuntimeError:
+            checker.release(reserved)
+            raise
+
+    def iter_generate_and_register(
+        self,
+        count: int,
+        checker: "UniquenessChecker",
+        chunk_size: int = GENERATION_CLAIM_CHUNK_SIZE,
+        ship_date: Optional[date] = None
+    ) -> Iterator[List[str]]:
+        """
+        Generate numbers and yield each block as soon as it is registered
+
+        Lets a consumer (e.g. ExcelExportHandler.create_output_streaming) write
+        output while generation continues, with memory bounded by the block
+        size. Nothing runs until the first block is requested.
+
+        Args:
+            count: Total number of tracking numbers to generate
+            checker: Shared uniqueness checker to claim numbers in
+            chunk_size: Maximum numbers per yielded block
+            ship_date: Date printed in the numbers (default: today, pinned for the whole run)
+
+        Yields:
+            List[str]: Registered numbers, at most chunk_size per block
+
+        Raises:
+            ValueError: If count is negative or zero
+            RuntimeError: If remaining capacity or retries run out (after the
+                          blocks registered so far were yielded)
+
+        Example:
+            >>> generator = TrackingNumberGenerator()
+            >>> blocks = generator.iter_generate_and_register(2500, get_uniqueness_checker())
+            >>> [len(block) for block in blocks]
+            [1000, 1000, 500]
+        """
+        return self._iter_acquire(count, checker, checker.claim_batch, "registered", ship_date, chunk_size)
+
+    def _generate_and_acquire(
+        self,
+        count: int,
+        checker: "UniquenessChecker",
+        acquire: Callable[[List[str]], List[str]],
+        callback: Optional[Callable[[int, int], None]],
+        acquired: List[str],
+        verb: str,
+        ship_date: Optional[date] = None,
+        session: Optional[GenerationSession] = None
+    ) -> List[str]:
+        """
+        Acquire `count` numbers into one list
+
+        Args:
+            count: Number of tracking numbers to generate
+            checker: Shared uniqueness checker
+            acquire: checker.claim_batch or checker.reserve
+            callback: Function(current, total) called after each chunk
+            acquired: List that receives acquired numbers as they are acquired
+                      (lets the caller undo a partial run)
+            verb: Past participle for log messages
+            ship_date: Date printed in the numbers (default: today)
+            session: Already opened session to generate with (overrides ship_date)
+
+        Returns:
+            List[str]: The acquired list, filled with `count` numbers
+
+        Raises:
+            ValueError: If count is negative or zero
+            RuntimeError: If remaining capacity or retries run out
+        """
+        for chunk in self._iter_acquire(count, checker, acquire, verb, ship_date, session=session):
+            acquired.extend(chunk)
+            if callback:
+                callback(len(acquired), count)
+        return acquired
+
+    def _iter_acquire(
+        self,
+        count: int,
+        checker: "UniquenessChecker",
+        acquire: Callable[[List[str]], List[str]],
+        verb: str,
+        ship_date: Optional[date] = None,
+        chunk_size: int = GENERATION_CLAIM_CHUNK_SIZE,
+        session: Optional[GenerationSession] = None
+    ) -> Iterator[List[str]]:
+        """
+        Generate candidates against the ship day's history and reservations, acquiring them chunk by chunk
+
+        Args:
+            count: Number of tracking numbers to generate
+            checker: Shared uniqueness checker
+            acquire: checker.claim_batch or checker.reserve
+            verb: Past participle for log messages
+            ship_date: Date printed in the numbers (default: today)
+            chunk_size: Maximum candidates acquired (and yielded) per round
+            session: Already opened session to generate with (overrides ship_date)
+
+        Yields:
+            List[str]: Non-empty blocks of acquired numbers
+
+        Raises:
+            ValueError: If count or chunk_size is not positive
+            RuntimeError: If remaining capacity or retries run out
+        """
+        self.last_attempts = 0
+        if count <= 0:
+            raise ValueError(f"Count must be positive, got {count}")
+        if chunk_size <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+        session = session or self.session(ship_date)
+        remaining = checker.get_remaining_capacity(session.day)
+        if count > remaining:
+            error_msg = (
+                f"Requested {count} numbers but only {remaining} remain for {session.day} "
+                f"({self.partition.describe()})"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        total = 0
+        attempts = 0
+        max_total_attempts = count * MAX_RETRY_ATTEMPTS
+
+        logger.info(f"Starting batch generation ({verb}): count={count}, ship date {session.day}")
+
+        while total < count and attempts < max_total_attempts:
+            needed = min(count - total, chunk_size)
+            snapshot = checker.snapshot_day(session.day)
+            reserved = checker.reserved_day(session.day)
+            candidates: List[str] = []
+            seen: Set[str] = set()
+
+            while len(candidates) < needed and attempts < max_total_attempts:
+                draws = session.generate_many(min(needed - len(candidates), max_total_attempts - attempts))
+                attempts += len(draws)
+                for number in draws:
+                    if number not in seen and number not in snapshot and number not in reserved:
+                        seen.add(number)
+                        candidates.append(number)
+
+            # Anything another job registered or reserved since the snapshot is rejected here
+            chunk = acquire(candidates)
+            total += len(chunk)
+            self.last_attempts = attempts
+            if chunk:
+                yield chunk
+
+        if total < count:
+            error_msg = f"Failed to generate {count} unique numbers. Only generated {total}."
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        logger.info(f"Batch generation complete: {total} numbers {verb}")
+
 
 # Convenience function for single-use generation
 def generate_tracking_numbers(count: int) -> List[str]:
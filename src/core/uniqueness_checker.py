@@ -10,43 +10,228 @@ Features:
 - Thread-safe file operations with proper error handling
 - Batch operations for efficient bulk checking/registration
 - Singleton pattern for application-wide consistency
+- Shard-aware: only numbers owned by this site's keyspace shard are registered
+- Per-day capacity reporting (used / remaining numbers in this shard)
+- Retention: past days are frozen into a compressed archive, so the hot set
+  and every save are bounded by today's volume
+- Optional background persistence (HistoryWriter): registrations return
+  immediately and saves are debounced; flush() makes them durable
+
+Concurrency:
+- The hot set is partitioned by day into immutable frozensets
+- Registrations take a lock per batch and publish a new frozenset for each
+  touched day (copy-on-write), then swap the day map reference
+- Readers (is_unique, check_batch, snapshot, saves) never lock: they read the
+  current day map once and see a consistent point-in-time view
+- claim_batch() atomically registers and reports which candidates were taken,
+  so several generation jobs can run in parallel without a global run lock
+
+Reservations:
+- reserve() holds numbers for a speculative job without registering them:
+  nothing is saved, and other jobs' claims and reservations skip them
+- commit_reservation() registers held numbers; release() returns them to the
+  keyspace for free (e.g. when the user picks a different file)
+- Reservations live in memory only, so a crash or restart discards them
+
+Retention:
+- Numbers can only be generated for today, so days older than today
+  (minus HISTORY_HOT_RETENTION_DAYS) are moved out of the hot set into a
+  compact archive (number_history.json.archive) on startup and at day rollover
+- Archived days remain visible to is_unique(), counts and export_history()
 
 File Format:
-- JSON array of tracking number strings
+- JSON array of tracking number strings (compact stores from history_store are also loaded)
 - UTF-8 encoding for Korean character support
 - Pretty-printed with 2-space indentation for readability
 """
 
 import json
 import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Set, List, Tuple, Optional
-
-from src.utils.constants import HISTORY_FILE
+from collections.abc import Set as AbstractSet
+from typing import Set, List, Tuple, Optional, Dict, Any, FrozenSet, Iterable, Iterator
+
+from src.utils.constants import (
+    HISTORY_FILE,
+    HISTORY_ARCHIVE_SUFFIX,
+    HISTORY_HOT_RETENTION_DAYS,
+    ARCHIVE_RETRY_SECONDS,
+)
 from src.utils.logger import get_logger
+from src.core.keyspace import KeyspacePartition, get_keyspace_partition, number_day, day_key
+from src.core.history_writer import HistoryWriter
+from src.core.history_store import (
+    HistoryArchive,
+    HistoryStoreError,
+    group_by_day,
+    is_compact_store,
+    load_store_numbers,
+)
 
 logger = get_logger(__name__)
 
 
+class HistorySnapshot(AbstractSet):
+    """
+    Immutable, read-only view of the hot history at one point in time.
+
+    Behaves like a set of tracking numbers (membership, len, iteration,
+    comparison with sets) without copying the per-day partitions.
+    """
+
+    def __init__(self, days: Dict[str, FrozenSet[str]]):
+        """
+        Initialize snapshot
+
+        Args:
+            days: Day map published by UniquenessChecker (never mutated afterwards)
+        """
+        self._days = days
+
+    def __contains__(self, number: object) -> bool:
+        if not isinstance(number, str):
+            return False
+        return number in self._days.get(number_day(number), ())
+
+    def __len__(self) -> int:
+        return sum(len(numbers) for numbers in self._days.values())
+
+    def __iter__(self) -> Iterator[str]:
+        for numbers in self._days.values():
+            yield from numbers
+
+    def day(self, day: str) -> FrozenSet[str]:
+        """Get the frozen set of numbers for one day"""
+        return self._days.get(day, frozenset())
+
+    def days(self) -> List[str]:
+        """Get day keys present in the snapshot"""
+        return sorted(self._days)
+
+
 class UniquenessChecker:
     """
     Maintains history of used tracking numbers and validates uniqueness.
     Uses file-based persistence to ensure uniqueness across application sessions.
     """
 
-    def __init__(self, history_file: Optional[str] = None):
+    def __init__(
+        self,
+        history_file: Optional[str] = None,
+        partition: Optional[KeyspacePartition] = None,
+        archive_file: Optional[str] = None,
+        retention_days: Optional[int] = HISTORY_HOT_RETENTION_DAYS,
+        background_save: bool = False
+    ):
         """
         Initialize uniqueness checker
 
         Args:
             history_file: Path to history file (default: number_history.json from constants)
+            partition: Keyspace shard owned by this site (default: configured from environment)
+            archive_file: Path to archive of frozen days (default: history_file + ".archive")
+            retention_days: Past days kept hot before archiving (None disables archiving)
+            background_save: Persist from a debounced writer thread instead of synchronously
 
         Raises:
             OSError: If unable to access or create history file directory
         """
         self.history_file = history_file or HISTORY_FILE
-        self.used_numbers: Set[str] = self._load_history()
-        logger.info(f"Initialized UniquenessChecker with {len(self.used_numbers)} existing numbers")
+        self.partition = partition or get_keyspace_partition()
+        self._lock = threading.RLock()
+        self._writer: Optional[HistoryWriter] = None
+        self._days: Dict[str, FrozenSet[str]] = self._partition_by_day(self._load_history())
+        self._reserved: Dict[str, FrozenSet[str]] = {}  # Copy-on-write like _days; never persisted
+
+        self.retention_days = retention_days
+        self.archive = self._open_archive(archive_file or self.history_file + HISTORY_ARCHIVE_SUFFIX)
+        self._compacted_day: Optional[str] = None  # Day of the last successful compaction
+        self._compact_failed_at: Optional[float] = None  # time.monotonic() of the last failed freeze
+        if self.retention_days is not None:
+            self.compact_history()
+
+        if background_save:
+            self._writer = HistoryWriter(self._write_history)
+
+        logger.info(
+            f"Initialized UniquenessChecker with {len(self.snapshot())} hot and "
+            f"{self.archive.count()} archived numbers ({self.partition.describe()})"
+        )
+
+    @staticmethod
+    def _partition_by_day(numbers: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+        """Split numbers into immutable per-day partitions"""
+        days: Dict[str, Set[str]] = {}
+        for number in numbers:
+            days.setdefault(number_day(number), set()).add(number)
+        return {day: frozenset(day_numbers) for day, day_numbers in days.items()}
+
+    @property
+    def used_numbers(self) -> HistorySnapshot:
+        """Read-only snapshot of the hot (non-archived) numbers"""
+        return HistorySnapshot(self._days)
+
+    def snapshot(self) -> HistorySnapshot:
+        """
+        Get a consistent, lock-free snapshot of the hot history
+
+        Returns:
+            HistorySnapshot: Set-like view that never changes
+        """
+        return HistorySnapshot(self._days)
+
+    def snapshot_day(self, day: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Get the frozen set of used numbers for one day
+
+        Generators should avoid these numbers and then claim their candidates
+        with claim_batch(), which catches anything registered in the meantime.
+
+        Args:
+            day: YYYYMMDD day key (default: today)
+
+        Returns:
+            FrozenSet[str]: Numbers registered for the day when called
+        """
+        return self._days.get(day or day_key(datetime.now()), frozenset())
+
+    def reserved_day(self, day: Optional[str] = None) -> FrozenSet[str]:
+        """
+        Get the frozen set of numbers currently reserved for one day
+
+        Generators avoid these alongside snapshot_day(); claims of reserved
+        numbers by anyone but the reservation holder are rejected.
+
+        Args:
+            day: YYYYMMDD day key (default: today)
+
+        Returns:
+            FrozenSet[str]: Reserved, uncommitted numbers for the day
+        """
+        return self._reserved.get(day or day_key(datetime.now()), frozenset())
+
+    @staticmethod
+    def _open_archive(archive_file: str) -> HistoryArchive:
+        """
+        Open archive of frozen days, setting aside a corrupt one
+
+        Args:
+            archive_file: Path to archive file
+
+        Returns:
+            HistoryArchive: Opened (possibly empty) archive
+        """
+        try:
+            return HistoryArchive(archive_file)
+        except (HistoryStoreError, IOError) as e:
+            corrupt_path = f"{archive_file}.corrupt"
+            logger.error(f"Failed to open history archive: {e}. Moved to {corrupt_path}.")
+            os.replace(archive_file, corrupt_path)
+            return HistoryArchive(archive_file)
 
     def _load_history(self) -> Set[str]:
         """
@@ -59,6 +244,15 @@ class UniquenessChecker:
             logger.info(f"No history file found at {self.history_file}, starting fresh")
             return set()
 
+        if is_compact_store(self.history_file):
+            try:
+                numbers = load_store_numbers(self.history_file)
+                logger.info(f"Loaded {len(numbers)} numbers from compact history store")
+                return numbers
+            except (HistoryStoreError, IOError) as e:
+                logger.error(f"Failed to load history store: {e}. Starting with empty history.")
+                return set()
+
         try:
             with open(self.history_file, 'r', encoding='utf-8') as f:
                 numbers = json.load(f)
@@ -72,24 +266,307 @@ class UniquenessChecker:
         """
         Persist used numbers to history file
 
+        With background persistence enabled this only schedules a save;
+        call flush() when the numbers must be durable.
+
+        Returns:
+            bool: True if save successful (or scheduled), False otherwise
+        """
+        if self._writer is not None:
+            self._writer.mark_dirty()
+            return True
+        return self._write_history()
+
+    def _write_history(self) -> bool:
+        """
+        Write a snapshot of the hot set to the history file atomically
+
         Returns:
             bool: True if save successful, False otherwise
         """
+        # The day map is copy-on-write, so this reference is a consistent snapshot
+        days = self._days
+        numbers = [number for day_numbers in days.values() for number in day_numbers]
+
+        temp_path = None
         try:
             # Ensure directory exists
             history_path = Path(self.history_file)
             history_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Save as JSON
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.used_numbers), f, indent=2, ensure_ascii=False)
-
-            logger.debug(f"Saved {len(self.used_numbers)} numbers to history file")
+            # Save as JSON to a temp file, then swap it in so a crash never truncates history
+            fd, temp_path = tempfile.mkstemp(
+                prefix=".history_", suffix=".tmp", dir=str(history_path.parent)
+            )
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(numbers, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.history_file)
+
+            logger.debug(f"Saved {len(numbers)} numbers to history file")
             return True
-        except IOError as e:
+        except (IOError, OSError) as e:
             logger.error(f"Failed to save history file: {e}")
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Make every registration so far durable
+
+        Must be called before exporting files that reference newly registered
+        numbers. A no-op when background persistence is disabled.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if the history on disk contains all registered numbers
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self) -> bool:
+        """
+        Flush pending changes and stop background persistence
+
+        Returns:
+            bool: True if all changes were saved
+        """
+        if self._writer is None:
+            return True
+        saved = self._writer.close()
+        self._writer = None
+        return saved
+
+    def _select(
+        self,
+        numbers: Iterable[str],
+        log_rejects: bool,
+        held: FrozenSet[str] = frozenset()
+    ) -> Tuple[Dict[str, Set[str]], List[str]]:
+        """
+        Pick candidates that are unused, unreserved and owned by this shard (call under lock)
+
+        Args:
+            numbers: Candidate numbers
+            log_rejects: Log a warning for every rejected number
+            held: Reserved numbers the caller holds (not treated as taken)
+
+        Returns:
+            tuple: ({day: accepted numbers}, accepted numbers in input order)
+        """
+        owns = self.partition.owns
+        days = self._days
+        reserved = self._reserved
+        additions: Dict[str, Set[str]] = {}
+        accepted: List[str] = []
+
+        for number in numbers:
+            day = number_day(number)
+            pending = additions.get(day)
+            if (
+                number in days.get(day, ())
+                or (pending is not None and number in pending)
+                or self.archive.contains(number)
+            ):
+                if log_rejects:
+                    logger.warning(f"Skipped duplicate in batch: {number}")
+            elif number in reserved.get(day, ()) and number not in held:
+                if log_rejects:
+                    logger.warning(f"Skipped number reserved by another job: {number}")
+            elif not owns(number):
+                if log_rejects:
+                    logger.warning(f"Skipped number outside {self.partition.describe()}: {number}")
+            else:
+                additions.setdefault(day, set()).add(number)
+                accepted.append(number)
+
+        return additions, accepted
+
+    @staticmethod
+    def _with_added(days: Dict[str, FrozenSet[str]], additions: Dict[str, Set[str]]) -> Dict[str, FrozenSet[str]]:
+        """Build a new day map with additions (the input map is left untouched)"""
+        new_days = dict(days)
+        for day, added in additions.items():
+            new_days[day] = days.get(day, frozenset()).union(added)
+        return new_days
+
+    @staticmethod
+    def _with_removed(days: Dict[str, FrozenSet[str]], numbers: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+        """Build a new day map without the given numbers, dropping emptied days"""
+        removals: Dict[str, Set[str]] = {}
+        for number in numbers:
+            removals.setdefault(number_day(number), set()).add(number)
+
+        new_days = dict(days)
+        for day, removed in removals.items():
+            remaining = days.get(day, frozenset()).difference(removed)
+            if remaining:
+                new_days[day] = remaining
+            else:
+                new_days.pop(day, None)
+        return new_days
+
+    def _claim(
+        self,
+        numbers: Iterable[str],
+        log_rejects: bool = True,
+        held: FrozenSet[str] = frozenset()
+    ) -> List[str]:
+        """
+        Atomically register numbers that are unused, unreserved and owned by this shard
+
+        Args:
+            numbers: Candidate numbers
+            log_rejects: Log a warning for every rejected number
+            held: Reserved numbers the caller holds; they are registered and their
+                  reservation is dropped
+
+        Returns:
+            List[str]: Candidates that were registered, in input order
+        """
+        with self._lock:
+            additions, claimed = self._select(numbers, log_rejects, held)
+
+            if additions:
+                # Publish new partitions; readers holding the old map are unaffected
+                self._days = self._with_added(self._days, additions)
+            if held:
+                self._reserved = self._with_removed(self._reserved, held)
+
+        return claimed
+
+    def reserve(self, numbers: List[str]) -> List[str]:
+        """
+        Hold candidates for a speculative job without registering them
+
+        Reserved numbers are skipped by other claims and reservations but are
+        not saved; commit them with commit_reservation() or give them back
+        with release().
+
+        Args:
+            numbers: Candidate tracking numbers
+
+        Returns:
+            List[str]: Candidates now reserved to this caller
+
+        Example:
+            >>> checker = UniquenessChecker()
+            >>> held = checker.reserve(["20251111111111"])
+            >>> checker.claim_batch(held)
+            []
+        """
+        with self._lock:
+            additions, reserved = self._select(numbers, log_rejects=False)
+            if additions:
+                self._reserved = self._with_added(self._reserved, additions)
+
+        logger.debug(f"Reserved {len(reserved)} of {len(numbers)} candidates")
+        return reserved
+
+    def release(self, numbers: Iterable[str]) -> int:
+        """
+        Give reserved numbers back without registering them
+
+        Args:
+            numbers: Numbers previously returned by reserve()
+
+        Returns:
+            int: Count of numbers that were still reserved
+        """
+        with self._lock:
+            before = sum(len(day_numbers) for day_numbers in self._reserved.values())
+            self._reserved = self._with_removed(self._reserved, numbers)
+            released = before - sum(len(day_numbers) for day_numbers in self._reserved.values())
+
+        logger.debug(f"Released {released} reserved numbers")
+        return released
+
+    def commit_reservation(self, numbers: List[str]) -> List[str]:
+        """
+        Register reserved numbers and drop their reservation
+
+        Args:
+            numbers: Numbers previously returned by reserve()
+
+        Returns:
+            List[str]: Numbers now registered, in input order (numbers that
+                       were released or are no longer valid are left out)
+        """
+        self._maybe_compact()
+
+        with self._lock:
+            # Only numbers still held by the reservation are granted
+            held = frozenset(
+                number for number in numbers if number in self._reserved.get(number_day(number), ())
+            )
+            claimed = self._claim((number for number in numbers if number in held), log_rejects=False, held=held)
+        if claimed:
+            self._save_history()
+
+        logger.info(f"Committed {len(claimed)} of {len(numbers)} reserved numbers")
+        return claimed
+
+    def compact_history(self, retention_days: Optional[int] = None) -> int:
+        """
+        Freeze past days from the hot set into the archive
+
+        Args:
+            retention_days: Past days to keep hot (default: the checker's retention)
+
+        Returns:
+            int: Count of numbers moved to the archive (0 if the freeze failed;
+                 it is retried after ARCHIVE_RETRY_SECONDS)
+        """
+        retention = self.retention_days if retention_days is None else retention_days
+        today = day_key(datetime.now())
+        if retention is None:
+            self._compacted_day = today
+            return 0
+
+        cutoff = day_key(datetime.now() - timedelta(days=retention))
+        with self._lock:
+            past_days = [day for day in self._days if day < cutoff]
+            # Malformed numbers can't be stored by index; they simply stay hot
+            frozen = [number for day in past_days for number in self._days[day]]
+            indexed_days, invalid = group_by_day(frozen)
+            if not indexed_days:
+                self._compacted_day = today
+                return 0
+
+            try:
+                self.archive.freeze(indexed_days)
+            except (HistoryStoreError, IOError) as e:
+                # Not marked compacted: the next registration after the back-off retries
+                self._compact_failed_at = time.monotonic()
+                logger.error(f"Failed to archive past days: {e}. Keeping them in the hot set.")
+                return 0
+            self._compacted_day = today
+            self._compact_failed_at = None
+
+            new_days = {day: numbers for day, numbers in self._days.items() if day not in indexed_days}
+            for number in invalid:
+                day = number_day(number)
+                new_days[day] = new_days.get(day, frozenset()).union((number,))
+            self._days = new_days
+        self._save_history()
+
+        moved = len(frozen) - len(invalid)
+        logger.info(f"Archived {moved} numbers from {len(indexed_days)} past days (cutoff {cutoff})")
+        return moved
+
+    def _maybe_compact(self) -> None:
+        """Archive yesterday's numbers after the date rolls over, or retry a failed freeze"""
+        if self.retention_days is None or self._compacted_day == day_key(datetime.now()):
+            return
+        if self._compact_failed_at is not None and time.monotonic() - self._compact_failed_at < ARCHIVE_RETRY_SECONDS:
+            return
+        self.compact_history()
+
     def is_unique(self, number: str) -> bool:
         """
         Check if tracking number has been used before
@@ -100,7 +577,9 @@ class UniquenessChecker:
         Returns:
             bool: True if number is unique, False if already used
         """
-        return number not in self.used_numbers
+        if number in self._days.get(number_day(number), ()):
+            return False
+        return not self.archive.contains(number)
 
     def register_number(self, number: str) -> bool:
         """
@@ -119,11 +598,19 @@ class UniquenessChecker:
             >>> checker.register_number("20251234567890")
             False
         """
+        self._maybe_compact()
+
         if not self.is_unique(number):
             logger.warning(f"Attempt to register duplicate number: {number}")
             return False
 
-        self.used_numbers.add(number)
+        if not self.partition.owns(number):
+            logger.warning(f"Refused number outside {self.partition.describe()}: {number}")
+            return False
+
+        if not self._claim([number]):
+            logger.warning(f"Attempt to register duplicate number: {number}")
+            return False
         self._save_history()
         logger.debug(f"Registered new number: {number}")
         return True
@@ -144,20 +631,42 @@ class UniquenessChecker:
             >>> checker.register_batch(numbers)
             3
         """
-        initial_count = len(self.used_numbers)
+        self._maybe_compact()
 
-        for number in numbers:
-            if self.is_unique(number):
-                self.used_numbers.add(number)
-            else:
-                logger.warning(f"Skipped duplicate in batch: {number}")
-
-        registered_count = len(self.used_numbers) - initial_count
+        registered_count = len(self._claim(numbers))
         self._save_history()
 
         logger.info(f"Registered {registered_count} new numbers from batch of {len(numbers)}")
         return registered_count
 
+    def claim_batch(self, numbers: List[str]) -> List[str]:
+        """
+        Atomically register candidates and report which ones this caller won
+
+        Safe to call from several generator threads at once: a number is
+        granted to exactly one caller. Rejections (already used, or taken by
+        another job meanwhile) are expected and not logged as warnings.
+
+        Args:
+            numbers: Candidate tracking numbers
+
+        Returns:
+            List[str]: Candidates that are now registered to this caller
+
+        Example:
+            >>> checker = UniquenessChecker()
+            >>> checker.claim_batch(["20251111111111", "20251111111111"])
+            ['20251111111111']
+        """
+        self._maybe_compact()
+
+        claimed = self._claim(numbers, log_rejects=False)
+        if claimed:
+            self._save_history()
+
+        logger.debug(f"Claimed {len(claimed)} of {len(numbers)} candidates")
+        return claimed
+
     def check_batch(self, numbers: List[str]) -> Tuple[List[str], List[str]]:
         """
         Check a batch of numbers for uniqueness
@@ -181,8 +690,10 @@ class UniquenessChecker:
         unique = []
         duplicates = []
 
+        days = self._days
+        archive = self.archive
         for number in numbers:
-            if self.is_unique(number):
+            if number not in days.get(number_day(number), ()) and not archive.contains(number):
                 unique.append(number)
             else:
                 duplicates.append(number)
@@ -195,9 +706,68 @@ class UniquenessChecker:
         Get total count of used numbers
 
         Returns:
-            int: Total number of used tracking numbers
+            int: Total number of used tracking numbers (hot and archived)
+        """
+        return len(self.snapshot()) + self.archive.count()
+
+    def get_day_count(self, day: str) -> int:
+        """
+        Get count of used numbers for one day
+
+        Args:
+            day: YYYYMMDD day key
+
+        Returns:
+            int: Numbers already issued for that day
+        """
+        return len(self._days.get(day, ())) + self.archive.day_count(day)
+
+    def get_capacity_report(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Report per-shard capacity for a day
+
+        Args:
+            day: YYYYMMDD day key (default: today)
+
+        Returns:
+            dict: Shard, capacity, used, reserved, remaining and occupancy for the day
+
+        Example:
+            >>> checker = UniquenessChecker()
+            >>> report = checker.get_capacity_report()
+            >>> report['capacity']
+            810000
+        """
+        day = day or day_key(datetime.now())
+        capacity = self.partition.capacity
+        used = self.get_day_count(day)
+        reserved = len(self.reserved_day(day))
+
+        report = {
+            'day': day,
+            'shard': self.partition.describe(),
+            'node_id': self.partition.node_id,
+            'node_count': self.partition.node_count,
+            'capacity': capacity,
+            'used': used,
+            'reserved': reserved,
+            'remaining': max(capacity - used - reserved, 0),
+            'occupancy': used / capacity if capacity else 1.0,
+        }
+        logger.debug(f"Capacity report: {report}")
+        return report
+
+    def get_remaining_capacity(self, day: Optional[str] = None) -> int:
         """
-        return len(self.used_numbers)
+        Get how many numbers this shard can still issue for a day
+
+        Args:
+            day: YYYYMMDD day key (default: today)
+
+        Returns:
+            int: Remaining numbers (excluding uncommitted reservations)
+        """
+        return self.get_capacity_report(day)['remaining']
 
     def clear_history(self) -> bool:
         """
@@ -207,7 +777,10 @@ class UniquenessChecker:
             bool: True if successful
         """
         logger.warning("Clearing all tracking number history!")
-        self.used_numbers.clear()
+        with self._lock:
+            self._days = {}
+            self._reserved = {}
+            self.archive.clear()
         return self._save_history()
 
     def export_history(self, output_file: str) -> bool:
@@ -221,9 +794,11 @@ class UniquenessChecker:
             bool: True if successful
         """
         try:
+            numbers = list(self.snapshot())
+            numbers.extend(self.archive.iter_numbers())
             with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(list(self.used_numbers), f, indent=2, ensure_ascii=False)
-            logger.info(f"Exported {len(self.used_numbers)} numbers to {output_file}")
+                json.dump(numbers, f, indent=2, ensure_ascii=False)
+            logger.info(f"Exported {len(numbers)} numbers to {output_file}")
             return True
         except IOError as e:
             logger.error(f"Failed to export history: {e}")
@@ -232,16 +807,34 @@ class UniquenessChecker:
 
 # Singleton instance for application-wide use
 _checker_instance = None
+_checker_lock = threading.Lock()
 
 
 def get_uniqueness_checker() -> UniquenessChecker:
     """
     Get singleton instance of UniquenessChecker
 
+    The application-wide instance persists in the background; call flush()
+    before exporting and close() on shutdown.
+
     Returns:
         UniquenessChecker: Global uniqueness checker instance
     """
     global _checker_instance
     if _checker_instance is None:
-        _checker_instance = UniquenessChecker()
+        with _checker_lock:
+            if _checker_instance is None:
+                _checker_instance = UniquenessChecker(background_save=True)
     return _checker_instance
+
+
+def shutdown_uniqueness_checker() -> bool:
+    """
+    Flush and stop the singleton's background persistence, if it was created
+
+    Returns:
+        bool: True if all registered numbers are durable
+    """
+    if _checker_instance is None:
+        return True
+    return _checker_instance.close()
@@ -15,13 +15,25 @@ Features:
 - Centered alignment for all columns
 - Monospace font for tracking numbers
 - Error handling for file write operations
+
+Streaming export (create_output_streaming):
+- Consumes tracking numbers block by block (e.g. from
+  TrackingNumberGenerator.iter_generate_and_register) and appends rows to a
+  write-only workbook as they arrive, so writing starts with the first block
+  and memory stays bounded by the block size
+- Same columns and formatting as create_output; column widths are sized from
+  the header and the first block
+- write_row_chunks takes (special codes, tracking numbers) blocks directly,
+  for producers that deliver both together (ExcelPipeline)
 """
 
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
 import pandas as pd
 from pandas import ExcelWriter
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
 from src.utils.constants import (
@@ -122,6 +134,177 @@ class ExcelExportHandler:
             # Generic message to user (no internal details for security)
             raise ExcelExportError("파일을 저장할 수 없습니다. 경로를 확인하거나 다른 위치에 저장해보세요.")
 
+    @staticmethod
+    def create_output_streaming(
+        special_codes: Iterable[str],
+        number_chunks: Iterable[List[str]],
+        output_path: str,
+        apply_formatting: bool = True
+    ) -> int:
+        """
+        Create the same 3-column output as create_output, writing rows as
+        tracking-number blocks arrive
+
+        Args:
+            special_codes: Special codes from input file, in row order
+            number_chunks: Blocks of tracking numbers, in row order
+            output_path: Path to save output file
+            apply_formatting: Apply Excel formatting (default: True)
+
+        Returns:
+            int: Rows written
+
+        Raises:
+            ExcelExportError: If export fails or the codes and numbers don't pair up
+                              (nothing is saved in that case)
+            RuntimeError: Propagated unchanged from number_chunks (e.g. generation failed)
+
+        Example:
+            >>> generator = TrackingNumberGenerator()
+            >>> chunks = generator.iter_generate_and_register(len(codes), get_uniqueness_checker())
+            >>> ExcelExportHandler.create_output_streaming(codes, chunks, "output.xlsx")
+            2500
+        """
+        codes = iter(special_codes)
+
+        def row_chunks() -> Iterator[Tuple[List[str], List[str]]]:
+            for numbers in number_chunks:
+                block_codes = list(islice(codes, len(numbers)))
+                if len(block_codes) != len(numbers):
+                    raise ExcelExportError("Mismatch: fewer special codes than tracking numbers provided")
+                yield block_codes, numbers
+            if next(codes, None) is not None:
+                raise ExcelExportError("Mismatch: more special codes than tracking numbers provided")
+
+        return ExcelExportHandler.write_row_chunks(row_chunks(), output_path, apply_formatting)
+
+    @staticmethod
+    def write_row_chunks(
+        row_chunks: Iterable[Tuple[List[str], List[str]]],
+        output_path: str,
+        apply_formatting: bool = True
+    ) -> int:
+        """
+        Write (special codes, tracking numbers) blocks to a 3-column output file
+        as they arrive
+
+        The workbook is only saved once row_chunks is exhausted; an exception
+        from row_chunks propagates unchanged and nothing is saved.
+
+        Args:
+            row_chunks: Blocks of equal-length (special codes, tracking numbers) lists
+            output_path: Path to save output file
+            apply_formatting: Apply Excel formatting (default: True)
+
+        Returns:
+            int: Rows written
+
+        Raises:
+            ExcelExportError: If export fails or a block's lengths differ
+        """
+        is_valid, error_message = validate_output_path(output_path)
+        if not is_valid:
+            raise ExcelExportError(error_message)
+
+        chunks = iter(row_chunks)
+        first_rows = ExcelExportHandler._pair_rows(*next(chunks, ([], [])))
+
+        try:
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet('Sheet1')
+            header = ['주문고유코드', '송장번호', '택배사']
+            styles = ExcelExportHandler._streaming_styles(worksheet, header, first_rows, apply_formatting)
+            worksheet.append(ExcelExportHandler._streaming_row(worksheet, header, styles['header']))
+        except Exception as e:
+            logger.error(f"Streaming export failed: {e}", exc_info=True)
+            raise ExcelExportError("파일을 저장할 수 없습니다. 경로를 확인하거나 다른 위치에 저장해보세요.")
+
+        rows_written = 0
+        rows = first_rows
+        try:
+            while rows:
+                for row in rows:
+                    worksheet.append(ExcelExportHandler._streaming_row(worksheet, row, styles['data']))
+                rows_written += len(rows)
+                rows = ExcelExportHandler._pair_rows(*next(chunks, ([], [])))
+        except BaseException:
+            # Finish the sheet's temporary file so nothing is left half-written
+            worksheet.close()
+            raise
+
+        try:
+            workbook.save(output_path)
+        except Exception as e:
+            logger.error(f"Streaming export failed: {e}", exc_info=True)
+            raise ExcelExportError("파일을 저장할 수 없습니다. 경로를 확인하거나 다른 위치에 저장해보세요.")
+
+        logger.info(f"Successfully streamed {rows_written} rows to: {output_path}")
+        return rows_written
+
+    @staticmethod
+    def _pair_rows(codes: List[str], numbers: List[str]) -> List[List[str]]:
+        """
+        Build output rows for one block
+
+        Raises:
+            ExcelExportError: If the block has a different number of codes and numbers
+        """
+        if len(codes) != len(numbers):
+            raise ExcelExportError(
+                f"Mismatch: {len(codes)} special codes but {len(numbers)} tracking numbers provided"
+            )
+        return [[code, number, DELIVERY_COMPANY] for code, number in zip(codes, numbers)]
+
+    @staticmethod
+    def _streaming_styles(worksheet, header: List[str], sample_rows: List[List[str]], apply_formatting: bool) -> dict:
+        """
+        Set column widths and build per-column cell styles for a write-only sheet
+
+        Widths must be set before the first row is appended, so they are sized
+        from the header and the first block (same rule as _apply_formatting).
+
+        Returns:
+            dict: 'header' and 'data' - per-column (font, fill, alignment) or None
+        """
+        if not apply_formatting:
+            return {'header': [None] * len(header), 'data': [None] * len(header)}
+
+        for col_idx, name in enumerate(header):
+            max_length = max([len(str(name))] + [len(str(row[col_idx])) for row in sample_rows])
+            worksheet.column_dimensions[chr(65 + col_idx)].width = min(max_length + 2, 50)  # Cap at 50
+
+        centered = Alignment(horizontal="center", vertical="center")
+        header_style = (
+            Font(bold=True, size=12, color="1F2937"),  # gray-800
+            PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid"),  # gray-100
+            centered,
+        )
+        data_style = (None, None, centered)
+        tracking_style = (Font(name="Courier New", size=11), None, centered)
+
+        return {
+            'header': [header_style] * len(header),
+            'data': [tracking_style if name == '송장번호' else data_style for name in header],
+        }
+
+    @staticmethod
+    def _streaming_row(worksheet, values: List[str], styles: list) -> list:
+        """Build one styled row for a write-only sheet"""
+        row = []
+        for value, style in zip(values, styles):
+            if style is None:
+                row.append(value)
+                continue
+            cell = WriteOnlyCell(worksheet, value=value)
+            font, fill, alignment = style
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            cell.alignment = alignment
+            row.append(cell)
+        return row
+
     @staticmethod
     def _apply_formatting(writer: ExcelWriter, df: pd.DataFrame) -> None:
         """
@@ -11,12 +11,51 @@ Supported file formats:
 Expected file structure:
 - Must contain '주문고유코드' column (order unique code)
 - Additional columns are optional and preserved
+
+Streaming read (iter_special_codes):
+- Files are read by the fastest installed reader backend for their format
+  (reader_backends: calamine if installed, then the built-in
+  column-projected xlsx reader, openpyxl, xlrd), and codes are yielded in
+  blocks so later stages can start on the first block
+- Padded sheets (formatting carried down to row 1,048,576) cost time in
+  proportion to their real rows with the projected reader: after
+  EXTENT_EMPTY_RUN_ROWS empty rows the rest of the sheet is scanned as
+  bytes for the next value instead of being parsed, and a warning reports
+  the skipped rows
+
+Size-adaptive upload (load_special_codes):
+- The sheet's extent is read from the xlsx dimension record or the xls
+  BIFF header, then a strategy is picked and logged with the estimate and
+  the reason:
+  - small sheets (up to INGEST_IN_MEMORY_MAX_CELLS cells): the fastest
+    reader, which may load the whole sheet (calamine, xlrd)
+  - larger sheets: the fastest streaming reader (column-projected xlsx), so
+    memory stays bounded by the codes rather than every cell
+  - from INGEST_SPILL_MIN_ROWS rows: streaming, with the codes spilled to a
+    temporary file
+- pandas is not one of the readers: it was the slowest at every size
+  measured (20 to 50,000 rows: 11 ms to 7.0 s, against 0.4 ms to 0.39 s
+  for calamine and 1.3 ms to 3.1 s for the projected reader)
+- The estimate only picks the strategy; codes are spilled once the rows
+  actually read reach the threshold, since a padded sheet's dimension
+  overstates its size
+
+Normalization (load_order_codes):
+- Codes are trimmed, float-formatted codes ("12345.0") become integers,
+  empty cells are dropped and in-file duplicates are flagged, with a
+  CodeIssue bit mask per row (code_normalizer)
 """
 
 import os
-from typing import Optional, List, Tuple, Dict, Any
+import time
+from typing import Optional, Iterator, List, Tuple, Dict, Any
 import pandas as pd
 
+from src.core.code_normalizer import NormalizedCodes, normalize_codes
+from src.core.compact import CompactStrings
+from src.handlers.reader_backends import select_reader
+from src.handlers.sheet_scan import xlsx_dimensions, xls_dimensions
+
 from src.utils.constants import (
     SUPPORTED_FORMATS,
     MAX_FILE_SIZE,
@@ -25,6 +64,11 @@ from src.utils.constants import (
     ERR_FILE_EMPTY,
     ERR_FILE_READ,
     ERR_PERMISSION_DENIED,
+    ERR_NO_CODE_COLUMN,
+    INGEST_CHUNK_SIZE,
+    INGEST_IN_MEMORY_MAX_CELLS,
+    INGEST_SPILL_MIN_ROWS,
+    EXTENT_EMPTY_RUN_ROWS,
 )
 from src.utils.validators import validate_file_path, validate_dataframe_not_empty
 from src.utils.logger import get_logger
@@ -43,6 +87,13 @@ class FileFormat:
     TRACKING_ONLY_FORMAT = "tracking_only"  # Two columns: code + output
 
 
+class IngestStrategy:
+    """Enum-like class for upload strategies (see ExcelUploadHandler.load_special_codes)"""
+    IN_MEMORY = "in_memory"  # Reader loads the whole sheet (calamine, xlrd)
+    STREAMING = "streaming"  # Reader streams rows
+    SPILL = "spill"  # Streaming reader only, buffer spilled to disk
+
+
 class ExcelUploadHandler:
     """
     Handles Excel file validation and upload operations
@@ -73,7 +124,7 @@ class ExcelUploadHandler:
 
         if not has_special_code:
             logger.error(f"Required column '주문고유코드' not found. Columns: {columns}")
-            raise ExcelUploadError("파일에 '주문고유코드' 컬럼이 없습니다. 올바른 형식의 파일을 선택해주세요.")
+            raise ExcelUploadError(ERR_NO_CODE_COLUMN)
 
         logger.info(f"Detected TRACKING_ONLY format with columns: {columns}")
         return FileFormat.TRACKING_ONLY_FORMAT
@@ -193,6 +244,235 @@ class ExcelUploadHandler:
             # Generic message to user (no internal details for security)
             raise ExcelUploadError("파일을 읽을 수 없습니다. 파일이 손상되었거나 형식이 올바르지 않습니다.")
 
+    @staticmethod
+    def iter_special_codes(
+        file_path: str,
+        chunk_size: int,
+        backend: Optional[str] = None,
+        streaming: bool = False
+    ) -> Iterator[List[str]]:
+        """
+        Read special codes in blocks without building a DataFrame
+
+        The file is read by the fastest installed reader backend for its format
+        (see reader_backends). Codes are converted to text the way
+        extract_special_codes does (an empty cell becomes 'nan'); empty rows
+        after the last data row are ignored.
+
+        Args:
+            file_path: Path to Excel file
+            chunk_size: Maximum codes per yielded block
+            backend: Reader backend name to use instead of the fastest (optional)
+            streaming: Only use a backend that streams rows (bounded memory)
+
+        Yields:
+            List[str]: Special codes, in row order
+
+        Raises:
+            ExcelUploadError: If the file is invalid, empty, or has no '주문고유코드' column
+        """
+        ExcelUploadHandler.validate_file(file_path)
+
+        def choose_column(header: List[str]) -> Optional[int]:
+            return next((index for index, name in enumerate(header) if '주문고유코드' in name), None)
+
+        try:
+            reader = select_reader(file_path, backend, streaming)
+            total = 0
+            extent: Dict[str, int] = {}
+            for block in reader.iter_column(file_path, choose_column, chunk_size, stats=extent):
+                total += len(block)
+                yield block
+            if total == 0:
+                raise ExcelUploadError(ERR_FILE_EMPTY)
+
+            logger.info(f"Read {total} special codes with the '{reader.name}' reader")
+            padding = extent.get('last_row', 0) - extent.get('last_data_row', 0)
+            if padding >= EXTENT_EMPTY_RUN_ROWS:
+                scanned = extent.get('scanned_bytes')
+                logger.warning(
+                    f"{os.path.basename(file_path)} is padded: {padding} formatted empty rows after "
+                    f"the last data row ({extent['last_data_row']}) were skipped"
+                    + (f" ({scanned / 1024:.0f} KB scanned without parsing)" if scanned else "")
+                )
+
+        except ExcelUploadError:
+            raise
+
+        except LookupError as e:
+            logger.error(f"Required column '주문고유코드' not found. {e}")
+            raise ExcelUploadError(ERR_NO_CODE_COLUMN)
+
+        except PermissionError:
+            logger.error(f"Permission error: {file_path}")
+            raise ExcelUploadError(ERR_PERMISSION_DENIED)
+
+        except Exception as e:
+            logger.error(f"Failed to stream Excel file: {e}", exc_info=True)
+            raise ExcelUploadError("파일을 읽을 수 없습니다. 파일이 손상되었거나 형식이 올바르지 않습니다.")
+
+    @staticmethod
+    def estimate_shape(file_path: str) -> Optional[Tuple[int, int]]:
+        """
+        Estimate data rows and columns from the sheet's stored dimensions
+
+        Reads only the xlsx <dimension> element or the xls BIFF DIMENSIONS
+        record; no cells are parsed.
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            Optional[Tuple[int, int]]: (data rows excluding the header, columns), or None if unknown
+        """
+        try:
+            if os.path.splitext(file_path)[1].lower() == '.xlsx':
+                shape = xlsx_dimensions(file_path)
+            else:
+                shape = xls_dimensions(file_path)
+        except Exception as e:
+            logger.debug(f"Could not estimate size of {file_path}: {e}")
+            return None
+        if shape is None:
+            return None
+        rows, columns = shape
+        return max(rows - 1, 0), columns
+
+    @staticmethod
+    def estimate_rows(file_path: str) -> Optional[int]:
+        """
+        Estimate data rows from the sheet's stored dimensions (cheap, no parsing)
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            Optional[int]: Data rows excluding the header, or None if unknown
+        """
+        shape = ExcelUploadHandler.estimate_shape(file_path)
+        return shape[0] if shape else None
+
+    @staticmethod
+    def choose_strategy(file_path: str, shape: Optional[Tuple[int, int]]) -> str:
+        """
+        Pick the ingestion strategy for a file
+
+        Args:
+            file_path: Path to Excel file
+            shape: estimate_shape() result
+
+        Returns:
+            str: IngestStrategy value
+        """
+        return ExcelUploadHandler._choose_strategy(file_path, shape)[0]
+
+    @staticmethod
+    def _choose_strategy(file_path: str, shape: Optional[Tuple[int, int]]) -> Tuple[str, str]:
+        """Pick the ingestion strategy for a file, with the reason for the log"""
+        if shape is not None and shape[0] >= INGEST_SPILL_MIN_ROWS:
+            return IngestStrategy.SPILL, f"{INGEST_SPILL_MIN_ROWS}+ rows, codes spilled to disk"
+
+        large = shape is not None and shape[0] * shape[1] > INGEST_IN_MEMORY_MAX_CELLS
+        try:
+            reader = select_reader(file_path, streaming=large)
+        except ValueError:
+            return IngestStrategy.STREAMING, "unsupported format"  # Reading reports it
+        strategy = IngestStrategy.STREAMING if reader.streaming else IngestStrategy.IN_MEMORY
+
+        if large:
+            reason = f"over {INGEST_IN_MEMORY_MAX_CELLS} cells, streaming keeps memory bounded"
+            if not reader.streaming:
+                reason = f"over {INGEST_IN_MEMORY_MAX_CELLS} cells, but no streaming reader for the format"
+        elif shape is None:
+            reason = "size unknown, fastest reader"
+        else:
+            reason = "small sheet, fastest reader"
+        return strategy, f"{reason} ('{reader.name}')"
+
+    @staticmethod
+    def load_special_codes(file_path: str) -> CompactStrings:
+        """
+        Load a file's special codes with the strategy that suits its size
+
+        - in_memory: the fastest reader loads the whole sheet (calamine, xlrd);
+                     sheets up to INGEST_IN_MEMORY_MAX_CELLS cells
+        - streaming: a reader that streams rows into the compact buffer; larger
+                     sheets, or small ones whose fastest reader streams
+        - spill:     a streaming reader, with the buffer spilled to a
+                     temporary file (INGEST_SPILL_MIN_ROWS rows or more)
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            CompactStrings: Special codes, in row order
+
+        Raises:
+            ExcelUploadError: If the file is invalid, empty, or has no '주문고유코드' column
+
+        Example:
+            >>> codes = ExcelUploadHandler.load_special_codes("orders.xlsx")
+            >>> codes[0]
+            'DA616E9F6'
+        """
+        ExcelUploadHandler.validate_file(file_path)
+
+        shape = ExcelUploadHandler.estimate_shape(file_path)
+        strategy, reason = ExcelUploadHandler._choose_strategy(file_path, shape)
+        estimate = f"~{shape[0]} rows x {shape[1]} columns" if shape else "size unknown"
+        logger.info(f"Ingesting {os.path.basename(file_path)} ({estimate}) with strategy '{strategy}': {reason}")
+
+        # Spill once the rows actually read reach the threshold: a padded
+        # sheet's dimension overstates its size
+        start = time.perf_counter()
+        codes = CompactStrings()
+        blocks = ExcelUploadHandler.iter_special_codes(
+            file_path, INGEST_CHUNK_SIZE, streaming=strategy != IngestStrategy.IN_MEMORY
+        )
+        for block in blocks:
+            codes.extend(block)
+            if not codes.is_spilled and len(codes) >= INGEST_SPILL_MIN_ROWS:
+                logger.info(f"Spilling codes to disk after {len(codes)} rows")
+                codes.spill()
+
+        logger.info(
+            f"Ingested {len(codes)} codes in {time.perf_counter() - start:.2f}s "
+            f"({codes.nbytes / 1024:.0f} KB in memory)"
+        )
+        return codes
+
+    @staticmethod
+    def load_order_codes(file_path: str) -> NormalizedCodes:
+        """
+        Load a file's special codes and normalize them (see code_normalizer)
+
+        Whitespace is trimmed, float-formatted codes become integers, empty
+        cells are dropped and in-file duplicates are flagged.
+
+        Args:
+            file_path: Path to Excel file
+
+        Returns:
+            NormalizedCodes: Normalized codes and per-row issue flags
+
+        Raises:
+            ExcelUploadError: If the file is invalid, has no '주문고유코드' column,
+                              or no row has a code
+        """
+        codes = ExcelUploadHandler.load_special_codes(file_path)
+        start = time.perf_counter()
+        result = normalize_codes(codes)
+        summary = result.summary()
+        logger.info(
+            f"Normalized {summary['rows']} codes in {(time.perf_counter() - start) * 1000:.0f} ms: "
+            f"{summary['empty']} empty, {summary['trimmed']} trimmed, "
+            f"{summary['float']} float, {summary['duplicate']} duplicate"
+        )
+
+        if not len(result.codes):
+            raise ExcelUploadError(ERR_FILE_EMPTY)
+        return result
+
     @staticmethod
     def get_file_info(file_path: str) -> Dict[str, Any]:
         """
@@ -238,8 +518,10 @@ class ExcelUploadHandler:
             Optional[pd.DataFrame]: Preview data or None if error
         """
         try:
-            df = ExcelUploadHandler.read_excel(file_path)
-            preview = df.head(rows)
+            # Parse only the first rows instead of the whole sheet
+            ExcelUploadHandler.validate_file(file_path)
+            engine = 'xlrd' if os.path.splitext(file_path)[1].lower() == '.xls' else 'openpyxl'
+            preview = pd.read_excel(file_path, engine=engine, nrows=rows)
             logger.info(f"Preview generated: {len(preview)} rows")
             return preview
         except Exception as e:
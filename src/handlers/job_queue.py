@@ -0,0 +1,345 @@
+"""
+Job Queue
+
+This module processes many input files in one action. Each queued file is
+handled by a job thread that sends the CPU-bound steps (parsing the input,
+writing the output) to the warm WorkerPool, so jobs parse and write on
+separate cores instead of contending for one interpreter; numbers are
+generated and registered in-process, since every job draws them from the
+single shared UniquenessChecker (claim_batch makes concurrent registration
+safe).
+
+Behavior:
+- add() queues supported files (.xls/.xlsx) that aren't already pending or
+  running; re-adding a finished file queues it again
+- run() submits every pending job and returns immediately; each job writes
+  <input name>_가송장.xlsx into the chosen output folder (never overwriting
+  an existing file)
+- Job changes (status, progress) are reported through on_update, from the
+  worker threads
+- The history is flushed before a job's output is written, so no number is
+  handed out before it is durable
+- A failed job records its error and does not affect the others
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+from src.core.uniqueness_checker import UniquenessChecker, get_uniqueness_checker
+from src.utils.constants import (
+    SUPPORTED_FORMATS,
+    JOB_QUEUE_MAX_WORKERS,
+    JOB_OUTPUT_SUFFIX,
+    ERR_FILE_EMPTY,
+    ERR_NO_CODE_COLUMN,
+)
+from src.utils.validators import sanitize_filename, validate_output_path
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.handlers.worker_pool import WorkerPool
+
+logger = get_logger(__name__)
+
+
+class JobStatus:
+    """Enum-like class for job states"""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job:
+    """
+    One input file and its processing state.
+    """
+
+    def __init__(self, job_id: int, input_path: str):
+        """
+        Initialize job
+
+        Args:
+            job_id: Queue-unique identifier
+            input_path: Input Excel file
+        """
+        self.job_id = job_id
+        self.input_path = input_path
+        self.output_path: Optional[str] = None
+        self.status = JobStatus.PENDING
+        self.current = 0
+        self.total = 0
+        self.error: Optional[str] = None
+        self.report: Optional[Dict[str, Any]] = None
+
+    @property
+    def name(self) -> str:
+        """Input file name"""
+        return os.path.basename(self.input_path)
+
+    @property
+    def is_active(self) -> bool:
+        """True while the job is pending or running"""
+        return self.status in (JobStatus.PENDING, JobStatus.RUNNING)
+
+
+def output_path_for(input_path: str, output_dir: str, taken: Iterable[str] = ()) -> str:
+    """
+    Choose the output path for an input file without overwriting anything
+
+    Args:
+        input_path: Input Excel file
+        output_dir: Folder for output files
+        taken: Paths already assigned to other jobs
+
+    Returns:
+        str: <output_dir>/<input name>_가송장.xlsx, numbered (2), (3)... if taken
+
+    Example:
+        >>> output_path_for("/in/orders.xls", "/out")
+        '/out/orders_가송장.xlsx'
+    """
+    stem = sanitize_filename(os.path.splitext(os.path.basename(input_path))[0]) + JOB_OUTPUT_SUFFIX
+    taken = set(taken)
+    candidate = os.path.join(output_dir, f"{stem}.xlsx")
+    counter = 2
+    while candidate in taken or os.path.exists(candidate):
+        candidate = os.path.join(output_dir, f"{stem} ({counter}).xlsx")
+        counter += 1
+    return candidate
+
+
+class JobQueue:
+    """
+    Queue of input files processed in parallel against one uniqueness store.
+    """
+
+    def __init__(
+        self,
+        checker: Optional[UniquenessChecker] = None,
+        max_workers: int = JOB_QUEUE_MAX_WORKERS,
+        on_update: Optional[Callable[[Job], None]] = None,
+        pool: Optional["WorkerPool"] = None
+    ):
+        """
+        Initialize job queue
+
+        Args:
+            checker: Shared uniqueness checker (default: global checker)
+            max_workers: Files processed in parallel
+            on_update: Function(job) called whenever a job changes (from worker threads)
+            pool: Worker pool for parsing and writing (default: global pool,
+                  fetched when the first job runs)
+        """
+        self.checker = checker or get_uniqueness_checker()
+        self.on_update = on_update
+        self._pool = pool
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="JobWorker")
+        self._lock = threading.Lock()
+        self._jobs: List[Job] = []
+        self._futures: List[Future] = []
+        self._next_id = 1
+
+    @property
+    def jobs(self) -> List[Job]:
+        """Jobs in the order they were added"""
+        with self._lock:
+            return list(self._jobs)
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Count jobs per status
+
+        Returns:
+            dict: {status: count} for every JobStatus
+        """
+        counts = {JobStatus.PENDING: 0, JobStatus.RUNNING: 0, JobStatus.DONE: 0, JobStatus.FAILED: 0}
+        with self._lock:
+            for job in self._jobs:
+                counts[job.status] += 1
+        return counts
+
+    def add(self, paths: Iterable[str]) -> List[Job]:
+        """
+        Queue input files
+
+        Args:
+            paths: Input file paths (unsupported extensions and files already
+                   pending or running are skipped)
+
+        Returns:
+            List[Job]: Jobs that were added
+        """
+        added = []
+        with self._lock:
+            active = {os.path.abspath(job.input_path) for job in self._jobs if job.is_active}
+            for path in paths:
+                absolute = os.path.abspath(path)
+                if os.path.splitext(path)[1].lower() not in SUPPORTED_FORMATS:
+                    logger.info(f"Skipped unsupported file: {path}")
+                    continue
+                if absolute in active:
+                    logger.info(f"Skipped file already queued: {path}")
+                    continue
+                job = Job(self._next_id, absolute)
+                self._next_id += 1
+                self._jobs.append(job)
+                active.add(absolute)
+                added.append(job)
+
+        logger.info(f"Queued {len(added)} files")
+        return added
+
+    def run(self, output_dir: str) -> int:
+        """
+        Start processing every pending job
+
+        Args:
+            output_dir: Folder for output files
+
+        Returns:
+            int: Jobs started
+        """
+        with self._lock:
+            pending = [job for job in self._jobs if job.status == JobStatus.PENDING and job.output_path is None]
+            taken = {job.output_path for job in self._jobs if job.output_path}
+            for job in pending:
+                job.output_path = output_path_for(job.input_path, output_dir, taken)
+                taken.add(job.output_path)
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.extend(self._executor.submit(self._process, job) for job in pending)
+
+        logger.info(f"Started {len(pending)} jobs → {output_dir}")
+        return len(pending)
+
+    def _notify(self, job: Job) -> None:
+        """Report a job change"""
+        if self.on_update:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                logger.warning(f"Job update callback failed: {e}")
+
+    @property
+    def pool(self) -> "WorkerPool":
+        """Worker pool the jobs parse and write on"""
+        if self._pool is None:
+            # Imported here so the UI can create the queue at startup cheaply
+            from src.handlers.worker_pool import get_worker_pool
+
+            self._pool = get_worker_pool()
+        return self._pool
+
+    def _process(self, job: Job) -> None:
+        """Run one job on a worker thread"""
+        job.status = JobStatus.RUNNING
+        self._notify(job)
+
+        try:
+            job.report = self._run_job(job)
+            job.status = JobStatus.DONE
+            logger.info(f"Job {job.job_id} done: {job.name} → {job.output_path}")
+        except Exception as e:
+            job.error = str(e)
+            job.status = JobStatus.FAILED
+            logger.error(f"Job {job.job_id} failed: {job.name}: {e}")
+        self._notify(job)
+
+    def _run_job(self, job: Job) -> Dict[str, Any]:
+        """
+        Parse, number and write one file
+
+        Returns:
+            dict: 'rows' - rows written,
+                  'wall_seconds' - end-to-end time,
+                  'stage_seconds' - time per step (read / generate / write)
+
+        Raises:
+            ExcelUploadError: If the input can't be read
+            ExcelExportError: If the output can't be written
+            RuntimeError: If generation or the history flush fails
+        """
+        # Imported here (numpy, pandas via the exporter) so the UI can create the queue at startup cheaply
+        from src.core.code_normalizer import normalize_codes
+        from src.core.tracking_generator import TrackingNumberGenerator
+        from src.handlers.excel_exporter import ExcelExportError
+        from src.handlers.excel_uploader import ExcelUploadError
+        from src.handlers.parallel_ingest import SkipReason, SourceStatus
+
+        # Fail before any number is registered if the output can't be written
+        is_valid, error_message = validate_output_path(job.output_path)
+        if not is_valid:
+            raise ExcelExportError(error_message)
+
+        # Opened before the parse so a job crossing midnight keeps its date
+        generator = TrackingNumberGenerator()
+        session = generator.session()
+        start = time.perf_counter()
+        source = self.pool.parse(job.input_path)
+        if source.status == SourceStatus.SKIPPED:
+            raise ExcelUploadError(ERR_NO_CODE_COLUMN if source.reason == SkipReason.NO_CODE_COLUMN else ERR_FILE_EMPTY)
+        if source.status == SourceStatus.FAILED:
+            raise ExcelUploadError(source.error)
+        codes = normalize_codes(source.codes, find_duplicates=False).codes
+        if not len(codes):
+            raise ExcelUploadError(ERR_FILE_EMPTY)
+        job.current, job.total = 0, len(codes)
+        self._notify(job)
+        read_done = time.perf_counter()
+
+        def progress(current: int, total: int) -> None:
+            job.current, job.total = current, total
+            self._notify(job)
+
+        numbers = generator.generate_and_register(len(codes), self.checker, progress, session=session)
+        if not self.checker.flush():
+            raise RuntimeError("History flush failed; output not saved")
+        generate_done = time.perf_counter()
+
+        rows = self.pool.export(codes, numbers, job.output_path)
+        end = time.perf_counter()
+
+        return {
+            'rows': rows,
+            'wall_seconds': end - start,
+            'stage_seconds': {
+                'read': read_done - start,
+                'generate': generate_done - read_done,
+                'write': end - generate_done,
+            },
+        }
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for started jobs to finish
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if every started job finished
+        """
+        with self._lock:
+            futures = list(self._futures)
+        _, not_done = wait(futures, timeout)
+        return not not_done
+
+    def clear_finished(self) -> int:
+        """
+        Remove done and failed jobs from the queue
+
+        Returns:
+            int: Jobs removed
+        """
+        with self._lock:
+            before = len(self._jobs)
+            self._jobs = [job for job in self._jobs if job.is_active]
+            return before - len(self._jobs)
+
+    def shutdown(self) -> None:
+        """Finish running jobs, drop jobs that haven't started, and stop the workers"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Job queue stopped")
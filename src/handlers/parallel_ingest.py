@@ -0,0 +1,277 @@
+"""
+Parallel Ingestion
+
+This module reads the 주문고유코드 column of many spreadsheets at once:
+every worksheet of every given file that has the column, on a pool of
+worker processes, so CPU-bound parsing uses every core instead of one.
+
+Behavior:
+- A source is one worksheet of one file; each file's worksheets are listed
+  with the reader backend chosen for it (only the workbook part is read)
+- Every source is a separate task, so a multi-sheet workbook spreads over
+  the workers the same way a batch of files does
+- Worksheets without a 주문고유코드 header, or without rows, are skipped
+- A source that fails records its error and does not affect the others
+- Results come back in input order (files as given, worksheets in workbook
+  order), each carrying its file, worksheet and reader (provenance)
+
+Performance:
+- Workers return codes as CompactStrings, which pickle as one UTF-8 buffer
+  plus offsets, so each source crosses the process boundary as two byte
+  strings rather than one pickled object per code
+- Without a pool, workers are started with "spawn" (never fork a process
+  running Qt threads) for each call. Starting them costs ~0.3 s, so a
+  single source, or files totalling less than INGEST_PARALLEL_MIN_BYTES,
+  are read in-process instead
+- With a warm WorkerPool (worker_pool) every batch runs on its already
+  running workers
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.compact import CompactStrings
+from src.handlers.reader_backends import select_reader
+from src.utils.constants import (
+    INGEST_CHUNK_SIZE,
+    INGEST_SPILL_MIN_ROWS,
+    INGEST_MAX_WORKERS,
+    INGEST_PARALLEL_MIN_BYTES,
+    EXTENT_EMPTY_RUN_ROWS,
+    ERR_FILE_READ,
+    ERR_PERMISSION_DENIED,
+)
+from src.utils.validators import validate_file_path
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.handlers.worker_pool import WorkerPool
+
+logger = get_logger(__name__)
+
+
+class SourceStatus:
+    """Enum-like class for source outcomes"""
+    OK = "ok"
+    SKIPPED = "skipped"  # No 주문고유코드 column, or no rows (see SkipReason)
+    FAILED = "failed"
+
+
+class SkipReason:
+    """Enum-like class for why a source was skipped"""
+    NO_CODE_COLUMN = "no_code_column"
+    NO_ROWS = "no_rows"
+
+
+class SourceCodes:
+    """
+    Codes read from one worksheet of one file, with their provenance.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        sheet: Optional[str],
+        status: str,
+        codes: Optional[CompactStrings] = None,
+        reader: Optional[str] = None,
+        error: Optional[str] = None,
+        seconds: float = 0.0,
+        padded_rows: int = 0,
+        reason: Optional[str] = None
+    ):
+        """
+        Initialize source result
+
+        Args:
+            file_path: Input file
+            sheet: Worksheet name (None if the file's sheets couldn't be listed)
+            status: SourceStatus value
+            codes: Special codes in row order, as the uploader reads them (OK only)
+            reader: Reader backend that read the sheet
+            error: Error message (FAILED) or reason (SKIPPED)
+            seconds: Time spent reading the sheet in its worker
+            padded_rows: Formatted empty rows after the last data row (skipped)
+            reason: SkipReason value (SKIPPED only)
+        """
+        self.file_path = file_path
+        self.sheet = sheet
+        self.status = status
+        self.codes = codes if codes is not None else CompactStrings()
+        self.reader = reader
+        self.error = error
+        self.seconds = seconds
+        self.padded_rows = padded_rows
+        self.reason = reason
+
+    @property
+    def name(self) -> str:
+        """'<file name> / <sheet>' for messages"""
+        base = os.path.basename(self.file_path)
+        return base if self.sheet is None else f"{base} / {self.sheet}"
+
+    def __repr__(self) -> str:
+        return f"SourceCodes({self.name!r}, {self.status}, {len(self.codes)} codes)"
+
+
+def _code_column(header: List[str]) -> Optional[int]:
+    """Index of the 주문고유코드 column (same rule as ExcelUploadHandler)"""
+    return next((index for index, name in enumerate(header) if '주문고유코드' in name), None)
+
+
+def read_source(file_path: str, sheet: Optional[str] = None, backend: Optional[str] = None) -> SourceCodes:
+    """
+    Read one worksheet's codes (the body of a worker task)
+
+    Args:
+        file_path: Input file
+        sheet: Worksheet name (default: the first worksheet)
+        backend: Reader backend name (default: the fastest available)
+
+    Returns:
+        SourceCodes: The worksheet's codes, or why it was skipped or failed
+    """
+    start = time.perf_counter()
+    stats: Dict[str, int] = {}
+    result = SourceCodes(file_path, sheet, SourceStatus.OK, reader=backend)
+    try:
+        reader = select_reader(file_path, backend)
+        result.reader = reader.name
+        for block in reader.iter_column(file_path, _code_column, INGEST_CHUNK_SIZE, stats=stats, sheet=sheet):
+            result.codes.extend(block)
+        if not len(result.codes):
+            result.status, result.reason, result.error = SourceStatus.SKIPPED, SkipReason.NO_ROWS, "no rows"
+    except LookupError:
+        result.status, result.reason = SourceStatus.SKIPPED, SkipReason.NO_CODE_COLUMN
+        result.error = "no 주문고유코드 column"
+    except PermissionError:
+        result.status, result.error = SourceStatus.FAILED, ERR_PERMISSION_DENIED
+    except Exception as e:
+        result.status, result.error = SourceStatus.FAILED, ERR_FILE_READ.format(e)
+
+    result.padded_rows = stats.get('last_row', 0) - stats.get('last_data_row', 0)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _settle(result: SourceCodes) -> SourceCodes:
+    """Spill a large result to disk and log problems (in the calling process)"""
+    if len(result.codes) >= INGEST_SPILL_MIN_ROWS:
+        result.codes.spill()
+    if result.status == SourceStatus.FAILED:
+        logger.error(f"Failed to read {result.name}: {result.error}")
+    if result.padded_rows >= EXTENT_EMPTY_RUN_ROWS:
+        logger.warning(f"{result.name} is padded: {result.padded_rows} formatted empty rows were skipped")
+    return result
+
+
+def list_sources(
+    paths: Iterable[str],
+    backend: Optional[str] = None
+) -> Tuple[List[Tuple[str, str, str]], List[SourceCodes]]:
+    """
+    List the worksheets to read in each file
+
+    Args:
+        paths: Input files
+        backend: Reader backend name to use instead of the fastest (optional)
+
+    Returns:
+        Tuple: ([(file path, sheet name, reader name)] in order,
+                [SourceCodes] for files that can't be read at all)
+    """
+    sources: List[Tuple[str, str, str]] = []
+    failed: List[SourceCodes] = []
+    for path in paths:
+        is_valid, error_message = validate_file_path(path)
+        if not is_valid:
+            failed.append(SourceCodes(path, None, SourceStatus.FAILED, error=error_message))
+            continue
+        try:
+            reader = select_reader(path, backend)
+            sources.extend((path, sheet, reader.name) for sheet in reader.sheet_names(path))
+        except PermissionError:
+            failed.append(SourceCodes(path, None, SourceStatus.FAILED, error=ERR_PERMISSION_DENIED))
+        except Exception as e:
+            failed.append(SourceCodes(path, None, SourceStatus.FAILED, error=ERR_FILE_READ.format(e)))
+    return sources, failed
+
+
+def ingest_files(
+    paths: Iterable[str],
+    max_workers: Optional[int] = INGEST_MAX_WORKERS,
+    backend: Optional[str] = None,
+    callback: Optional[Callable[[int, int], None]] = None,
+    pool: Optional["WorkerPool"] = None
+) -> List[SourceCodes]:
+    """
+    Read the special codes of every matching worksheet of every file, in parallel
+
+    Args:
+        paths: Input files (.xls/.xlsx)
+        max_workers: Worker processes (None: one per CPU core)
+        backend: Reader backend name to use instead of the fastest (optional)
+        callback: Function(sources done, sources total) called as sources finish
+        pool: Warm WorkerPool to run the reads on instead of starting processes;
+              used for any batch size, since its workers are already running
+
+    Returns:
+        List[SourceCodes]: One entry per worksheet (and per unreadable file),
+                           files in the given order, worksheets in workbook order
+
+    Example:
+        >>> results = ingest_files(["coupang.xlsx", "11st.xls"])
+        >>> [(r.name, len(r.codes)) for r in results if r.status == SourceStatus.OK]
+        [('coupang.xlsx / 주문', 1200), ('11st.xls / Sheet1', 340)]
+    """
+    paths = list(dict.fromkeys(paths))
+    start = time.perf_counter()
+    sources, failed = list_sources(paths, backend)
+    workers = min(max_workers or os.cpu_count() or 1, len(sources))
+    total_bytes = sum(os.path.getsize(path) for path in {source[0] for source in sources})
+    if pool is None and total_bytes < INGEST_PARALLEL_MIN_BYTES:
+        workers = 1  # Process startup would cost more than the parsing it spreads
+
+    read: List[Optional[SourceCodes]] = [None] * len(sources)
+    if pool is None and workers <= 1:
+        for index, source in enumerate(sources):
+            read[index] = _settle(read_source(*source))
+            if callback:
+                callback(index + 1, len(sources))
+    else:
+        executor = None
+        if pool is None:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        submit = pool.submit_parse if pool is not None else lambda *source: executor.submit(read_source, *source)
+        try:
+            futures = {submit(*source): index for index, source in enumerate(sources)}
+            for done, future in enumerate(as_completed(futures), 1):
+                path, sheet, reader = sources[futures[future]]
+                try:
+                    read[futures[future]] = _settle(future.result())
+                except Exception as e:  # Worker process died
+                    read[futures[future]] = _settle(SourceCodes(
+                        path, sheet, SourceStatus.FAILED, reader=reader, error=ERR_FILE_READ.format(e)
+                    ))
+                if callback:
+                    callback(done, len(sources))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    by_file: Dict[str, List[SourceCodes]] = {result.file_path: [result] for result in failed}
+    for result in read:
+        by_file.setdefault(result.file_path, []).append(result)
+
+    results = [result for path in paths for result in by_file.get(path, [])]
+    read_ok = [result for result in results if result.status == SourceStatus.OK]
+    processes = f"{pool.max_workers} pooled" if pool is not None else str(max(workers, 1))
+    logger.info(
+        f"Ingested {sum(len(result.codes) for result in read_ok)} codes from {len(read_ok)} of {len(results)} "
+        f"sources in {len(paths)} files with {processes} processes "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    return results
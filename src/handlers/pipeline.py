@@ -0,0 +1,267 @@
+"""
+Excel Pipeline
+
+This module runs Upload → Generate → Export as three concurrent stages
+connected by bounded queues of row chunks, so a large file is parsed,
+numbered and written at the same time:
+
+    reader thread      ExcelUploadHandler.iter_special_codes + normalize_codes
+        │  codes queue (PIPELINE_QUEUE_DEPTH chunks)
+    generator thread   TrackingNumberGenerator.generate_and_register
+        │  rows queue  (PIPELINE_QUEUE_DEPTH chunks)
+    writer (caller)    ExcelExportHandler.write_row_chunks
+
+Behavior:
+- Wall time approaches the slowest stage instead of the sum of all stages;
+  memory is capped by chunk size × queue depth, not by file size
+- The ship date is pinned when the pipeline is created (one
+  GenerationSession for every chunk), so a run crossing midnight numbers
+  every row with the same date
+- The history is flushed after the last chunk is registered and before the
+  output is saved, so no number is handed out before it is durable
+- The first failure in any stage stops the others and is re-raised by run();
+  the output file is not written in that case (numbers already registered
+  stay registered, as with the sequential workflow)
+
+Usage:
+- Benchmark-only for now: benchmarks/stages.py times it against the
+  sequential stages. The application's batch jobs (job_queue) run the same
+  steps with parsing and writing on the warm worker pool instead
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.code_normalizer import normalize_codes
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker, get_uniqueness_checker
+from src.handlers.excel_uploader import ExcelUploadHandler, ExcelUploadError
+from src.handlers.excel_exporter import ExcelExportHandler, ExcelExportError
+from src.utils.constants import PIPELINE_CHUNK_SIZE, PIPELINE_QUEUE_DEPTH, ERR_FILE_EMPTY
+from src.utils.validators import validate_output_path
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_END = object()  # Queue sentinel: the producing stage is done
+_POLL_SECONDS = 0.1
+
+
+class ExcelPipeline:
+    """
+    One input file processed into one output file by concurrent stages.
+    """
+
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        checker: Optional[UniquenessChecker] = None,
+        generator: Optional[TrackingNumberGenerator] = None,
+        chunk_size: int = PIPELINE_CHUNK_SIZE,
+        queue_depth: int = PIPELINE_QUEUE_DEPTH,
+        apply_formatting: bool = True
+    ):
+        """
+        Initialize pipeline (call run() to process the file)
+
+        Args:
+            input_path: Excel file with a '주문고유코드' column
+            output_path: Path to save output file
+            checker: Uniqueness checker to register numbers in (default: global checker)
+            generator: Generator to draw numbers with (default: new generator)
+            chunk_size: Rows per chunk passed between stages
+            queue_depth: Chunks buffered between two stages
+            apply_formatting: Apply Excel formatting to the output (default: True)
+
+        Raises:
+            ValueError: If chunk_size or queue_depth is not positive
+        """
+        if chunk_size <= 0 or queue_depth <= 0:
+            raise ValueError(f"Chunk size and queue depth must be positive, got {chunk_size} and {queue_depth}")
+
+        self.input_path = input_path
+        self.output_path = output_path
+        self.checker = checker or get_uniqueness_checker()
+        self.generator = generator or TrackingNumberGenerator()
+        self.chunk_size = chunk_size
+        self.apply_formatting = apply_formatting
+        # One session numbers every chunk: the date is validated once, here, so
+        # chunks generated after midnight keep it instead of failing as past
+        self.session = self.generator.session()
+        self.ship_date = self.session.ship_date
+
+        self._codes: "queue.Queue" = queue.Queue(maxsize=queue_depth)
+        self._rows: "queue.Queue" = queue.Queue(maxsize=queue_depth)
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._busy = {'read': 0.0, 'generate': 0.0, 'write': 0.0}
+        self._read_rows: Optional[int] = None  # Set once the whole input has been read
+
+    def _fail(self, error: BaseException) -> None:
+        """Record a stage failure and stop the other stages"""
+        self._errors.append(error)
+        self._stop.set()
+
+    def _put(self, target: "queue.Queue", item: Any) -> bool:
+        """
+        Put into a bounded queue, waiting for space unless the pipeline stops
+
+        Returns:
+            bool: False if the pipeline stopped first
+        """
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: "queue.Queue") -> Any:
+        """Take the next item, or _END if the pipeline stops first"""
+        while True:
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return _END
+
+    def _read(self) -> None:
+        """Reader stage: parse and normalize special codes into the codes queue"""
+        try:
+            # Only a streaming reader keeps memory bounded by the queues and
+            # lets generation start with the first chunk
+            chunks = ExcelUploadHandler.iter_special_codes(self.input_path, self.chunk_size, streaming=True)
+            rows = 0
+            dropped = 0
+            while True:
+                start = time.perf_counter()
+                codes = next(chunks, None)
+                if codes is not None:
+                    # Trim/repair each chunk and drop empty cells; duplicates need
+                    # the whole column, so only the single-file upload flags them
+                    normalized = normalize_codes(codes, find_duplicates=False)
+                    dropped += len(codes) - len(normalized.codes)
+                    codes = list(normalized.codes)
+                self._busy['read'] += time.perf_counter() - start
+                if codes is None:
+                    break
+                if not codes:
+                    continue
+                rows += len(codes)
+                if not self._put(self._codes, codes):
+                    chunks.close()
+                    return
+            if rows == 0:
+                raise ExcelUploadError(ERR_FILE_EMPTY)
+            if dropped:
+                logger.info(f"Dropped {dropped} rows without a special code")
+            self._read_rows = rows
+            self._put(self._codes, _END)
+        except Exception as e:
+            logger.error(f"Pipeline reader failed: {e}")
+            self._fail(e)
+
+    def _generate(self) -> None:
+        """Generator stage: number each chunk, register it and pass the rows on"""
+        try:
+            while True:
+                codes = self._get(self._codes)
+                if codes is _END:
+                    break
+                start = time.perf_counter()
+                numbers = self.generator.generate_and_register(len(codes), self.checker, session=self.session)
+                self._busy['generate'] += time.perf_counter() - start
+                if not self._put(self._rows, (codes, numbers)):
+                    return
+
+            if self._stop.is_set():
+                return
+
+            # The writer saves once it sees _END; make the numbers durable first
+            start = time.perf_counter()
+            if not self.checker.flush():
+                raise RuntimeError("History flush failed; output not saved")
+            self._busy['generate'] += time.perf_counter() - start
+            self._put(self._rows, _END)
+        except Exception as e:
+            logger.error(f"Pipeline generator failed: {e}")
+            self._fail(e)
+
+    def _row_chunks(self, callback: Optional[Callable[[int, int], None]], expected: int):
+        """Writer stage input: rows from the generator, re-raising any stage failure"""
+        rows = 0
+        while True:
+            start = time.perf_counter()
+            item = self._get(self._rows)
+            self._busy['write'] -= time.perf_counter() - start  # Waiting isn't work
+            if item is _END:
+                if self._errors:
+                    raise self._errors[0]
+                return
+            rows += len(item[0])
+            if callback:
+                # The estimate comes from the sheet's dimension, which padded sheets overstate
+                callback(rows, self._read_rows if self._read_rows is not None else max(expected, rows))
+            yield item
+
+    def run(self, callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Process the input file into the output file
+
+        Args:
+            callback: Function(current, total) called as chunks reach the writer;
+                      total is estimated from the sheet dimensions (0 if unknown)
+
+        Returns:
+            dict: 'rows' - rows written,
+                  'wall_seconds' - end-to-end time,
+                  'stage_seconds' - busy time per stage (read / generate / write)
+
+        Raises:
+            ExcelUploadError: If the input can't be read
+            ExcelExportError: If the output can't be written
+            RuntimeError: If generation or the history flush fails
+        """
+        # Fail before any number is registered if the output can't be written
+        is_valid, error_message = validate_output_path(self.output_path)
+        if not is_valid:
+            raise ExcelExportError(error_message)
+
+        start = time.perf_counter()
+        expected = ExcelUploadHandler.estimate_rows(self.input_path) or 0
+        logger.info(f"Starting pipeline: {self.input_path} → {self.output_path} (ship date {self.ship_date})")
+
+        stages = [
+            threading.Thread(target=self._read, name="PipelineReader", daemon=True),
+            threading.Thread(target=self._generate, name="PipelineGenerator", daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+
+        write_start = time.perf_counter()
+        try:
+            rows = ExcelExportHandler.write_row_chunks(
+                self._row_chunks(callback, expected), self.output_path, self.apply_formatting
+            )
+        except BaseException as e:
+            self._fail(e)
+            raise
+        finally:
+            self._busy['write'] += time.perf_counter() - write_start
+            for stage in stages:
+                stage.join()
+
+        report = {
+            'rows': rows,
+            'wall_seconds': time.perf_counter() - start,
+            'stage_seconds': dict(self._busy),
+        }
+        logger.info(
+            f"Pipeline complete: {rows} rows in {report['wall_seconds']:.2f}s "
+            f"(read {self._busy['read']:.2f}s, generate {self._busy['generate']:.2f}s, write {self._busy['write']:.2f}s)"
+        )
+        return report
@@ -0,0 +1,377 @@
+"""
+Spreadsheet Reader Backends
+
+This module provides pluggable readers for the one column the uploader
+needs (주문고유코드), so the fastest reader installed is used at runtime.
+
+Backends:
+- calamine:  python-calamine (Rust), .xlsx and .xls; optional, used only
+             if installed. Loads the sheet natively, then converts rows lazily
+- projected: sheet_scan.iter_xlsx_column (zip + iterparse), .xlsx; only the
+             requested column is converted, padded sheets are skipped
+- openpyxl:  openpyxl read-only worksheet, .xlsx (the reference reader)
+- xlrd:      xlrd, .xls; the whole workbook is loaded
+
+select_reader() walks READER_BACKEND_ORDER (fastest first, measured with
+the read_* stages of `python -m benchmarks run`) and returns the first
+backend that is installed and handles the file's extension.
+
+Every backend reads the first worksheet unless a sheet name is given, lists
+the same worksheets (chart sheets excluded), and yields the same text for
+the same sheet:
+- The first row is the header; choose_column picks the column from its texts
+- Values are converted with str() of the cell value; readers that only
+  report floats (calamine, xlrd) turn whole numbers back into ints first,
+  so 12345 stays "12345"
+- A data row without a value in the column yields "nan" (like pandas
+  astype(str)); empty rows after the last data row are ignored
+- stats gets 'last_data_row' and 'last_row' (the sheet's stored extent),
+  so padded sheets are reported whichever backend reads them
+"""
+
+import importlib.util
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.handlers.sheet_scan import iter_xlsx_column, xlsx_sheet_names, xlsx_dimensions, xls_dimensions
+from src.utils.constants import READER_BACKEND_ORDER
+
+ChooseColumn = Callable[[List[str]], Optional[int]]
+
+BLANK = "nan"
+
+
+def _value_text(value: Any, whole_floats_as_int: bool) -> Optional[str]:
+    """Text of a cell value (None if the cell is empty)"""
+    if value is None or value == "":
+        return None
+    if whole_floats_as_int and isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _column_blocks(
+    rows: Iterable[Sequence[Any]],
+    choose_column: ChooseColumn,
+    chunk_size: int,
+    whole_floats_as_int: bool = False,
+    stats: Optional[Dict[str, int]] = None
+) -> Iterator[List[str]]:
+    """
+    Project rows of cell values onto the chosen column, in blocks
+
+    Args:
+        rows: Sheet rows (header first) as sequences of cell values
+        choose_column: Function(header texts) → 0-based column index, or None
+        chunk_size: Maximum values per block
+        whole_floats_as_int: Convert whole floats to int before str()
+        stats: Optional dict; 'last_data_row' is set once the rows are
+               exhausted (header row + rows up to the last data row)
+
+    Yields:
+        List[str]: Column values
+
+    Raises:
+        LookupError: If choose_column returns None
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    column = choose_column([(_value_text(value, whole_floats_as_int) or "").strip() for value in header])
+    if column is None:
+        raise LookupError(f"Column not found in header: {list(header)}")
+
+    pending_blank = 0  # Empty rows only count if data follows them
+    total = 0
+    block: List[str] = []
+    for row in rows:
+        if all(value is None or value == "" for value in row):
+            pending_blank += 1
+            continue
+        value = _value_text(row[column], whole_floats_as_int) if column < len(row) else None
+
+        for text in [BLANK] * pending_blank + [BLANK if value is None else value]:
+            total += 1
+            block.append(text)
+            if len(block) == chunk_size:
+                yield block
+                block = []
+        pending_blank = 0
+
+    if block:
+        yield block
+    if stats is not None:
+        stats['last_data_row'] = 1 + total
+
+
+def _record_extent(file_path: str, sheet: Optional[str], stats: Optional[Dict[str, int]]) -> None:
+    """
+    Set stats['last_row'] from the sheet's stored dimension
+
+    Readers other than projected don't see where the sheet's formatting
+    ends; the dimension record does, so padding is reported the same way
+    whichever backend read the sheet.
+    """
+    if stats is None:
+        return
+    try:
+        if file_path.lower().endswith(".xls"):
+            shape = xls_dimensions(file_path, sheet)
+        else:
+            shape = xlsx_dimensions(file_path, sheet)
+    except Exception:
+        shape = None
+    stats['last_row'] = max(shape[0] if shape else 0, stats.get('last_data_row', 0))
+
+
+class ReaderBackend(ABC):
+    """
+    Interface for reading one column of a spreadsheet's first sheet.
+    """
+
+    name = ""
+    extensions: Tuple[str, ...] = ()
+    streaming = True  # False if the whole sheet is loaded before the first block
+
+    def is_available(self) -> bool:
+        """True if the backend's library is installed"""
+        return True
+
+    def handles(self, file_path: str) -> bool:
+        """True if the backend reads this file's format"""
+        return os.path.splitext(file_path)[1].lower() in self.extensions
+
+    @abstractmethod
+    def sheet_names(self, file_path: str) -> List[str]:
+        """
+        List the file's worksheets in workbook order
+
+        Args:
+            file_path: Path to spreadsheet
+
+        Returns:
+            List[str]: Worksheet names
+        """
+
+    @abstractmethod
+    def iter_column(
+        self,
+        file_path: str,
+        choose_column: ChooseColumn,
+        chunk_size: int,
+        stats: Optional[Dict[str, int]] = None,
+        sheet: Optional[str] = None
+    ) -> Iterator[List[str]]:
+        """
+        Stream one column of a worksheet in blocks
+
+        Args:
+            file_path: Path to spreadsheet
+            choose_column: Function(header texts) → 0-based column index, or None
+            chunk_size: Maximum values per block
+            stats: Optional dict filled with 'last_data_row' and 'last_row'
+                   (sheet row numbers); projected also sets 'scanned_bytes'
+            sheet: Worksheet name (default: the first worksheet)
+
+        Yields:
+            List[str]: Column values
+
+        Raises:
+            LookupError: If choose_column returns None
+            ValueError: If the file has no worksheet named `sheet`
+        """
+
+
+class CalamineReader(ReaderBackend):
+    """
+    python-calamine reader (optional dependency).
+    """
+
+    name = "calamine"
+    extensions = (".xlsx", ".xls")
+    streaming = False
+
+    def is_available(self) -> bool:
+        return importlib.util.find_spec("python_calamine") is not None
+
+    @staticmethod
+    def _worksheets(workbook) -> List[str]:
+        from python_calamine import SheetTypeEnum
+
+        return [sheet.name for sheet in workbook.sheets_metadata if sheet.typ == SheetTypeEnum.WorkSheet]
+
+    def sheet_names(self, file_path):
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_path(file_path)
+        try:
+            return self._worksheets(workbook)
+        finally:
+            workbook.close()
+
+    def iter_column(self, file_path, choose_column, chunk_size, stats=None, sheet=None):
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_path(file_path)
+        try:
+            names = self._worksheets(workbook)
+            if not names or (sheet is not None and sheet not in names):
+                raise ValueError(f"Workbook has no worksheet {sheet!r}")
+            worksheet = workbook.get_sheet_by_name(names[0] if sheet is None else sheet)
+            yield from _column_blocks(
+                worksheet.iter_rows(), choose_column, chunk_size, whole_floats_as_int=True, stats=stats
+            )
+        finally:
+            workbook.close()
+        _record_extent(file_path, sheet, stats)
+
+
+class ProjectedXlsxReader(ReaderBackend):
+    """
+    Built-in column-projected xlsx reader (sheet_scan).
+    """
+
+    name = "projected"
+    extensions = (".xlsx",)
+
+    def sheet_names(self, file_path):
+        return xlsx_sheet_names(file_path)
+
+    def iter_column(self, file_path, choose_column, chunk_size, stats=None, sheet=None):
+        return iter_xlsx_column(file_path, choose_column, chunk_size, blank=BLANK, stats=stats, sheet=sheet)
+
+
+class OpenpyxlReader(ReaderBackend):
+    """
+    openpyxl read-only reader.
+    """
+
+    name = "openpyxl"
+    extensions = (".xlsx",)
+
+    def sheet_names(self, file_path):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return [worksheet.title for worksheet in workbook.worksheets]
+        finally:
+            workbook.close()
+
+    def iter_column(self, file_path, choose_column, chunk_size, stats=None, sheet=None):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            worksheets = [ws for ws in workbook.worksheets if sheet is None or ws.title == sheet]
+            if not worksheets:
+                raise ValueError(f"Workbook has no worksheet {sheet!r}")
+            rows = worksheets[0].iter_rows(values_only=True)
+            yield from _column_blocks(rows, choose_column, chunk_size, stats=stats)
+        finally:
+            workbook.close()
+        _record_extent(file_path, sheet, stats)
+
+
+class XlrdReader(ReaderBackend):
+    """
+    xlrd reader for legacy .xls files.
+    """
+
+    name = "xlrd"
+    extensions = (".xls",)
+    streaming = False
+
+    def sheet_names(self, file_path):
+        import xlrd
+
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            return workbook.sheet_names()
+        finally:
+            workbook.release_resources()
+
+    def iter_column(self, file_path, choose_column, chunk_size, stats=None, sheet=None):
+        import xlrd
+
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            if sheet is not None and sheet not in workbook.sheet_names():
+                raise ValueError(f"Workbook has no worksheet {sheet!r}")
+            worksheet = workbook.sheet_by_index(0) if sheet is None else workbook.sheet_by_name(sheet)
+
+            def value(cell):
+                if cell.ctype == xlrd.XL_CELL_DATE:
+                    return xlrd.xldate.xldate_as_datetime(cell.value, workbook.datemode)
+                if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                    return bool(cell.value)
+                if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+                    return None
+                return cell.value
+
+            rows = ([value(cell) for cell in worksheet.row(index)] for index in range(worksheet.nrows))
+            yield from _column_blocks(rows, choose_column, chunk_size, whole_floats_as_int=True, stats=stats)
+        finally:
+            workbook.release_resources()
+        _record_extent(file_path, sheet, stats)
+
+
+READER_BACKENDS: Dict[str, ReaderBackend] = {
+    backend.name: backend
+    for backend in (CalamineReader(), ProjectedXlsxReader(), OpenpyxlReader(), XlrdReader())
+}
+
+
+def available_readers(file_path: Optional[str] = None, streaming: bool = False) -> List[ReaderBackend]:
+    """
+    Installed backends in preference order
+
+    Args:
+        file_path: Only include backends that handle this file (optional)
+        streaming: Only include backends that stream rows
+
+    Returns:
+        List[ReaderBackend]: Backends, fastest first
+    """
+    backends = [READER_BACKENDS[name] for name in READER_BACKEND_ORDER if name in READER_BACKENDS]
+    return [
+        backend for backend in backends
+        if backend.is_available()
+        and (file_path is None or backend.handles(file_path))
+        and (backend.streaming or not streaming)
+    ]
+
+
+def select_reader(file_path: str, name: Optional[str] = None, streaming: bool = False) -> ReaderBackend:
+    """
+    Pick the backend for a file
+
+    Args:
+        file_path: Path to spreadsheet
+        name: Backend to use instead of the fastest available (optional)
+        streaming: Prefer the fastest backend that streams rows; formats no
+                   streaming backend handles fall back to the fastest one
+
+    Returns:
+        ReaderBackend: Backend to read the file with
+
+    Raises:
+        ValueError: If the named backend is unknown, not installed or can't read
+                    the file, or no installed backend handles the format
+
+    Example:
+        >>> select_reader("orders.xlsx").name
+        'projected'
+    """
+    if name is not None:
+        backend = READER_BACKENDS.get(name)
+        if backend is None or not backend.is_available() or not backend.handles(file_path):
+            raise ValueError(f"Reader backend '{name}' can't read {os.path.basename(file_path)}")
+        return backend
+
+    backends = (streaming and available_readers(file_path, streaming=True)) or available_readers(file_path)
+    if not backends:
+        raise ValueError(f"No reader backend for {os.path.basename(file_path)}")
+    return backends[0]
@@ -0,0 +1,493 @@
+"""
+Sheet Scanning
+
+Low-level readers that look at an Excel file without building a workbook
+or DataFrame:
+
+- xlsx_dimensions / xls_dimensions: the sheet's stored extent, read from
+  the xlsx <dimension> element or the BIFF DIMENSIONS record (a few KB of
+  the file; used to pick an ingestion strategy and to detect padding)
+- xlsx_sheet_names: the worksheets of an .xlsx file, from the workbook part
+- iter_xlsx_column: column-projected streaming read of an .xlsx sheet. The
+  sheet XML is parsed incrementally and only the cells of the requested
+  column are converted to values; every other cell is skipped without
+  creating cell objects. After a long run of empty rows (formatting carried
+  down a padded sheet) the rest is only scanned as bytes until the next
+  value, so parse time follows the real rows
+
+The dimension readers and iter_xlsx_column operate on the first worksheet
+(the sheet pandas reads by default, sheet_name=0) unless a sheet name is
+given.
+"""
+
+import io
+import re
+import struct
+import zipfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from xml.etree.ElementTree import XMLPullParser, iterparse
+
+from src.utils.constants import EXTENT_EMPTY_RUN_ROWS
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_DIMENSION_PATTERN = re.compile(rb'<(?:\w+:)?dimension\s+ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"')
+_DIMENSION_SCAN_BYTES = 64 * 1024  # <dimension> precedes <sheetData>; it's always near the start
+_PROLOGUE_PATTERN = re.compile(
+    rb"(?P<worksheet><(?:\w+:)?worksheet\b[^>]*>).*?(?P<sheet_data><(?P<prefix>\w+:)?sheetData\b[^>]*?(?<!/)>)",
+    re.DOTALL
+)
+_SHEET_READ_BYTES = 64 * 1024
+_SCAN_OVERLAP_BYTES = 64  # Carried between scanned chunks so a tag split across them is still found
+
+# BIFF record types
+_BIFF_BOUNDSHEET = 0x0085
+_BIFF_DIMENSIONS = 0x0200
+_BIFF_EOF = 0x000A
+
+
+def column_index(letters: str) -> int:
+    """
+    Convert column letters to a 0-based index
+
+    Example:
+        >>> column_index("AB")
+        27
+    """
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - 64)
+    return index - 1
+
+
+def _worksheet_paths(archive: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """
+    Find the worksheets and the shared-strings part in an xlsx package
+
+    Returns:
+        Tuple[List[Tuple[str, str]], Optional[str]]: ([(sheet name, part name)]
+        in workbook order, chart sheets excluded; shared strings part name or None)
+    """
+    workbook = archive.read("xl/workbook.xml")
+    rels = archive.read("xl/_rels/workbook.xml.rels")
+
+    targets: Dict[str, str] = {}
+    shared_strings = None
+    for _, element in iterparse(io.BytesIO(rels)):
+        if element.tag == f"{_PKG_REL_NS}Relationship":
+            target = element.get("Target", "")
+            target = target.lstrip("/") if target.startswith("/") else "xl/" + target
+            if element.get("Type", "").endswith("/worksheet"):
+                targets[element.get("Id", "")] = target
+            elif element.get("Type", "").endswith("/sharedStrings"):
+                shared_strings = target
+
+    sheets = [
+        (element.get("name", ""), targets[element.get(f"{_REL_NS}id")])
+        for _, element in iterparse(io.BytesIO(workbook))
+        if element.tag == f"{_MAIN_NS}sheet" and element.get(f"{_REL_NS}id") in targets
+    ]
+    return sheets, shared_strings
+
+
+def _sheet_paths(archive: zipfile.ZipFile, sheet: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Find one worksheet (the first one by default) and the shared-strings part
+
+    Returns:
+        Tuple[str, Optional[str]]: (sheet part name, shared strings part name or None)
+
+    Raises:
+        ValueError: If the workbook has no worksheets or none named `sheet`
+    """
+    sheets, shared_strings = _worksheet_paths(archive)
+    for name, path in sheets:
+        if sheet is None or name == sheet:
+            return path, shared_strings
+    raise ValueError(f"Workbook has no worksheet {sheet!r}" if sheet is not None else "Workbook has no worksheets")
+
+
+def xlsx_sheet_names(file_path: str) -> List[str]:
+    """
+    List an .xlsx file's worksheets in workbook order (chart sheets excluded)
+
+    Only the workbook part is read; no sheet is opened.
+
+    Args:
+        file_path: Path to .xlsx file
+
+    Returns:
+        List[str]: Worksheet names
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        return [name for name, _ in _worksheet_paths(archive)[0]]
+
+
+def xlsx_dimensions(file_path: str, sheet: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """
+    Read an .xlsx sheet's stored extent from its <dimension> element
+
+    Args:
+        file_path: Path to .xlsx file
+        sheet: Worksheet name (default: the first worksheet)
+
+    Returns:
+        Optional[Tuple[int, int]]: (rows, columns) including the header row,
+                                   or None if the sheet doesn't record it
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        sheet_path, _ = _sheet_paths(archive, sheet)
+        with archive.open(sheet_path) as part:
+            head = part.read(_DIMENSION_SCAN_BYTES)
+
+    match = _DIMENSION_PATTERN.search(head)
+    if match is None:
+        return None
+    first_col, first_row, last_col, last_row = match.groups()
+    if last_col is None:
+        # Single-cell ref such as "A1" (how writers describe an empty sheet)
+        last_col, last_row = first_col, first_row
+    rows = int(last_row) - int(first_row) + 1
+    columns = column_index(last_col.decode()) - column_index(first_col.decode()) + 1
+    return rows, columns
+
+
+def _boundsheet_name(body: bytes) -> Optional[str]:
+    """Sheet name of a BIFF8 BOUNDSHEET record (None if it can't be decoded)"""
+    if len(body) < 8:
+        return None
+    length, flags = body[6], body[7]
+    if flags & 1:  # UTF-16LE
+        return body[8:8 + 2 * length].decode("utf-16-le", errors="replace")
+    return body[8:8 + length].decode("latin-1")
+
+
+def xls_dimensions(file_path: str, sheet: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """
+    Read an .xls sheet's extent from its BIFF DIMENSIONS record
+
+    Only the compound-document directory, the workbook globals and the first
+    records of the sheet are read; no cells are parsed.
+
+    Args:
+        file_path: Path to .xls file
+        sheet: Worksheet name (default: the first worksheet)
+
+    Returns:
+        Optional[Tuple[int, int]]: (rows, columns) including the header row,
+                                   or None if the record can't be found
+    """
+    from xlrd.compdoc import CompDoc
+
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    compound = CompDoc(data)
+    for name in ("Workbook", "Book"):
+        stream, base, length = compound.locate_named_stream(name)
+        if stream is not None:
+            break
+    else:
+        return None
+    end = base + length
+
+    def records(position: int) -> Iterator[Tuple[int, int, bytes]]:
+        while position + 4 <= end:
+            record_type, size = struct.unpack_from("<HH", stream, position)
+            yield record_type, position, stream[position + 4:position + 4 + size]
+            position += 4 + size
+
+    sheet_offset = None
+    for record_type, _, body in records(base):
+        if record_type == _BIFF_BOUNDSHEET and len(body) >= 6 and body[5] == 0:  # 0 = worksheet
+            if sheet is None or _boundsheet_name(body) == sheet:
+                sheet_offset = struct.unpack_from("<I", body)[0]
+                break
+        if record_type == _BIFF_EOF:
+            break
+    if sheet_offset is None:
+        return None
+
+    for record_type, _, body in records(base + sheet_offset):
+        if record_type == _BIFF_DIMENSIONS:
+            if len(body) >= 14:  # BIFF8: 32-bit row indices
+                first_row, last_row, first_col, last_col = struct.unpack_from("<IIHH", body)
+            else:  # BIFF5/7: 16-bit row indices
+                first_row, last_row, first_col, last_col = struct.unpack_from("<HHHH", body)
+            return last_row - first_row, last_col - first_col  # "last" values are exclusive
+        if record_type == _BIFF_EOF:
+            break
+    return None
+
+
+def _shared_strings(archive: zipfile.ZipFile, part: Optional[str]) -> List[str]:
+    """Load the shared-string table (rich-text runs joined, phonetic runs skipped)"""
+    if part is None:
+        return []
+
+    strings: List[str] = []
+    root = None
+    with archive.open(part) as stream:
+        for event, element in iterparse(stream, events=("start", "end")):
+            if root is None:
+                root = element
+            elif event == "end" and element.tag == f"{_MAIN_NS}si":
+                strings.append(_string_item_text(element))
+                root.clear()  # Drop parsed items so memory stays flat
+    return strings
+
+
+def _string_item_text(item) -> str:
+    """Text of an <si> or <is> element"""
+    parts = []
+    for child in item:
+        if child.tag == f"{_MAIN_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_MAIN_NS}r":
+            run_text = child.find(f"{_MAIN_NS}t")
+            if run_text is not None:
+                parts.append(run_text.text or "")
+    return "".join(parts)
+
+
+def _cell_text(cell, shared: List[str]) -> Optional[str]:
+    """
+    Convert a cell to the text pandas/openpyxl would produce (None if empty)
+
+    Numbers are converted to int or float first so "123" stays "123" and
+    "1.50" becomes "1.5", matching str() of the openpyxl value.
+    """
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{_MAIN_NS}is")
+        return _string_item_text(inline) if inline is not None else None
+
+    value = cell.find(f"{_MAIN_NS}v")
+    if value is None or value.text is None:
+        return None
+    text = value.text
+    if cell_type == "s":
+        return shared[int(text)]
+    if cell_type == "b":
+        return "True" if text == "1" else "False"
+    if cell_type == "n":
+        # Same conversion as openpyxl: float only if the text looks like one
+        try:
+            return str(float(text)) if any(mark in text for mark in ".Ee") else str(int(text))
+        except ValueError:
+            return text
+    return text  # str (formula result), e (error), d (ISO date)
+
+
+def _cell_column(cell, position: int) -> int:
+    """0-based column of a cell (writers may omit the reference; then it's the position)"""
+    reference = cell.get("r")
+    return column_index(reference.rstrip("0123456789")) if reference else position
+
+
+def _row_open_tag(prefix: bytes) -> "re.Pattern[bytes]":
+    """Pattern for a row start tag (group 1: its r attribute, if any)"""
+    return re.compile(rb"<" + prefix + rb'row(?=[\s>/])(?:[^>]*?\sr="(\d+)")?')
+
+
+def _scan_empty_tail(
+    chunks: Iterator[bytes],
+    carry: bytes,
+    prefix: bytes
+) -> Tuple[Optional[bytes], int, int]:
+    """
+    Scan raw sheet XML for the next row that holds a value, without parsing it
+
+    Args:
+        chunks: Remaining decompressed sheet bytes
+        carry: Unparsed bytes that precede the chunks (starting at a row tag)
+        prefix: Namespace prefix of the sheet's elements (b"" or b"x:")
+
+    Returns:
+        Tuple: (bytes from the start tag of the first row with a value, or None
+                if no value follows; highest row number seen; bytes scanned)
+    """
+    row_tag = b"<" + prefix + b"row"
+    row_pattern = _row_open_tag(prefix)
+    value_pattern = re.compile(rb"<" + prefix + rb"(?:v|is)[\s>]")
+
+    def last_row_start(buffer: bytes, end: int):
+        """Last row start tag before `end` (rows are in order, so it has the highest number)"""
+        position = buffer.rfind(row_tag, 0, end)
+        while position >= 0:
+            match = row_pattern.match(buffer, position)
+            if match:
+                return match
+            position = buffer.rfind(row_tag, 0, position)  # e.g. <rowBreaks>
+        return None
+
+    last_row = 0
+    scanned = 0
+    buffer = carry
+    for data in chunks:
+        scanned += len(data)
+        buffer += data
+        value = value_pattern.search(buffer)
+        row_start = last_row_start(buffer, value.start() if value else len(buffer))
+        if row_start is not None and row_start.group(1):
+            last_row = max(last_row, int(row_start.group(1)))
+        if value is not None and row_start is not None:
+            return buffer[row_start.start():], last_row, scanned
+        # Keep the last (possibly incomplete) row: its value may be in the next chunk
+        buffer = buffer[row_start.start():] if row_start is not None else buffer[-_SCAN_OVERLAP_BYTES:]
+    return None, last_row, scanned
+
+
+def iter_xlsx_column(
+    file_path: str,
+    choose_column: Callable[[List[str]], Optional[int]],
+    chunk_size: int,
+    blank: str = "nan",
+    empty_run: int = EXTENT_EMPTY_RUN_ROWS,
+    stats: Optional[Dict[str, int]] = None,
+    sheet: Optional[str] = None
+) -> Iterator[List[str]]:
+    """
+    Stream one column of an .xlsx sheet in blocks
+
+    The first row is the header; choose_column picks the column from its
+    texts. Rows are yielded in sheet order; a data row without a value in
+    the column yields `blank`, and rows after the last non-empty row are
+    ignored (same rules as the openpyxl-based reader).
+
+    Padded sheets: after `empty_run` consecutive empty rows the rest of the
+    sheet is only scanned as bytes for the next value; formatted-but-empty
+    rows are never built into elements. Parsing resumes at the row holding
+    the value, so data after a long gap is still read.
+
+    Args:
+        file_path: Path to .xlsx file
+        choose_column: Function(header texts) → 0-based column index, or None
+        chunk_size: Maximum values per block
+        blank: Text for an empty cell in a data row
+        empty_run: Empty rows after which the rest is scanned instead of parsed
+        stats: Optional dict filled with 'last_data_row' (sheet row number),
+               'last_row' (last row element, data or not) and 'scanned_bytes'
+               (bytes skipped over without parsing)
+        sheet: Worksheet name (default: the first worksheet)
+
+    Yields:
+        List[str]: Column values
+
+    Raises:
+        LookupError: If choose_column returns None
+        ValueError: If the workbook has no worksheet named `sheet`
+        ValueError / zipfile.BadZipFile / xml errors: If the file is malformed
+    """
+    cell_tag, value_tag, row_tag = f"{_MAIN_NS}c", f"{_MAIN_NS}v", f"{_MAIN_NS}row"
+    stats = {} if stats is None else stats
+    stats.update(last_data_row=0, last_row=0, scanned_bytes=0)
+
+    with zipfile.ZipFile(file_path) as archive:
+        sheet_path, strings_path = _sheet_paths(archive, sheet)
+        shared = _shared_strings(archive, strings_path)
+
+        column: Optional[int] = None
+        sheet_data = None
+        last_row_number = 0
+        pending_blank = 0  # Empty rows only count if data follows them
+        numbered = True  # Skipping relies on every row carrying its r attribute
+        block: List[str] = []
+
+        with archive.open(sheet_path) as part:
+            chunks = iter(lambda: part.read(_SHEET_READ_BYTES), b"")
+            parser = XMLPullParser(events=("start", "end"))
+            head = b""  # Start of the sheet, until the <sheetData> tag is seen
+            prologue: Optional[bytes] = None  # <worksheet ...><sheetData ...> tags, for resuming
+            prefix = b""
+            fed = b""  # Last chunk fed to the parser
+
+            while True:
+                carry = None
+                if numbered and prologue is not None and column is not None and pending_blank >= empty_run:
+                    # Unparsed rest of the last chunk, from its last row tag
+                    for match in _row_open_tag(prefix).finditer(fed):
+                        carry = fed[match.start():]
+
+                if carry is not None:
+                    # Long empty run: look for the next value without parsing
+                    resume, last_seen, scanned = _scan_empty_tail(chunks, carry, prefix)
+                    stats['scanned_bytes'] += scanned
+                    stats['last_row'] = max(stats['last_row'], last_seen)
+                    if resume is None:
+                        break
+                    parser = XMLPullParser(events=("start", "end"))
+                    parser.feed(prologue)
+                    data = resume
+                else:
+                    data = next(chunks, b"")
+                    if not data:
+                        break
+
+                if prologue is None and len(head) < _DIMENSION_SCAN_BYTES:
+                    head += data
+                    match = _PROLOGUE_PATTERN.search(head)
+                    if match:
+                        prologue = match.group('worksheet') + match.group('sheet_data')
+                        prefix = match.group('prefix') or b""
+
+                fed = data
+                parser.feed(data)
+                for event, element in parser.read_events():
+                    if event == "start":
+                        if element.tag == f"{_MAIN_NS}sheetData":
+                            sheet_data = element
+                        continue
+                    if element.tag != row_tag:
+                        continue
+
+                    reference = element.get("r")
+                    numbered = numbered and reference is not None
+                    row_number = int(reference) if reference else last_row_number + 1
+                    if row_number <= last_row_number:
+                        sheet_data.clear()  # Already handled before a resume
+                        continue
+                    gap = row_number - last_row_number - 1
+                    last_row_number = row_number
+                    stats['last_row'] = max(stats['last_row'], row_number)
+
+                    if column is None:
+                        header: List[str] = []
+                        for position, cell in enumerate(element.iter(cell_tag)):
+                            index = _cell_column(cell, position)
+                            header.extend([""] * (index - len(header)))
+                            header.append((_cell_text(cell, shared) or "").strip())
+                        column = choose_column(header)
+                        if column is None:
+                            raise LookupError(f"Column not found in header: {header}")
+                        sheet_data.clear()
+                        stats['last_data_row'] = row_number
+                        continue
+
+                    # Only the projected column is converted; other cells are only checked for presence
+                    value = None
+                    has_value = False
+                    for position, cell in enumerate(element.iter(cell_tag)):
+                        if not has_value and (cell.find(value_tag) is not None or cell.get("t") == "inlineStr"):
+                            has_value = True
+                        if value is None and _cell_column(cell, position) == column:
+                            value = _cell_text(cell, shared)
+                    sheet_data.clear()  # Drop parsed rows so memory stays flat
+
+                    pending_blank += gap
+                    if not has_value:
+                        pending_blank += 1
+                        continue
+
+                    for text in [blank] * pending_blank + [blank if value is None else value]:
+                        block.append(text)
+                        if len(block) == chunk_size:
+                            yield block
+                            block = []
+                    pending_blank = 0
+                    stats['last_data_row'] = row_number
+
+        if block:
+            yield block
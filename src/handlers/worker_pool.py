@@ -0,0 +1,234 @@
+"""
+Warm Worker Pool
+
+This module keeps a pool of worker processes running for spreadsheet work,
+so repeated tasks don't each pay for interpreter startup and the pandas /
+openpyxl imports (~0.3-1 s per fresh process):
+
+- Workers are started with "spawn" and warmed once by an initializer that
+  imports the spreadsheet libraries and runs every reader backend and the
+  exporter on a one-row workbook
+- Tasks are sent over the executor's pipes: parse (one worksheet's
+  주문고유코드 column, parallel_ingest.read_source) and export (the
+  3-column output, ExcelExportHandler.create_output_streaming)
+- Codes and numbers travel as CompactStrings / CompactNumbers, which pickle
+  as their raw buffers, so no DataFrame or per-row objects are pickled
+- A pool broken by a dying worker is restarted on the next submit; tasks
+  that were running on it fail with BrokenProcessPool
+
+Usage:
+- get_worker_pool() returns the application-wide pool, starting it (in the
+  background) on first use; shutdown_worker_pool() stops it
+- parallel_ingest.ingest_files(..., pool=pool) runs multi-file batches on it
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Sequence
+
+from src.core.compact import CompactNumbers, CompactStrings
+from src.handlers.parallel_ingest import SourceCodes, read_source
+from src.handlers.reader_backends import available_readers
+from src.utils.constants import WORKER_POOL_MAX_WORKERS, PIPELINE_CHUNK_SIZE
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _warm_up() -> None:
+    """Worker initializer: import the spreadsheet libraries and run each reader once"""
+    import xlrd  # noqa: F401  The .xls reader imports it on first use
+    from src.handlers.excel_exporter import ExcelExportHandler  # pandas, openpyxl
+
+    with tempfile.TemporaryDirectory(prefix="warm_") as workdir:
+        path = os.path.join(workdir, "warm.xlsx")
+        ExcelExportHandler.write_row_chunks([(["A"], ["20250101000001"])], path)
+        for backend in available_readers(path):
+            for _ in backend.iter_column(path, lambda header: 0, 1):
+                pass
+
+
+def _export(codes: CompactStrings, numbers: CompactNumbers, output_path: str, apply_formatting: bool) -> int:
+    """Write the 3-column output (runs in a worker process)"""
+    from src.handlers.excel_exporter import ExcelExportHandler
+
+    return ExcelExportHandler.create_output_streaming(
+        codes, numbers.chunks(PIPELINE_CHUNK_SIZE), output_path, apply_formatting
+    )
+
+
+class WorkerPool:
+    """
+    Persistent pool of warmed-up worker processes for parse and export tasks.
+    """
+
+    def __init__(self, max_workers: Optional[int] = WORKER_POOL_MAX_WORKERS):
+        """
+        Initialize pool (processes start with start() or the first task)
+
+        Args:
+            max_workers: Worker processes (None: one per CPU core)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """True once the workers have been started (and not shut down)"""
+        return self._executor is not None
+
+    def start(self, wait_ready: bool = True) -> "WorkerPool":
+        """
+        Start and warm every worker (no-op if already running)
+
+        Args:
+            wait_ready: Block until every worker has finished warming up
+
+        Returns:
+            WorkerPool: self
+        """
+        with self._lock:
+            if self._executor is not None:
+                return self
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up
+            )
+            # Workers spawn one per submit while none is idle: one task each starts them all
+            warming = [self._executor.submit(os.getpid) for _ in range(self.max_workers)]
+
+        if wait_ready:
+            wait(warming)
+            logger.info(f"Worker pool ready: {len({future.result() for future in warming})} processes")
+        return self
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Run a module-level function in a worker
+
+        Args:
+            fn: Picklable (module-level) function
+            *args, **kwargs: Its arguments (pickled)
+
+        Returns:
+            Future: The function's result
+        """
+        self.start(wait_ready=False)
+        with self._lock:
+            executor = self._executor
+        try:
+            return executor.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            logger.warning("Worker pool broken (a worker process died); restarting it")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.start(wait_ready=False)
+            return self._executor.submit(fn, *args, **kwargs)
+
+    def submit_parse(self, file_path: str, sheet: Optional[str] = None, backend: Optional[str] = None) -> Future:
+        """
+        Read one worksheet's special codes in a worker
+
+        Args:
+            file_path: Input file
+            sheet: Worksheet name (default: the first worksheet)
+            backend: Reader backend name (default: the fastest available)
+
+        Returns:
+            Future: Resolves to SourceCodes (never raises for unreadable files;
+                    see its status and error)
+        """
+        return self.submit(read_source, file_path, sheet, backend)
+
+    def parse(self, file_path: str, sheet: Optional[str] = None, backend: Optional[str] = None) -> SourceCodes:
+        """
+        Read one worksheet's special codes in a worker and wait for them
+
+        Example:
+            >>> pool = WorkerPool().start()
+            >>> result = pool.parse("orders.xlsx")
+            >>> result.status, len(result.codes)
+            ('ok', 240)
+        """
+        return self.submit_parse(file_path, sheet, backend).result()
+
+    def submit_export(
+        self,
+        special_codes: Sequence[str],
+        tracking_numbers: Sequence[str],
+        output_path: str,
+        apply_formatting: bool = True
+    ) -> Future:
+        """
+        Write a 3-column output file in a worker
+
+        Args:
+            special_codes: Special codes in row order
+            tracking_numbers: Tracking numbers in row order
+            output_path: Path to save output file
+            apply_formatting: Apply Excel formatting (default: True)
+
+        Returns:
+            Future: Resolves to rows written; raises ExcelExportError like
+                    ExcelExportHandler.create_output_streaming
+        """
+        codes = special_codes if isinstance(special_codes, CompactStrings) else CompactStrings(special_codes)
+        numbers = tracking_numbers if isinstance(tracking_numbers, CompactNumbers) else CompactNumbers(tracking_numbers)
+        return self.submit(_export, codes, numbers, output_path, apply_formatting)
+
+    def export(
+        self,
+        special_codes: Sequence[str],
+        tracking_numbers: Sequence[str],
+        output_path: str,
+        apply_formatting: bool = True
+    ) -> int:
+        """Write a 3-column output file in a worker and wait for it (see submit_export)"""
+        return self.submit_export(special_codes, tracking_numbers, output_path, apply_formatting).result()
+
+    def shutdown(self, wait_done: bool = True) -> None:
+        """
+        Stop the workers
+
+        Args:
+            wait_done: Wait for running tasks to finish (pending ones are cancelled)
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait_done, cancel_futures=True)
+            logger.info("Worker pool stopped")
+
+
+# Singleton instance for application-wide use
+_pool_instance = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """
+    Get singleton instance of WorkerPool, starting its workers in the background
+
+    Returns:
+        WorkerPool: Global worker pool
+    """
+    global _pool_instance
+    if _pool_instance is None:
+        with _pool_lock:
+            if _pool_instance is None:
+                _pool_instance = WorkerPool().start(wait_ready=False)
+    return _pool_instance
+
+
+def shutdown_worker_pool() -> None:
+    """Stop the singleton's workers, if it was created"""
+    if _pool_instance is not None:
+        _pool_instance.shutdown()
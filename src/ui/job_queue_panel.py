@@ -0,0 +1,241 @@
+"""
+Job Queue Panel
+
+This module contains the multi-file panel shown under the single-file
+workflow: operators drop (or pick) a morning's marketplace exports, press
+one button, and every file is numbered and saved in parallel.
+
+UI Components:
+- Drop area / table with one row per file: name, status, progress
+- Summary label (pending / running / done / failed)
+- Buttons: add files, process all (asks once for the output folder),
+  clear finished rows
+
+The panel stays disabled until MainWindow's startup initialization is done;
+the JobQueue is created on first use and only starts the worker pool (and
+imports pandas / openpyxl) when a job runs, so the first window paint stays fast.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QProgressBar,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog
+)
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QDragEnterEvent, QDropEvent
+
+from src.handlers.job_queue import Job, JobQueue, JobStatus
+from src.utils.constants import SUPPORTED_FORMATS, MSG_JOBS_DROP_HINT, MSG_JOBS_SUMMARY
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STATUS_TEXT = {
+    JobStatus.PENDING: "⏳ 대기",
+    JobStatus.RUNNING: "🔄 진행 중",
+    JobStatus.DONE: "✅ 완료",
+    JobStatus.FAILED: "❌ 실패",
+}
+
+
+class JobQueuePanel(QWidget):
+    """
+    Drag-and-drop list of files processed together by a JobQueue.
+
+    Signals:
+        job_updated(object): Re-emits JobQueue updates so they reach the UI thread
+    """
+
+    job_updated = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """
+        Initialize panel (disabled until set_ready is called)
+
+        Args:
+            parent: Parent widget (optional)
+        """
+        super().__init__(parent)
+        self.job_queue: Optional[JobQueue] = None
+        self._rows: Dict[int, int] = {}  # job_id → table row
+        self._progress: Dict[int, QProgressBar] = {}
+
+        self.setAcceptDrops(True)
+        self.init_ui()
+        self.job_updated.connect(self.on_job_updated)
+        self.setEnabled(False)
+
+    def init_ui(self) -> None:
+        """Initialize user interface"""
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        self.hint_label = QLabel(MSG_JOBS_DROP_HINT)
+        self.hint_label.setObjectName("statusLabel")
+        self.hint_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.hint_label)
+
+        self.table = QTableWidget(0, 3)
+        self.table.setHorizontalHeaderLabels(["파일", "상태", "진행"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        layout.addWidget(self.table)
+
+        self.summary_label = QLabel(MSG_JOBS_SUMMARY.format(0, 0, 0, 0))
+        self.summary_label.setObjectName("statusLabel")
+        self.summary_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.summary_label)
+
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(8)
+
+        self.add_btn = QPushButton("📁 파일 추가")
+        self.add_btn.setObjectName("secondaryButton")
+        self.add_btn.clicked.connect(self.handle_add)
+        self.add_btn.setCursor(Qt.PointingHandCursor)
+        button_layout.addWidget(self.add_btn)
+
+        self.run_btn = QPushButton("▶ 모두 처리")
+        self.run_btn.setEnabled(False)
+        self.run_btn.clicked.connect(self.handle_run)
+        self.run_btn.setCursor(Qt.PointingHandCursor)
+        button_layout.addWidget(self.run_btn)
+
+        self.clear_btn = QPushButton("🧹 완료 항목 지우기")
+        self.clear_btn.setObjectName("secondaryButton")
+        self.clear_btn.setEnabled(False)
+        self.clear_btn.clicked.connect(self.handle_clear)
+        self.clear_btn.setCursor(Qt.PointingHandCursor)
+        button_layout.addWidget(self.clear_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def set_ready(self) -> None:
+        """Enable the panel once heavy modules and the history are loaded"""
+        self.setEnabled(True)
+
+    def _queue(self) -> JobQueue:
+        """Get the job queue, creating it on first use"""
+        if self.job_queue is None:
+            self.job_queue = JobQueue(on_update=self.job_updated.emit)
+        return self.job_queue
+
+    @staticmethod
+    def _supported(paths: List[str]) -> List[str]:
+        """Keep local Excel files"""
+        return [path for path in paths if os.path.splitext(path)[1].lower() in SUPPORTED_FORMATS]
+
+    def dragEnterEvent(self, event: QDragEnterEvent) -> None:
+        """Accept drags that carry at least one Excel file"""
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        if self.isEnabled() and self._supported(paths):
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event: QDropEvent) -> None:
+        """Queue dropped Excel files"""
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        self.add_files(self._supported(paths))
+        event.acceptProposedAction()
+
+    def handle_add(self) -> None:
+        """Handle add-files button click"""
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Excel 파일 선택",
+            "",
+            "Excel Files (*.xls *.xlsx);;All Files (*)"
+        )
+        if paths:
+            self.add_files(paths)
+
+    def add_files(self, paths: List[str]) -> None:
+        """
+        Queue files and add their rows
+
+        Args:
+            paths: Input file paths
+        """
+        for job in self._queue().add(paths):
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            name_item = QTableWidgetItem(job.name)
+            name_item.setToolTip(job.input_path)
+            name_item.setData(Qt.UserRole, job.job_id)
+            self.table.setItem(row, 0, name_item)
+            self.table.setItem(row, 1, QTableWidgetItem(_STATUS_TEXT[job.status]))
+
+            progress = QProgressBar()
+            progress.setTextVisible(True)
+            progress.setValue(0)
+            self.table.setCellWidget(row, 2, progress)
+
+            self._rows[job.job_id] = row
+            self._progress[job.job_id] = progress
+        self.update_summary()
+
+    def handle_run(self) -> None:
+        """Handle process-all button click"""
+        output_dir = QFileDialog.getExistingDirectory(self, "저장할 폴더 선택", "")
+        if not output_dir:
+            logger.info("Output folder selection cancelled")
+            return
+        self._queue().run(output_dir)
+        self.update_summary()
+
+    def handle_clear(self) -> None:
+        """Handle clear-finished button click"""
+        if self.job_queue is None:
+            return
+        self.job_queue.clear_finished()
+        remaining = {job.job_id for job in self.job_queue.jobs}
+        for job_id in sorted(set(self._rows) - remaining, key=self._rows.get, reverse=True):
+            self.table.removeRow(self._rows.pop(job_id))
+            self._progress.pop(job_id)
+        # Rows below the removed ones moved up
+        self._rows = {self.table.item(row, 0).data(Qt.UserRole): row for row in range(self.table.rowCount())}
+        self.update_summary()
+
+    def on_job_updated(self, job: Job) -> None:
+        """Show a job's status and progress (UI thread)"""
+        row = self._rows.get(job.job_id)
+        if row is None:
+            return
+
+        status_item = self.table.item(row, 1)
+        status_item.setText(_STATUS_TEXT[job.status])
+        if job.error:
+            status_item.setToolTip(job.error)
+        elif job.status == JobStatus.DONE:
+            status_item.setToolTip(job.output_path)
+
+        progress = self._progress[job.job_id]
+        progress.setMaximum(job.total)  # 0 = busy indicator while the size is unknown
+        progress.setValue(job.current)
+        self.update_summary()
+
+    def update_summary(self) -> None:
+        """Refresh the status counts and button states"""
+        if self.job_queue is None:
+            return
+        counts = self.job_queue.summary()
+        self.summary_label.setText(MSG_JOBS_SUMMARY.format(
+            counts[JobStatus.PENDING], counts[JobStatus.RUNNING], counts[JobStatus.DONE], counts[JobStatus.FAILED]
+        ))
+        unstarted = any(job.output_path is None for job in self.job_queue.jobs)
+        self.run_btn.setEnabled(unstarted)
+        self.clear_btn.setEnabled(counts[JobStatus.DONE] + counts[JobStatus.FAILED] > 0)
+
+    def shutdown(self) -> None:
+        """Finish running jobs and stop the workers (call before the history is flushed)"""
+        if self.job_queue is not None:
+            self.job_queue.shutdown()
@@ -6,55 +6,106 @@ Follows shadcn/ui + Tailwind CSS design principles for modern, professional appe
 
 Architecture:
 - Main window with centered layout
+- Window paints first; pandas/openpyxl and the uniqueness history load in a
+  startup thread afterwards, and the action buttons stay disabled until ready
 - Worker thread for background number generation (prevents UI freezing)
 - Three-step workflow: Upload → Generate → Download
+- Speculative generation: numbers for a loaded file are reserved in the
+  background and committed instantly on Generate (released on a new file)
+- Compact session state: only the order codes (one UTF-8 buffer) and the
+  numbers (64-bit integers) are kept between steps; the DataFrame is
+  released right after upload
 - Progress tracking with real-time updates
 - Professional error handling with user-friendly messages
+- Job-queue panel: many dropped files processed in parallel in one action,
+  sharing the uniqueness store with the single-file workflow
 
 UI Components:
 - Title label with company name
 - Status label with dynamic messaging
 - Progress bar for generation tracking
 - Three action buttons with enabled/disabled states
+- Tabs: order preview (QTableView on a lazy OrderPreviewModel showing
+  codes and their tracking numbers) and the job-queue panel (JobQueuePanel)
+  with per-file status and progress
 - File dialogs for input/output file selection
 """
 
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QProgressBar, QFileDialog,
-    QMessageBox, QApplication
+    QMessageBox, QApplication, QTableView, QHeaderView,
+    QAbstractItemView, QTabWidget
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QCloseEvent
 
-import pandas as pd
-
 from src.core.tracking_generator import TrackingNumberGenerator
-from src.core.uniqueness_checker import get_uniqueness_checker
-from src.handlers.excel_uploader import ExcelUploadHandler, ExcelUploadError
-from src.handlers.excel_exporter import ExcelExportHandler, ExcelExportError
+from src.core.uniqueness_checker import get_uniqueness_checker, shutdown_uniqueness_checker
+from src.core.speculation import SpeculativeBatch
+from src.core.compact import CompactStrings, CompactNumbers
+from src.handlers.worker_pool import shutdown_worker_pool
+from src.ui.job_queue_panel import JobQueuePanel
+from src.ui.preview_model import OrderPreviewModel
 from src.utils.constants import (
     APP_NAME,
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     WINDOW_MIN_WIDTH,
     WINDOW_MIN_HEIGHT,
+    MSG_STARTING,
     MSG_INITIAL,
     MSG_FILE_LOADED,
+    MSG_CODES_EMPTY_DROPPED,
+    MSG_CODES_DUPLICATE,
     MSG_GENERATING,
     MSG_GENERATION_COMPLETE,
     MSG_FILE_SAVED,
+    ERR_STARTUP_FAILED,
+    PREVIEW_ROW_HEIGHT,
+    GENERATION_CLAIM_CHUNK_SIZE,
 )
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class StartupWorker(QThread):
+    """
+    Worker thread that performs deferred initialization after the window is shown.
+
+    Importing pandas/openpyxl (via the Excel handlers) and loading the uniqueness
+    history take seconds on a cold start; doing it here keeps the first paint
+    immediate. Python's import lock makes the handler imports in the UI thread
+    safe even if they race with this thread.
+
+    Signals:
+        ready(): Emitted once handlers are importable and the history is loaded
+        error(str): Emits error message if initialization fails
+    """
+
+    ready = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def run(self) -> None:
+        """Import heavy modules and load the history in the background"""
+        try:
+            import src.handlers.excel_uploader  # noqa: F401  (pandas)
+            import src.handlers.excel_exporter  # noqa: F401  (openpyxl)
+
+            get_uniqueness_checker()
+            self.ready.emit()
+
+        except Exception as e:
+            logger.error(f"Startup initialization failed: {e}", exc_info=True)
+            self.error.emit(str(e))
+
+
 class GenerationWorker(QThread):
     """
     Worker thread for tracking number generation to prevent UI freezing.
@@ -72,16 +123,23 @@ class GenerationWorker(QThread):
     finished = pyqtSignal(list)  # generated numbers
     error = pyqtSignal(str)  # error message
 
-    def __init__(self, count: int, parent: Optional[QWidget] = None):
+    def __init__(
+        self,
+        count: int,
+        parent: Optional[QWidget] = None,
+        speculative: Optional[SpeculativeBatch] = None
+    ):
         """
         Initialize worker thread
 
         Args:
             count: Number of tracking numbers to generate
             parent: Parent widget (optional)
+            speculative: Background reservation for this batch to commit (optional)
         """
         super().__init__(parent)
         self.count = count
+        self.speculative = speculative
 
     def run(self) -> None:
         """
@@ -91,19 +149,32 @@ class GenerationWorker(QThread):
         All UI updates must be done via signal emissions.
         """
         try:
+            progress = lambda current, total: self.progress.emit(current, total)
+
+            if self.speculative is not None and self.speculative.count == self.count:
+                # Numbers were reserved while the user looked at the file
+                self.finished.emit(self.speculative.commit(callback=progress))
+                return
+            elif self.speculative is not None:
+                # Reserved for a different batch size; release it before generating
+                self.speculative.cancel()
+
             generator = TrackingNumberGenerator()
             uniqueness_checker = get_uniqueness_checker()
 
-            # Generate with progress updates
-            numbers = generator.generate_with_progress(
+            # Fail fast if this site's shard can't hold today's batch
+            remaining = uniqueness_checker.get_remaining_capacity()
+            if self.count > remaining:
+                self.error.emit(f"오늘 생성 가능한 송장번호가 부족합니다. (남은 수량: {remaining}개)")
+                return
+
+            # Generate against a snapshot and claim each chunk in the shared history
+            numbers = generator.generate_and_register(
                 self.count,
-                used_numbers=uniqueness_checker.used_numbers,
-                callback=lambda current, total: self.progress.emit(current, total)
+                uniqueness_checker,
+                callback=progress
             )
 
-            # Register all generated numbers
-            uniqueness_checker.register_batch(numbers)
-
             self.finished.emit(numbers)
 
         except Exception as e:
@@ -125,15 +196,21 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         # Application state
-        self.current_df: Optional[pd.DataFrame] = None
-        self.special_codes: Optional[List[str]] = None
-        self.generated_numbers: Optional[List[str]] = None
+        # Session state is kept compact (the DataFrame is dropped after upload)
+        self.special_codes: Optional[CompactStrings] = None
+        self.generated_numbers: Optional[CompactNumbers] = None
         self.generation_worker: Optional[GenerationWorker] = None
+        self.speculative_batch: Optional[SpeculativeBatch] = None
+        self.startup_worker: Optional[StartupWorker] = None
+        self.is_ready = False
 
         # Initialize UI
         self.init_ui()
         self.load_stylesheet()
 
+        # Defer heavy initialization until the event loop has painted the window
+        QTimer.singleShot(0, self.start_background_init)
+
         logger.info("MainWindow initialized")
 
     def init_ui(self) -> None:
@@ -160,7 +237,7 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.title_label)
 
         # ===== Status Label =====
-        self.status_label = QLabel(MSG_INITIAL)
+        self.status_label = QLabel(MSG_STARTING)
         self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setWordWrap(True)
@@ -178,6 +255,7 @@ class MainWindow(QMainWindow):
 
         # Button 1: Upload File
         self.upload_btn = QPushButton("📂 파일 선택")
+        self.upload_btn.setEnabled(False)  # Enabled once startup initialization is done
         self.upload_btn.clicked.connect(self.handle_upload)
         self.upload_btn.setCursor(Qt.PointingHandCursor)
         button_layout.addWidget(self.upload_btn)
@@ -198,8 +276,24 @@ class MainWindow(QMainWindow):
 
         main_layout.addLayout(button_layout)
 
-        # ===== Spacer =====
-        main_layout.addStretch()
+        # ===== Tabs: Order Preview / Job Queue (many files at once) =====
+        self.tabs = QTabWidget()
+
+        self.preview_model = OrderPreviewModel(self)
+        self.preview_view = QTableView()
+        self.preview_view.setModel(self.preview_model)
+        self.preview_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.preview_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.preview_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights: the view never measures rows, so 500k rows scroll smoothly
+        self.preview_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.preview_view.verticalHeader().setDefaultSectionSize(PREVIEW_ROW_HEIGHT)
+        self.tabs.addTab(self.preview_view, "📋 미리보기")
+
+        self.job_panel = JobQueuePanel()
+        self.tabs.addTab(self.job_panel, "📚 여러 파일")
+
+        main_layout.addWidget(self.tabs, 1)
 
         # Set layout
         central_widget.setLayout(main_layout)
@@ -218,8 +312,35 @@ class MainWindow(QMainWindow):
         except Exception as e:
             logger.error(f"Failed to load stylesheet: {e}")
 
+    def start_background_init(self) -> None:
+        """Start loading heavy modules and the uniqueness history"""
+        if self.startup_worker is not None:
+            return
+
+        self.startup_worker = StartupWorker(self)
+        self.startup_worker.ready.connect(self.on_startup_ready)
+        self.startup_worker.error.connect(self.on_startup_error)
+        self.startup_worker.start()
+
+    def on_startup_ready(self) -> None:
+        """Enable the workflow once initialization is done"""
+        self.is_ready = True
+        self.status_label.setText(MSG_INITIAL)
+        self.upload_btn.setEnabled(True)
+        self.job_panel.set_ready()
+        logger.info("Startup initialization complete")
+
+    def on_startup_error(self, error_message: str) -> None:
+        """Keep the workflow disabled and report why"""
+        self.status_label.setText(ERR_STARTUP_FAILED.format(error_message))
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setStyleSheet("")
+        self.show_error("초기화 실패", ERR_STARTUP_FAILED.format(error_message))
+
     def handle_upload(self) -> None:
         """Handle file upload button click"""
+        from src.handlers.excel_uploader import ExcelUploadHandler, ExcelUploadError
+
         try:
             file_path, _ = QFileDialog.getOpenFileName(
                 self,
@@ -234,22 +355,17 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Selected file: {file_path}")
 
-            # Read Excel file
-            self.current_df = ExcelUploadHandler.read_excel(file_path)
-
-            # Detect format and validate required column
-            try:
-                ExcelUploadHandler.detect_format(self.current_df)
-            except ExcelUploadError as e:
-                self.show_error("파일 형식 오류", str(e))
-                logger.error(f"Format detection error: {e}")
-                return
+            # A new file invalidates numbers reserved for the previous one
+            self.cancel_speculative_generation()
 
-            # Extract special codes from the input
-            self.special_codes = ExcelUploadHandler.extract_special_codes(self.current_df)
+            # Keep only the special codes, packed and normalized; the reading
+            # strategy (in-memory, streaming or spilled to disk) follows the file's size
+            result = ExcelUploadHandler.load_order_codes(file_path)
+            self.special_codes = result.codes
+            logger.info(f"Session codes: {self.special_codes.nbytes / 1024:.0f} KB")
 
             # Update UI
-            row_count = len(self.current_df)
+            row_count = len(self.special_codes)
             self.status_label.setText(MSG_FILE_LOADED.format(row_count))
             self.status_label.setObjectName("statusLabelSuccess")
             self.status_label.setStyleSheet("")  # Reset style, let QSS handle it
@@ -261,7 +377,13 @@ class MainWindow(QMainWindow):
             self.download_btn.setEnabled(False)
             self.generated_numbers = None
 
+            self.preview_model.set_codes(self.special_codes)
+
+            # Start reserving this file's numbers so Generate is instant
+            self.start_speculative_generation(row_count)
+
             logger.info(f"File loaded: {row_count} rows with special codes")
+            self.report_code_issues(result)
 
         except ExcelUploadError as e:
             self.show_error("파일 로드 실패", str(e))
@@ -271,14 +393,34 @@ class MainWindow(QMainWindow):
             self.show_error("오류", f"예상치 못한 오류가 발생했습니다: {str(e)}")
             logger.error(f"Unexpected error during upload: {e}")
 
+    def report_code_issues(self, result) -> None:
+        """
+        Warn about dropped empty codes and in-file duplicates
+
+        Args:
+            result: NormalizedCodes from the upload
+        """
+        from src.core.code_normalizer import CodeIssue
+
+        summary = result.summary()
+        messages = []
+        if summary['empty']:
+            messages.append(MSG_CODES_EMPTY_DROPPED.format(summary['empty']))
+        if summary['duplicate']:
+            first_row = result.rows_with(CodeIssue.DUPLICATE)[0]
+            example = result.codes[first_row if result.source_rows is None else result.source_rows.index(first_row)]
+            messages.append(MSG_CODES_DUPLICATE.format(summary['duplicate'], example))
+        if messages:
+            self.show_warning("주문고유코드 확인", "\n".join(messages))
+
     def handle_generate(self) -> None:
         """Handle generate button click"""
-        if self.current_df is None:
+        if self.special_codes is None:
             self.show_warning("경고", "파일을 먼저 선택하세요.")
             return
 
         try:
-            row_count = len(self.current_df)
+            row_count = len(self.special_codes)
 
             # Disable buttons during generation
             self.upload_btn.setEnabled(False)
@@ -297,8 +439,9 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Starting generation for {row_count} rows")
 
-            # Start worker thread
-            self.generation_worker = GenerationWorker(row_count)
+            # Start worker thread (hands over the speculative reservation, if any)
+            speculative, self.speculative_batch = self.speculative_batch, None
+            self.generation_worker = GenerationWorker(row_count, speculative=speculative)
             self.generation_worker.progress.connect(self.on_generation_progress)
             self.generation_worker.finished.connect(self.on_generation_finished)
             self.generation_worker.error.connect(self.on_generation_error)
@@ -309,6 +452,27 @@ class MainWindow(QMainWindow):
             logger.error(f"Generation error: {e}")
             self.reset_ui_after_generation()
 
+    def start_speculative_generation(self, count: int) -> None:
+        """
+        Reserve numbers for the loaded file in the background
+
+        Args:
+            count: Rows in the loaded file
+        """
+        self.cancel_speculative_generation()
+        try:
+            self.speculative_batch = SpeculativeBatch(count, get_uniqueness_checker()).start()
+        except Exception as e:
+            # Speculation is an optimization; Generate falls back to normal generation
+            logger.warning(f"Could not start speculative generation: {e}")
+            self.speculative_batch = None
+
+    def cancel_speculative_generation(self) -> None:
+        """Release numbers reserved for a file that won't be generated"""
+        if self.speculative_batch is not None:
+            self.speculative_batch.cancel()
+            self.speculative_batch = None
+
     def on_generation_progress(self, current: int, total: int) -> None:
         """Update progress bar"""
         self.progress_bar.setValue(current)
@@ -316,7 +480,8 @@ class MainWindow(QMainWindow):
 
     def on_generation_finished(self, numbers: list) -> None:
         """Handle generation completion"""
-        self.generated_numbers = numbers
+        self.generated_numbers = CompactNumbers(numbers)
+        self.preview_model.set_numbers(self.generated_numbers)
 
         # Update UI
         self.progress_bar.setVisible(False)
@@ -341,11 +506,13 @@ class MainWindow(QMainWindow):
         """Reset UI after generation (error or cancel)"""
         self.progress_bar.setVisible(False)
         self.upload_btn.setEnabled(True)
-        self.generate_btn.setEnabled(True if self.current_df is not None else False)
+        self.generate_btn.setEnabled(self.special_codes is not None)
         self.download_btn.setEnabled(False)
 
     def handle_download(self) -> None:
         """Handle download button click"""
+        from src.handlers.excel_exporter import ExcelExportHandler, ExcelExportError
+
         if self.special_codes is None or self.generated_numbers is None:
             self.show_warning("경고", "먼저 송장을 생성하세요.")
             return
@@ -372,10 +539,17 @@ class MainWindow(QMainWindow):
 
             logger.info(f"Saving to: {file_path}")
 
-            # Export with 3-column format (special codes, delivery company, tracking numbers)
-            ExcelExportHandler.create_output(
+            # Never hand out numbers that aren't durable in the history yet
+            if not get_uniqueness_checker().flush():
+                self.show_error("저장 실패", "송장번호 이력을 저장하지 못했습니다. 디스크 상태를 확인하세요.")
+                logger.error("History flush failed; export aborted")
+                return
+
+            # Export with 3-column format (special codes, delivery company, tracking numbers),
+            # streamed from the compact session state without expanding it
+            ExcelExportHandler.create_output_streaming(
                 self.special_codes,
-                self.generated_numbers,
+                self.generated_numbers.chunks(GENERATION_CLAIM_CHUNK_SIZE),
                 file_path
             )
 
@@ -396,9 +570,10 @@ class MainWindow(QMainWindow):
 
     def reset_for_new_operation(self) -> None:
         """Reset application for next operation"""
-        self.current_df = None
+        self.cancel_speculative_generation()
         self.special_codes = None
         self.generated_numbers = None
+        self.preview_model.clear()
         self.status_label.setText(MSG_INITIAL)
         self.status_label.setObjectName("statusLabel")
         self.status_label.setStyleSheet("")
@@ -427,8 +602,18 @@ class MainWindow(QMainWindow):
 
         Note:
             Always accepts the close event. Add confirmation dialog here if needed.
+            Pending history changes are flushed before the window closes.
         """
         logger.info("Application closing")
+        if self.startup_worker is not None:
+            # Let a history load in progress finish so shutdown flushes a complete checker
+            self.startup_worker.wait()
+        self.cancel_speculative_generation()
+        # Running jobs finish (their numbers are already registered); unstarted ones are dropped
+        self.job_panel.shutdown()
+        shutdown_worker_pool()
+        if not shutdown_uniqueness_checker():
+            logger.error("Failed to flush tracking number history on close")
         event.accept()
 
 
@@ -0,0 +1,118 @@
+"""
+Preview Model
+
+This module contains the Qt table model behind the order preview in
+MainWindow: order codes and, once generated, their tracking numbers.
+
+Design (stays smooth at 500k+ rows):
+- The model holds references to the session's code/number sequences and
+  builds cell text only when the view asks for a visible cell; nothing is
+  copied per row, so memory doesn't grow with the row count
+- Rows are exposed in batches of PREVIEW_FETCH_BATCH through Qt's
+  canFetchMore/fetchMore, so attaching a huge file costs one batch and the
+  scroll range grows as the operator scrolls
+- Any sequence with len() and indexing works as a source (lists, compact
+  session buffers)
+"""
+
+from typing import Any, Optional, Sequence
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from src.utils.constants import PREVIEW_FETCH_BATCH
+
+_HEADERS = ("주문고유코드", "송장번호")
+
+
+class OrderPreviewModel(QAbstractTableModel):
+    """
+    Read-only, lazily populated table of order codes and tracking numbers.
+    """
+
+    def __init__(self, parent: Optional[Any] = None, fetch_batch: int = PREVIEW_FETCH_BATCH):
+        """
+        Initialize empty model
+
+        Args:
+            parent: Parent QObject (optional)
+            fetch_batch: Rows exposed per fetchMore
+        """
+        super().__init__(parent)
+        self.fetch_batch = fetch_batch
+        self._codes: Sequence[str] = ()
+        self._numbers: Optional[Sequence[str]] = None
+        self._loaded = 0  # Rows exposed to the view so far
+
+    @property
+    def total_rows(self) -> int:
+        """Rows in the source (the view may not have fetched them all yet)"""
+        return len(self._codes)
+
+    def set_codes(self, codes: Sequence[str]) -> None:
+        """
+        Show a newly loaded file's order codes (numbers cleared)
+
+        Args:
+            codes: Order codes in row order
+        """
+        self.beginResetModel()
+        self._codes = codes
+        self._numbers = None
+        self._loaded = min(len(codes), self.fetch_batch)
+        self.endResetModel()
+
+    def set_numbers(self, numbers: Sequence[str]) -> None:
+        """
+        Show generated tracking numbers next to the codes
+
+        Args:
+            numbers: Tracking numbers, one per order code
+        """
+        self._numbers = numbers
+        if self._loaded:
+            self.dataChanged.emit(self.index(0, 1), self.index(self._loaded - 1, 1), [Qt.DisplayRole])
+
+    def clear(self) -> None:
+        """Drop all rows (and the references to the session data)"""
+        self.set_codes(())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._codes)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.fetch_batch, len(self._codes) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role != Qt.DisplayRole:
+            return None
+
+        row = index.row()
+        if index.column() == 0:
+            return self._codes[row]
+        if self._numbers is not None and row < len(self._numbers):
+            return self._numbers[row]
+        return ""
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return _HEADERS[section]
+        return str(section + 1)
@@ -4,7 +4,7 @@ Application constants and configuration
 This module contains all constant values used throughout the application.
 """
 
-from typing import Final
+from typing import Final, Optional
 
 # Application Info
 APP_NAME: Final[str] = "가송장 생성기"
@@ -15,6 +15,11 @@ DELIVERY_COMPANY: Final[str] = "경동택배"
 SUPPORTED_FORMATS: Final[tuple] = ('.xls', '.xlsx')
 MAX_FILE_SIZE: Final[int] = 100 * 1024 * 1024  # 100MB in bytes
 HISTORY_FILE: Final[str] = "number_history.json"
+HISTORY_ARCHIVE_SUFFIX: Final[str] = ".archive"  # Frozen past days: number_history.json.archive
+HISTORY_HOT_RETENTION_DAYS: Final[int] = 0  # Past days kept in the hot set before archiving
+ARCHIVE_CACHE_DAYS: Final[int] = 8  # Decompressed archive days kept in memory for lookups
+ARCHIVE_RETRY_SECONDS: Final[float] = 60.0  # Back-off before retrying a failed archive freeze
+HISTORY_SAVE_DEBOUNCE_SECONDS: Final[float] = 2.0  # Background writer coalescing interval
 
 # Tracking Number Configuration
 TRACKING_NUMBER_LENGTH: Final[int] = 14
@@ -23,9 +28,52 @@ MONTH_DIGITS: Final[int] = 2
 DAY_DIGITS: Final[int] = 2
 RANDOM_DIGITS: Final[int] = 3  # Two random 3-digit segments
 
+# Keyspace Configuration
+RANDOM_SEGMENT_MIN: Final[int] = 100
+RANDOM_SEGMENT_SPAN: Final[int] = 900  # Random segments cover 100-999
+DAILY_KEYSPACE_SIZE: Final[int] = RANDOM_SEGMENT_SPAN * RANDOM_SEGMENT_SPAN  # 810,000 numbers per day
+
+# Multi-site Sharding (override via GASONGJANG_NODE_ID / GASONGJANG_NODE_COUNT / GASONGJANG_SHARD_KEY)
+DEFAULT_NODE_ID: Final[int] = 0
+DEFAULT_NODE_COUNT: Final[int] = 1  # 1 = single site, no sharding
+DEFAULT_SHARD_KEY: Final[str] = "gasongjang-keyspace-v1"  # Must be identical on every site
+SHARD_FEISTEL_ROUNDS: Final[int] = 4
+
 # Generation Configuration
 MAX_RETRY_ATTEMPTS: Final[int] = 10
 BATCH_PROGRESS_UPDATE_INTERVAL: Final[int] = 100  # Update UI every N items
+GENERATION_CLAIM_CHUNK_SIZE: Final[int] = 1000  # Numbers claimed in the shared history per lock
+RANDOM_BUFFER_BYTES: Final[int] = 64 * 1024  # os.urandom bytes read per refill of the random source
+MAX_SHIP_DAYS_AHEAD: Final[int] = 7  # Numbers may be pre-issued for ship dates up to this many days ahead
+
+# Pre-generated Number Pool (on-demand single orders / small batches)
+NUMBER_POOL_FILE: Final[str] = "number_pool.json"
+NUMBER_POOL_TARGET_SIZE: Final[int] = 2000  # Refill tops the pool up to this many numbers
+NUMBER_POOL_LOW_WATER_MARK: Final[int] = 500  # Refill starts when fewer numbers remain
+NUMBER_POOL_LEASE_BLOCK: Final[int] = 64  # Numbers leased per pool-file write on the request path
+NUMBER_POOL_RETRY_SECONDS: Final[float] = 5.0  # Refiller back-off after a failed refill
+
+# Pipelined Upload → Generate → Export
+PIPELINE_CHUNK_SIZE: Final[int] = 5000  # Rows per chunk passed between stages
+PIPELINE_QUEUE_DEPTH: Final[int] = 4  # Chunks buffered between two stages (caps memory)
+
+# Upload (size-adaptive ingestion)
+INGEST_CHUNK_SIZE: Final[int] = 5000  # Codes parsed per block when streaming
+INGEST_IN_MEMORY_MAX_CELLS: Final[int] = 2000000  # Larger sheets (rows x columns) use a streaming reader
+INGEST_SPILL_MIN_ROWS: Final[int] = 500000  # From this many rows, codes are buffered on disk
+READER_BACKEND_ORDER: Final[tuple] = ("calamine", "projected", "openpyxl", "xlrd")  # Fastest first
+EXTENT_EMPTY_RUN_ROWS: Final[int] = 1000  # Empty rows after which the rest of a sheet is scanned, not parsed
+INGEST_MAX_WORKERS: Final[Optional[int]] = None  # Processes for multi-file/multi-sheet ingestion (None = CPU cores)
+INGEST_PARALLEL_MIN_BYTES: Final[int] = 1024 * 1024  # Smaller batches are read in-process (spawning costs ~0.3 s)
+WORKER_POOL_MAX_WORKERS: Final[Optional[int]] = None  # Warm worker processes (None = CPU cores)
+
+# Order Preview Table
+PREVIEW_FETCH_BATCH: Final[int] = 1000  # Rows the preview model exposes per fetch while scrolling
+PREVIEW_ROW_HEIGHT: Final[int] = 24  # Fixed row height (px); uniform rows keep huge tables fast
+
+# Multi-file Job Queue
+JOB_QUEUE_MAX_WORKERS: Final[int] = 4  # Files processed in parallel
+JOB_OUTPUT_SUFFIX: Final[str] = "_가송장"  # Output file: <input name><suffix>.xlsx
 
 # Performance Targets
 TARGET_GENERATION_TIME_PER_1000: Final[int] = 1  # seconds
@@ -56,18 +104,25 @@ COLUMN_TRACKING_NUMBER: Final[str] = "가송장 번호"
 COLUMN_DELIVERY_COMPANY: Final[str] = "택배사"
 
 # Status Messages
+MSG_STARTING: Final[str] = "⏳ 준비 중입니다..."
 MSG_INITIAL: Final[str] = "📂 파일을 선택하세요"
 MSG_FILE_LOADED: Final[str] = "✅ 파일 로드됨: {} 개 주문"
+MSG_CODES_EMPTY_DROPPED: Final[str] = "주문고유코드가 비어 있는 {}개 행은 제외했습니다."
+MSG_CODES_DUPLICATE: Final[str] = "같은 주문고유코드가 두 번 이상 나오는 행이 {}개 있습니다. (예: {})"
 MSG_GENERATING: Final[str] = "{} / {} 개 생성 중..."
 MSG_GENERATION_COMPLETE: Final[str] = "✅ {} 개 송장번호 생성 완료"
 MSG_FILE_SAVED: Final[str] = "✅ 파일 저장됨: {}"
+MSG_JOBS_DROP_HINT: Final[str] = "여러 파일을 여기에 끌어다 놓으세요"
+MSG_JOBS_SUMMARY: Final[str] = "대기 {} · 진행 {} · 완료 {} · 실패 {}"
 
 # Error Messages
 ERR_FILE_FORMAT: Final[str] = "파일 형식이 잘못되었습니다. .xls 또는 .xlsx 파일을 사용하세요."
 ERR_FILE_TOO_LARGE: Final[str] = "파일이 너무 큽니다. 최대 크기: 100MB"
 ERR_FILE_EMPTY: Final[str] = "파일이 비어있습니다. 데이터가 있는 파일을 선택하세요."
+ERR_STARTUP_FAILED: Final[str] = "프로그램 초기화에 실패했습니다: {}"
 ERR_FILE_READ: Final[str] = "파일을 읽을 수 없습니다: {}"
 ERR_GENERATION_FAILED: Final[str] = "송장 생성에 실패했습니다. 다시 시도하세요."
 ERR_EXPORT_FAILED: Final[str] = "파일 저장에 실패했습니다: {}"
 ERR_NO_FILE_SELECTED: Final[str] = "파일이 선택되지 않았습니다."
 ERR_PERMISSION_DENIED: Final[str] = "파일에 접근할 권한이 없습니다."
+ERR_NO_CODE_COLUMN: Final[str] = "파일에 '주문고유코드' 컬럼이 없습니다. 올바른 형식의 파일을 선택해주세요."
@@ -6,8 +6,7 @@ and other user inputs to ensure data integrity and security.
 """
 
 import os
-from typing import Tuple
-import pandas as pd
+from typing import Tuple, TYPE_CHECKING
 
 from src.utils.constants import (
     SUPPORTED_FORMATS,
@@ -19,6 +18,9 @@ from src.utils.constants import (
     ERR_PERMISSION_DENIED,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -101,7 +103,7 @@ def validate_tracking_number(number: str) -> bool:
     return True
 
 
-def validate_dataframe_not_empty(df: pd.DataFrame) -> Tuple[bool, str]:
+def validate_dataframe_not_empty(df: "pd.DataFrame") -> Tuple[bool, str]:
     """
     Validate that DataFrame has data
 
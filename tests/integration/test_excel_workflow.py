@@ -223,3 +223,41 @@ class TestExcelWorkflow:
 
         # Cleanup
         os.remove(output_file)
+
+
+class TestStreamingExport:
+    """Integration tests for generating straight into a streamed output file"""
+
+    def test_streamed_output_matches_create_output(self, tmp_path):
+        """Test that streamed output has the same rows and formatting as create_output"""
+        from openpyxl import load_workbook
+        from src.core.tracking_generator import TrackingNumberGenerator
+        from src.core.uniqueness_checker import UniquenessChecker
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        codes = [f"CODE{i:05d}" for i in range(2500)]
+        chunks = TrackingNumberGenerator().iter_generate_and_register(len(codes), checker, chunk_size=1000)
+        output_path = str(tmp_path / "streamed.xlsx")
+
+        assert ExcelExportHandler.create_output_streaming(codes, chunks, output_path) == 2500
+
+        df = pd.read_excel(output_path, dtype=str)
+        assert list(df.columns) == ['주문고유코드', '송장번호', '택배사']
+        assert list(df['주문고유코드']) == codes
+        assert df['송장번호'].nunique() == 2500
+        assert checker.get_count() == 2500
+
+        worksheet = load_workbook(output_path).active
+        assert worksheet['A1'].font.bold
+        assert worksheet['B2'].font.name == "Courier New"
+        assert worksheet['C2'].alignment.horizontal == "center"
+
+    def test_streamed_mismatch_saves_nothing(self, tmp_path):
+        """Test that codes and numbers that don't pair up fail without writing a file"""
+        output_path = str(tmp_path / "mismatch.xlsx")
+
+        with pytest.raises(ExcelExportError):
+            ExcelExportHandler.create_output_streaming(["A", "B", "C"], [["1", "2"]], output_path)
+        with pytest.raises(ExcelExportError):
+            ExcelExportHandler.create_output_streaming(["A"], [["1"], ["2"]], output_path)
+        assert not os.path.exists(output_path)
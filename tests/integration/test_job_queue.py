@@ -0,0 +1,176 @@
+"""
+Integration tests for the multi-file job queue
+"""
+
+import os
+import pytest
+import pandas as pd
+from openpyxl import Workbook
+
+from src.core.uniqueness_checker import UniquenessChecker
+from src.handlers.job_queue import JobQueue, JobStatus, output_path_for
+from src.handlers.worker_pool import WorkerPool
+from src.utils.constants import ERR_FILE_EMPTY, ERR_NO_CODE_COLUMN
+
+
+def write_input(path, codes, code_column='주문고유코드'):
+    """Write an input workbook with the given codes"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(['주문번호', code_column])
+    for i, code in enumerate(codes):
+        sheet.append([f"ORD{i:05d}", code])
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Two warm workers shared by the tests in this module"""
+    pool = WorkerPool(max_workers=2).start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def checker(tmp_path):
+    """Fresh uniqueness checker shared by all jobs"""
+    checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+    yield checker
+    checker.close()
+
+
+class TestJobQueue:
+    """Tests for JobQueue"""
+
+    def test_processes_all_files_with_unique_numbers(self, tmp_path, checker, pool):
+        """Test that parallel jobs share one store and never reuse a number"""
+        inputs = [
+            write_input(tmp_path / f"market{i}.xlsx", [f"M{i}-{j}" for j in range(400)])
+            for i in range(6)
+        ]
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        updates = []
+
+        queue = JobQueue(checker=checker, max_workers=3, on_update=lambda job: updates.append(job.status), pool=pool)
+        assert len(queue.add(inputs)) == 6
+        assert queue.run(str(output_dir)) == 6
+        assert queue.wait(timeout=120)
+        queue.shutdown()
+
+        assert queue.summary()[JobStatus.DONE] == 6
+        numbers = []
+        for job in queue.jobs:
+            df = pd.read_excel(job.output_path, dtype=str)
+            assert len(df) == 400
+            numbers.extend(df['송장번호'])
+        assert len(set(numbers)) == 2400
+        assert checker.get_count() == 2400
+        assert updates.count(JobStatus.RUNNING) >= 6
+
+    def test_failed_job_does_not_stop_others(self, tmp_path, checker, pool):
+        """Test that one bad file fails alone"""
+        good = write_input(tmp_path / "good.xlsx", ["A", "B"])
+        bad = write_input(tmp_path / "bad.xlsx", ["A"], code_column='코드')
+
+        queue = JobQueue(checker=checker, pool=pool)
+        queue.add([good, bad])
+        queue.run(str(tmp_path))
+        queue.wait(timeout=60)
+        queue.shutdown()
+
+        statuses = {job.name: job.status for job in queue.jobs}
+        assert statuses == {"good.xlsx": JobStatus.DONE, "bad.xlsx": JobStatus.FAILED}
+        assert next(job for job in queue.jobs if job.name == "bad.xlsx").error == ERR_NO_CODE_COLUMN
+        assert checker.get_count() == 2
+
+    def test_empty_file_reported_as_empty(self, tmp_path, checker, pool):
+        """Test that a file with the column but no rows fails as empty, not as missing the column"""
+        queue = JobQueue(checker=checker, pool=pool)
+        queue.add([write_input(tmp_path / "empty.xlsx", [])])
+        queue.run(str(tmp_path))
+        assert queue.wait(timeout=60)
+        queue.shutdown()
+
+        assert queue.jobs[0].status == JobStatus.FAILED
+        assert queue.jobs[0].error == ERR_FILE_EMPTY
+
+    def test_read_and_write_on_pool(self, tmp_path, checker, pool, monkeypatch):
+        """Test that parsing and writing go to the worker pool and numbering stays in-process"""
+        calls = []
+        for name in ('parse', 'export'):
+            method = getattr(pool, name)
+            monkeypatch.setattr(pool, name, lambda *args, _m=method, _n=name: calls.append(_n) or _m(*args))
+        path = write_input(tmp_path / "orders.xlsx", [" A1", "12345.0", "", "B2"])
+
+        queue = JobQueue(checker=checker, pool=pool)
+        queue.add([path])
+        queue.run(str(tmp_path))
+        assert queue.wait(timeout=60)
+        queue.shutdown()
+
+        job = queue.jobs[0]
+        assert job.status == JobStatus.DONE
+        assert calls == ['parse', 'export']
+        assert job.report['rows'] == job.total == job.current == 3
+        assert set(job.report['stage_seconds']) == {'read', 'generate', 'write'}
+        df = pd.read_excel(job.output_path, dtype=str)
+        assert list(df['주문고유코드']) == ["A1", "12345", "B2"]
+        assert not any(checker.is_unique(number) for number in df['송장번호'])
+
+    def test_add_skips_unsupported_and_duplicates(self, tmp_path, checker, pool):
+        """Test that only new Excel files are queued"""
+        path = write_input(tmp_path / "orders.xlsx", ["A"])
+        queue = JobQueue(checker=checker, pool=pool)
+
+        assert len(queue.add([path, path, str(tmp_path / "notes.txt")])) == 1
+        assert queue.add([path]) == []
+        queue.shutdown()
+
+    def test_clear_finished(self, tmp_path, checker, pool):
+        """Test that finished jobs are removed and pending ones kept"""
+        first = write_input(tmp_path / "first.xlsx", ["A"])
+        second = write_input(tmp_path / "second.xlsx", ["B"])
+        queue = JobQueue(checker=checker, pool=pool)
+        queue.add([first])
+        queue.run(str(tmp_path))
+        queue.wait(timeout=60)
+        queue.add([second])
+
+        assert queue.clear_finished() == 1
+        assert [job.name for job in queue.jobs] == ["second.xlsx"]
+        queue.shutdown()
+
+
+class TestOutputPath:
+    """Tests for output_path_for"""
+
+    def test_never_overwrites(self, tmp_path):
+        """Test that existing and already assigned outputs get numbered names"""
+        first = output_path_for("/in/orders.xlsx", str(tmp_path))
+        assert os.path.basename(first) == "orders_가송장.xlsx"
+
+        open(first, 'w').close()
+        second = output_path_for("/other/orders.xls", str(tmp_path))
+        assert os.path.basename(second) == "orders_가송장 (2).xlsx"
+        third = output_path_for("/in/orders.xlsx", str(tmp_path), taken=[second])
+        assert os.path.basename(third) == "orders_가송장 (3).xlsx"
+
+    def test_wait_timeout_is_total(self, tmp_path, checker, monkeypatch):
+        """Test that wait(timeout) bounds the whole wait, not each job's"""
+        import threading
+        import time
+
+        release = threading.Event()
+        monkeypatch.setattr(JobQueue, '_process', lambda self, job: release.wait(10))
+        queue = JobQueue(checker=checker, max_workers=4)
+        queue.add([write_input(tmp_path / f"f{i}.xlsx", ["A"]) for i in range(4)])
+        queue.run(str(tmp_path))
+
+        start = time.perf_counter()
+        assert not queue.wait(timeout=0.3)
+        assert time.perf_counter() - start < 1.0
+        release.set()
+        assert queue.wait(timeout=10)
+        queue.shutdown()
@@ -0,0 +1,109 @@
+"""
+Integration tests for multi-file, multi-sheet ingestion
+"""
+
+import pytest
+from openpyxl import Workbook
+
+import src.handlers.parallel_ingest as parallel_ingest
+from src.handlers.excel_uploader import ExcelUploadHandler
+from src.handlers.parallel_ingest import SkipReason, SourceStatus, ingest_files
+
+
+def write_workbook(path, sheets):
+    """Write a workbook with {sheet name: rows} (header first)"""
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def batch(tmp_path):
+    """Two files: one with two code sheets and a notes sheet, one with a single sheet"""
+    first = write_workbook(tmp_path / "a.xlsx", {
+        "쿠팡": [['주문번호', '주문고유코드']] + [[i, f"C{i:04d}"] for i in range(30)],
+        "메모": [['비고'], ['-']],
+        "11번가": [['주문고유코드', '상품명'], ["E1", "상품"], [None, "상품"], [12345, "상품"]],
+    })
+    second = write_workbook(tmp_path / "b.xlsx", {
+        "Sheet1": [['주문번호', ' 주문고유코드 '], [1, "DA616E9F6"]],
+    })
+    return first, second
+
+
+def summarize(results):
+    return [(result.name, result.status, list(result.codes)) for result in results]
+
+
+class TestIngestFiles:
+    """Test suite for ingest_files"""
+
+    def test_sheets_and_provenance(self, batch):
+        """Test that every code sheet is read, in order, with its file and sheet"""
+        first, second = batch
+        results = ingest_files([second, first], max_workers=1)
+
+        assert summarize(results) == [
+            ("b.xlsx / Sheet1", SourceStatus.OK, ["DA616E9F6"]),
+            ("a.xlsx / 쿠팡", SourceStatus.OK, [f"C{i:04d}" for i in range(30)]),
+            ("a.xlsx / 메모", SourceStatus.SKIPPED, []),
+            ("a.xlsx / 11번가", SourceStatus.OK, ["E1", "nan", "12345"]),
+        ]
+        assert results[1].file_path == first and results[1].sheet == "쿠팡"
+        assert results[2].reason == SkipReason.NO_CODE_COLUMN
+        assert [result.reason for result in results if result.status == SourceStatus.OK] == [None] * 3
+        assert all(result.reader for result in results)
+
+    def test_matches_uploader(self, batch):
+        """Test that a file's first sheet reads the same as the single-file upload"""
+        first, _ = batch
+        result = ingest_files([first], max_workers=1)[0]
+        assert list(result.codes) == list(ExcelUploadHandler.load_special_codes(first))
+
+    def test_failures_are_isolated(self, batch, tmp_path):
+        """Test that unreadable and missing files fail alone"""
+        first, _ = batch
+        broken = tmp_path / "broken.xlsx"
+        broken.write_bytes(b"not a zip file")
+        missing = str(tmp_path / "missing.xlsx")
+
+        results = ingest_files([str(broken), first, missing], max_workers=1)
+
+        assert [(result.name, result.status) for result in results] == [
+            ("broken.xlsx", SourceStatus.FAILED),
+            ("a.xlsx / 쿠팡", SourceStatus.OK),
+            ("a.xlsx / 메모", SourceStatus.SKIPPED),
+            ("a.xlsx / 11번가", SourceStatus.OK),
+            ("missing.xlsx", SourceStatus.FAILED),
+        ]
+        assert results[0].error and results[-1].error
+
+    def test_process_pool(self, batch, monkeypatch):
+        """Test that worker processes return the same results as in-process reading"""
+        monkeypatch.setattr(parallel_ingest, 'INGEST_PARALLEL_MIN_BYTES', 0)
+        progress = []
+
+        pooled = ingest_files(batch, max_workers=2, callback=lambda done, total: progress.append((done, total)))
+
+        assert summarize(pooled) == summarize(ingest_files(batch, max_workers=1))
+        assert progress[-1] == (4, 4)
+
+    def test_padded_rows(self, tmp_path):
+        """Test that formatting carried below the data is reported with the default reader"""
+        from openpyxl import load_workbook
+        from openpyxl.styles import Font
+
+        path = write_workbook(tmp_path / "padded.xlsx", {"Sheet1": [['주문고유코드'], ["A"], ["B"]]})
+        workbook = load_workbook(path)
+        for row in range(4, 3001):
+            workbook.active.cell(row=row, column=1).font = Font(bold=True)
+        workbook.save(path)
+
+        result = ingest_files([path], max_workers=1)[0]
+        assert list(result.codes) == ["A", "B"]
+        assert result.padded_rows == 3000 - 3
@@ -0,0 +1,359 @@
+"""
+Integration tests for the pipelined Upload → Generate → Export workflow
+"""
+
+import os
+from datetime import date
+
+import pytest
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from src.handlers.excel_exporter import ExcelExportError
+from src.handlers.excel_uploader import ExcelUploadHandler, ExcelUploadError, IngestStrategy
+from src.handlers.sheet_scan import iter_xlsx_column, xlsx_dimensions
+from src.handlers.pipeline import ExcelPipeline
+
+
+def write_input(path, codes, header=('주문번호', '주문고유코드', '상품명'), trailing_blank=0):
+    """Write an input workbook with the given codes"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(list(header))
+    for i, code in enumerate(codes):
+        sheet.append([f"ORD{i:05d}", code, "상품"])
+    for _ in range(trailing_blank):
+        sheet.append([None, None, None])
+    workbook.save(path)
+    return str(path)
+
+
+def write_padded_input(path, codes, pad_to, late=None):
+    """Write an input workbook whose code column is formatted down to row `pad_to`"""
+    path = write_input(path, codes)
+    workbook = load_workbook(path)
+    sheet = workbook.active
+    for row in range(len(codes) + 2, pad_to + 1):
+        sheet.cell(row=row, column=2).font = Font(bold=True)
+    for row, code in (late or {}).items():
+        sheet.cell(row=row, column=2, value=code)
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def checker(tmp_path):
+    """Fresh uniqueness checker"""
+    checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+    yield checker
+    checker.close()
+
+
+class TestStreamingRead:
+    """Tests for ExcelUploadHandler.iter_special_codes"""
+
+    def test_matches_extract_special_codes(self, tmp_path):
+        """Test that streamed codes equal the pandas path, in blocks"""
+        path = write_input(tmp_path / "in.xlsx", [f"D{i:08X}" for i in range(25)] + [12345])
+        blocks = list(ExcelUploadHandler.iter_special_codes(path, chunk_size=10))
+
+        assert [len(block) for block in blocks] == [10, 10, 6]
+        expected = ExcelUploadHandler.extract_special_codes(ExcelUploadHandler.read_excel(path))
+        assert [code for block in blocks for code in block] == expected
+
+    def test_trailing_blank_rows_ignored(self, tmp_path):
+        """Test that formatted-but-empty rows after the data don't become codes"""
+        path = write_input(tmp_path / "in.xlsx", ["A", "B"], trailing_blank=5)
+        assert list(ExcelUploadHandler.iter_special_codes(path, chunk_size=10)) == [["A", "B"]]
+
+    def test_missing_column(self, tmp_path):
+        """Test that a file without 주문고유코드 is rejected"""
+        path = write_input(tmp_path / "in.xlsx", ["A"], header=('주문번호', '코드', '상품명'))
+        with pytest.raises(ExcelUploadError):
+            list(ExcelUploadHandler.iter_special_codes(path, chunk_size=10))
+
+    def test_padded_sheet(self, tmp_path, caplog):
+        """Test that formatting carried far below the data is skipped and reported"""
+        path = write_padded_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(20)], pad_to=5000)
+
+        stats = {}
+        codes = [code for block in iter_xlsx_column(path, lambda header: 1, 100, stats=stats) for code in block]
+        assert codes == [f"C{i}" for i in range(20)]
+        assert stats['last_data_row'] == 21
+        assert stats['last_row'] == 5000
+        assert stats['scanned_bytes'] > 0
+
+        with caplog.at_level("WARNING"):
+            assert len(ExcelUploadHandler.load_special_codes(path)) == 20
+        assert "padded" in caplog.text
+
+    def test_padding_reported_by_every_backend(self, tmp_path):
+        """Test that every backend reports where the data ends and where the sheet's extent ends"""
+        from src.handlers.reader_backends import available_readers
+
+        path = write_padded_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(20)], pad_to=5000)
+        for backend in available_readers(path):
+            stats = {}
+            codes = [code for block in backend.iter_column(path, lambda header: 1, 100, stats=stats) for code in block]
+            assert codes == [f"C{i}" for i in range(20)], backend.name
+            assert (stats['last_data_row'], stats['last_row']) == (21, 5000), backend.name
+
+    def test_data_after_long_gap(self, tmp_path):
+        """Test that values after a long empty run are still read, with blanks for the gap"""
+        path = write_padded_input(tmp_path / "in.xlsx", ["A", "B"], pad_to=6000, late={2500: "X", 5500: "Y"})
+
+        codes = [code for block in iter_xlsx_column(path, lambda header: 1, 1000) for code in block]
+        assert len(codes) == 5499
+        assert codes[:2] == ["A", "B"]
+        assert codes[2498] == "X"
+        assert codes[-1] == "Y"
+        assert set(codes[2:2498]) == {"nan"}
+
+        # Same result when every row is parsed
+        parsed = [code for block in iter_xlsx_column(path, lambda header: 1, 1000, empty_run=10**9) for code in block]
+        assert parsed == codes
+
+    def test_empty_file(self, tmp_path):
+        """Test that a header-only file is rejected"""
+        path = write_input(tmp_path / "in.xlsx", [])
+        with pytest.raises(ExcelUploadError):
+            list(ExcelUploadHandler.iter_special_codes(path, chunk_size=10))
+
+
+class TestSizeAdaptiveIngestion:
+    """Tests for size estimation and ExcelUploadHandler.load_special_codes"""
+
+    def test_estimate_shape(self, tmp_path):
+        """Test that the stored extent is read without parsing cells"""
+        path = write_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(40)])
+        assert xlsx_dimensions(path) == (41, 3)
+        assert ExcelUploadHandler.estimate_shape(path) == (40, 3)
+        assert ExcelUploadHandler.estimate_rows(path) == 40
+
+    def test_estimate_unknown(self, tmp_path, monkeypatch):
+        """Test that a sheet without a dimension record gives None and the reader's strategy"""
+        import src.handlers.reader_backends as reader_backends
+        from src.handlers.reader_backends import READER_BACKENDS
+        path = str(tmp_path / "in.xlsx")
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(['주문고유코드'])
+        sheet.append(['A'])
+        workbook.save(path)
+
+        assert ExcelUploadHandler.estimate_shape(path) is None
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("projected", "openpyxl", "xlrd"))
+        assert ExcelUploadHandler.choose_strategy(path, None) == IngestStrategy.STREAMING
+
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: True)
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("calamine", "projected", "openpyxl", "xlrd"))
+        assert ExcelUploadHandler.choose_strategy(path, None) == IngestStrategy.IN_MEMORY
+
+    def test_choose_strategy(self, monkeypatch):
+        """Test that the strategy follows the reader and the size"""
+        import src.handlers.excel_uploader as uploader
+        import src.handlers.reader_backends as reader_backends
+        monkeypatch.setattr(uploader, 'INGEST_SPILL_MIN_ROWS', 100)
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("projected", "openpyxl", "xlrd"))
+
+        assert ExcelUploadHandler.choose_strategy("a.xls", (10, 3)) == IngestStrategy.IN_MEMORY
+        assert ExcelUploadHandler.choose_strategy("a.xlsx", (99, 3)) == IngestStrategy.STREAMING
+        assert ExcelUploadHandler.choose_strategy("a.xlsx", (100, 3)) == IngestStrategy.SPILL
+
+    def test_choose_strategy_by_size(self, monkeypatch):
+        """Test that small sheets get the whole-sheet reader and large ones a streaming reader"""
+        import src.handlers.excel_uploader as uploader
+        import src.handlers.reader_backends as reader_backends
+        from src.handlers.reader_backends import READER_BACKENDS
+        monkeypatch.setattr(uploader, 'INGEST_IN_MEMORY_MAX_CELLS', 300)
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: True)
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("calamine", "projected", "openpyxl", "xlrd"))
+
+        assert ExcelUploadHandler.choose_strategy("a.xlsx", (100, 3)) == IngestStrategy.IN_MEMORY
+        assert ExcelUploadHandler.choose_strategy("a.xlsx", (101, 3)) == IngestStrategy.STREAMING
+        assert ExcelUploadHandler.choose_strategy("a.xlsx", (60, 6)) == IngestStrategy.STREAMING
+        # No streaming reader handles .xls, and the format caps a sheet at 65,536 rows
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("projected", "openpyxl", "xlrd"))
+        assert ExcelUploadHandler.choose_strategy("a.xls", (101, 3)) == IngestStrategy.IN_MEMORY
+
+    def test_large_sheet_streamed(self, tmp_path, monkeypatch, caplog):
+        """Test that a sheet over the in-memory limit is read by a streaming reader, with the reason logged"""
+        import logging
+        import src.handlers.excel_uploader as uploader
+        from src.handlers.reader_backends import READER_BACKENDS
+        path = write_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(40)])
+        monkeypatch.setattr(uploader, 'INGEST_IN_MEMORY_MAX_CELLS', 100)
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: True)
+        chosen = []
+        select_reader = uploader.select_reader
+
+        def spy(*args, **kwargs):
+            chosen.append(select_reader(*args, **kwargs))
+            return chosen[-1]
+
+        monkeypatch.setattr(uploader, 'select_reader', spy)
+
+        with caplog.at_level(logging.INFO):
+            assert len(ExcelUploadHandler.load_special_codes(path)) == 40
+        assert {reader.name for reader in chosen} == {"projected"}
+        assert "over 100 cells, streaming keeps memory bounded" in caplog.text
+
+    def test_strategies_agree(self, tmp_path, monkeypatch):
+        """Test that streaming and spilled loads equal the pandas path"""
+        import src.handlers.excel_uploader as uploader
+        codes = [f"D{i:08X}" for i in range(30)] + [12345, None, "주문"]
+        path = write_input(tmp_path / "in.xlsx", codes)
+        expected = [str(code) for code in ExcelUploadHandler.extract_special_codes(ExcelUploadHandler.read_excel(path))]
+
+        streamed = ExcelUploadHandler.load_special_codes(path)
+        assert not streamed.is_spilled
+        assert list(streamed) == expected
+
+        monkeypatch.setattr(uploader, 'INGEST_SPILL_MIN_ROWS', 10)
+        spilled = ExcelUploadHandler.load_special_codes(path)
+        assert spilled.is_spilled
+        assert list(spilled) == expected
+
+    def test_missing_column(self, tmp_path):
+        """Test that a file without 주문고유코드 is rejected"""
+        path = write_input(tmp_path / "in.xlsx", ["A"], header=('주문번호', '코드', '상품명'))
+        with pytest.raises(ExcelUploadError):
+            ExcelUploadHandler.load_special_codes(path)
+
+    def test_load_order_codes(self, tmp_path):
+        """Test that uploaded codes are normalized and issues reported per row"""
+        path = write_input(tmp_path / "in.xlsx", [" A1 ", 12345.0, None, "B2", "A1"])
+        result = ExcelUploadHandler.load_order_codes(path)
+
+        assert list(result.codes) == ["A1", "12345", "B2", "A1"]
+        assert result.summary() == {'rows': 5, 'codes': 4, 'empty': 1, 'trimmed': 1, 'float': 0, 'duplicate': 2}
+
+    def test_load_order_codes_all_blank(self, tmp_path):
+        """Test that a file with only blank codes is rejected"""
+        path = write_input(tmp_path / "in.xlsx", [None, " "])
+        with pytest.raises(ExcelUploadError):
+            ExcelUploadHandler.load_order_codes(path)
+
+
+class TestExcelPipeline:
+    """Tests for ExcelPipeline"""
+
+    def test_pipeline_output(self, tmp_path, checker):
+        """Test that the pipeline writes every row with a registered, unique number"""
+        codes = [f"D{i:08X}" for i in range(2500)]
+        input_path = write_input(tmp_path / "in.xlsx", codes)
+        output_path = str(tmp_path / "out.xlsx")
+        progress = []
+
+        report = ExcelPipeline(input_path, output_path, checker=checker, chunk_size=300, queue_depth=2).run(
+            callback=lambda current, total: progress.append((current, total))
+        )
+
+        assert report['rows'] == 2500
+        assert set(report['stage_seconds']) == {'read', 'generate', 'write'}
+        assert progress[-1] == (2500, 2500)
+
+        df = pd.read_excel(output_path, dtype=str)
+        assert list(df.columns) == ['주문고유코드', '송장번호', '택배사']
+        assert list(df['주문고유코드']) == codes
+        assert df['송장번호'].nunique() == 2500
+        assert checker.get_count() == 2500
+
+    def test_blank_codes_dropped(self, tmp_path, checker):
+        """Test that rows without a code get no number and the rest are trimmed"""
+        input_path = write_input(tmp_path / "in.xlsx", ["A1", None, " B2 ", ""])
+        output_path = str(tmp_path / "out.xlsx")
+
+        report = ExcelPipeline(input_path, output_path, checker=checker).run()
+
+        assert report['rows'] == 2
+        assert list(pd.read_excel(output_path, dtype=str)['주문고유코드']) == ["A1", "B2"]
+
+    def test_streaming_reader_chosen(self, tmp_path, checker, monkeypatch):
+        """Test that the pipeline reads with a streaming backend even when a whole-sheet one is faster"""
+        import src.handlers.excel_uploader as uploader
+        from src.handlers.reader_backends import READER_BACKENDS
+
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: True)
+        chosen = []
+        select_reader = uploader.select_reader
+
+        def spy(*args, **kwargs):
+            chosen.append(select_reader(*args, **kwargs))
+            return chosen[-1]
+
+        monkeypatch.setattr(uploader, 'select_reader', spy)
+
+        input_path = write_input(tmp_path / "in.xlsx", ["A1", "B2"])
+        ExcelPipeline(input_path, str(tmp_path / "out.xlsx"), checker=checker).run()
+
+        assert [backend.name for backend in chosen] == ["projected"]
+        assert chosen[0].streaming
+
+    def test_reader_failure_saves_nothing(self, tmp_path, checker):
+        """Test that a failing stage stops the pipeline without writing output"""
+        input_path = write_input(tmp_path / "in.xlsx", ["A"], header=('주문번호', '코드', '상품명'))
+        output_path = str(tmp_path / "out.xlsx")
+
+        with pytest.raises(ExcelUploadError):
+            ExcelPipeline(input_path, output_path, checker=checker).run()
+        assert not os.path.exists(output_path)
+        assert checker.get_count() == 0
+
+    def test_generation_failure_saves_nothing(self, tmp_path, checker):
+        """Test that a generation failure mid-file is re-raised and nothing is saved"""
+        input_path = write_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(50)])
+        output_path = str(tmp_path / "out.xlsx")
+
+        class FailingGenerator(TrackingNumberGenerator):
+            calls = 0
+
+            def generate_and_register(self, count, checker, session=None):
+                FailingGenerator.calls += 1
+                if FailingGenerator.calls > 2:
+                    raise RuntimeError("out of numbers")
+                return [f"N{FailingGenerator.calls}-{i}" for i in range(count)]
+
+        pipeline = ExcelPipeline(input_path, output_path, checker=checker, generator=FailingGenerator(), chunk_size=10)
+        with pytest.raises(RuntimeError, match="out of numbers"):
+            pipeline.run()
+        assert not os.path.exists(output_path)
+
+    def test_run_across_midnight(self, tmp_path, checker, monkeypatch):
+        """Test that chunks generated after midnight keep the pinned ship date"""
+        from src.core import tracking_generator
+
+        input_path = write_input(tmp_path / "in.xlsx", [f"C{i}" for i in range(50)])
+        output_path = str(tmp_path / "out.xlsx")
+        pipeline = ExcelPipeline(input_path, output_path, checker=checker, chunk_size=10)
+        ship_day = pipeline.ship_date.strftime("%d")
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.fromordinal(date.today().toordinal() + 1)
+
+        register = pipeline.generator.generate_and_register
+
+        def register_then_midnight(*args, **kwargs):
+            numbers = register(*args, **kwargs)
+            monkeypatch.setattr(tracking_generator, 'date', Tomorrow)
+            return numbers
+
+        monkeypatch.setattr(pipeline.generator, 'generate_and_register', register_then_midnight)
+        assert pipeline.run()['rows'] == 50
+
+        df = pd.read_excel(output_path, dtype=str)
+        assert all(number[-2:] == ship_day for number in df['송장번호'])
+        assert checker.get_count() == 50
+
+    def test_invalid_output_registers_nothing(self, tmp_path, checker):
+        """Test that an unwritable output path fails before any number is registered"""
+        input_path = write_input(tmp_path / "in.xlsx", ["A", "B"])
+
+        with pytest.raises(ExcelExportError):
+            ExcelPipeline(input_path, str(tmp_path / "missing" / "out.xlsx"), checker=checker).run()
+        assert checker.get_count() == 0
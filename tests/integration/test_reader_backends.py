@@ -0,0 +1,160 @@
+"""
+Integration tests for the spreadsheet reader backends
+"""
+
+import os
+import pytest
+from openpyxl import Workbook
+
+import src.handlers.reader_backends as reader_backends
+from src.handlers.reader_backends import READER_BACKENDS, ReaderBackend, available_readers, select_reader
+
+SAMPLE_XLS = os.path.join(os.path.dirname(__file__), "..", "..", "가송장_생성기.xls")
+
+
+def choose_code_column(header):
+    return next((index for index, name in enumerate(header) if '주문고유코드' in name), None)
+
+
+def read_all(backend, path, chunk_size=4):
+    return [code for block in backend.iter_column(path, choose_code_column, chunk_size) for code in block]
+
+
+@pytest.fixture
+def mixed_xlsx(tmp_path):
+    """Workbook with text, numbers, booleans, a blank row and trailing blank rows"""
+    path = str(tmp_path / "mixed.xlsx")
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(['주문번호', ' 주문고유코드 ', '상품명'])
+    for row in (
+        [1, "DA616E9F6", "상품"],
+        [2, 12345, "상품"],
+        [3, 1.5, "상품"],
+        [4, None, "코드 없음"],
+        [None, None, None],
+        [5, True, "상품"],
+        [6, "주문-1", None],
+        [None, None, None],
+        [None, None, None],
+    ):
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+class TestReaderBackends:
+    """Test suite for the reader backends"""
+
+    def test_xlsx_backends_agree(self, mixed_xlsx):
+        """Test that every installed xlsx backend yields the same codes"""
+        expected = ["DA616E9F6", "12345", "1.5", "nan", "nan", "True", "주문-1"]
+        for backend in available_readers(mixed_xlsx):
+            assert read_all(backend, mixed_xlsx) == expected, backend.name
+
+    def test_xls_backends_agree(self):
+        """Test that every installed xls backend reads the sample file the same way"""
+        results = {backend.name: read_all(backend, SAMPLE_XLS) for backend in available_readers(SAMPLE_XLS)}
+        assert "xlrd" in results
+        assert len(results["xlrd"]) == 7
+        assert all(codes == results["xlrd"] for codes in results.values())
+
+    def test_missing_column(self, tmp_path):
+        """Test that every backend reports a missing column as LookupError"""
+        path = str(tmp_path / "in.xlsx")
+        workbook = Workbook()
+        workbook.active.append(['주문번호', '코드'])
+        workbook.active.append([1, "A"])
+        workbook.save(path)
+
+        for backend in available_readers(path):
+            with pytest.raises(LookupError):
+                read_all(backend, path)
+
+    def test_incomplete_backend_rejected(self):
+        """Test that a backend missing part of the interface can't be created"""
+        class NoSheets(ReaderBackend):
+            name = "no_sheets"
+
+            def iter_column(self, file_path, choose_column, chunk_size, stats=None, sheet=None):
+                return iter(())
+
+        with pytest.raises(TypeError):
+            NoSheets()
+
+
+class TestSelectReader:
+    """Test suite for select_reader"""
+
+    def test_fastest_available_first(self, monkeypatch):
+        """Test that the first installed backend in the order wins"""
+        monkeypatch.setattr(reader_backends, 'READER_BACKEND_ORDER', ("missing", "openpyxl", "projected", "xlrd"))
+        assert select_reader("a.xlsx").name == "openpyxl"
+        assert select_reader("a.xls").name == "xlrd"
+
+    def test_skips_uninstalled(self, monkeypatch):
+        """Test that a backend whose library is missing is passed over"""
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: False)
+        assert select_reader("a.xlsx").name == "projected"
+        assert select_reader("a.xls").name == "xlrd"
+
+    def test_streaming_only(self, monkeypatch):
+        """Test that streaming selection skips whole-sheet readers where it can"""
+        monkeypatch.setattr(READER_BACKENDS["calamine"], 'is_available', lambda: True)
+        assert select_reader("a.xlsx", streaming=True).name == "projected"
+        # No streaming reader handles .xls; the fastest one is used anyway
+        assert select_reader("a.xls", streaming=True).name == "calamine"
+
+    def test_named_backend(self):
+        """Test explicit backend choice and its errors"""
+        assert select_reader("a.xlsx", "openpyxl").name == "openpyxl"
+        with pytest.raises(ValueError):
+            select_reader("a.xls", "openpyxl")
+        with pytest.raises(ValueError):
+            select_reader("a.xlsx", "unknown")
+        with pytest.raises(ValueError):
+            select_reader("a.csv")
+
+
+class TestWorksheets:
+    """Test suite for listing and choosing worksheets"""
+
+    @pytest.fixture
+    def multi_sheet_xlsx(self, tmp_path):
+        """Workbook with a chart sheet first, two code sheets and one without codes"""
+        from openpyxl.chart import BarChart, Reference
+
+        path = str(tmp_path / "multi.xlsx")
+        workbook = Workbook()
+        first = workbook.active
+        first.title = "쿠팡"
+        for row in (['주문번호', '주문고유코드'], [1, "A1"], [2, 5]):
+            first.append(row)
+        chart = BarChart()
+        chart.add_data(Reference(first, min_col=1, min_row=1, max_row=3))
+        workbook.create_chartsheet("Chart").add_chart(chart)
+        workbook.create_sheet("메모").append(['비고'])
+        workbook.create_sheet("11번가").append(['주문고유코드'])
+        workbook["11번가"].append(["B1"])
+        workbook.move_sheet("Chart", offset=-1)
+        workbook.save(path)
+        return path
+
+    def test_sheets_agree(self, multi_sheet_xlsx):
+        """Test that every xlsx backend lists and reads the same worksheets"""
+        for backend in available_readers(multi_sheet_xlsx):
+            assert backend.sheet_names(multi_sheet_xlsx) == ["쿠팡", "메모", "11번가"], backend.name
+            assert read_all(backend, multi_sheet_xlsx) == ["A1", "5"], backend.name
+            assert [
+                code for block in backend.iter_column(multi_sheet_xlsx, choose_code_column, 4, sheet="11번가")
+                for code in block
+            ] == ["B1"], backend.name
+            with pytest.raises(LookupError):
+                list(backend.iter_column(multi_sheet_xlsx, choose_code_column, 4, sheet="메모"))
+            with pytest.raises(ValueError):
+                list(backend.iter_column(multi_sheet_xlsx, choose_code_column, 4, sheet="없음"))
+
+    def test_xls_sheet_names(self):
+        """Test that every xls backend lists the sample's worksheet"""
+        for backend in available_readers(SAMPLE_XLS):
+            assert backend.sheet_names(SAMPLE_XLS) == ["Sheet1"], backend.name
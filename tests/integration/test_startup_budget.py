@@ -0,0 +1,84 @@
+"""
+Startup budget test
+
+Starts main.py in fresh interpreters (offscreen Qt) and fails when the median
+cold start exceeds the budget. Budgets can be tightened or relaxed per machine:
+
+    GASONGJANG_STARTUP_BUDGET_WINDOW=1.0 GASONGJANG_STARTUP_BUDGET_READY=2.0 pytest tests/integration/test_startup_budget.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from benchmarks.startup import (
+    DEFAULT_FIRST_WINDOW_BUDGET,
+    DEFAULT_READY_BUDGET,
+    REPO_ROOT,
+    check_budget,
+    measure_startup,
+)
+
+
+@pytest.fixture(scope="module")
+def startup_report():
+    """Measure cold start once for all budget checks"""
+    return measure_startup(repeat=int(os.environ.get("GASONGJANG_STARTUP_RUNS", "3")))
+
+
+class TestStartupBudget:
+    """Cold start stays within budget"""
+
+    def test_milestones_are_ordered(self, startup_report):
+        """Imports finish before the first window, which shows before ready"""
+        results = startup_report['results']
+        imports = results['startup_imports']['0']['median']
+        first_window = results['startup_first_window']['0']['median']
+        ready = results['startup_ready']['0']['median']
+        assert 0 < imports <= first_window <= ready
+
+    def test_cold_start_within_budget(self, startup_report):
+        """Median time to first window and to ready-to-generate are within budget"""
+        window_budget = float(os.environ.get("GASONGJANG_STARTUP_BUDGET_WINDOW", DEFAULT_FIRST_WINDOW_BUDGET))
+        ready_budget = float(os.environ.get("GASONGJANG_STARTUP_BUDGET_READY", DEFAULT_READY_BUDGET))
+        violations = check_budget(startup_report['results'], window_budget, ready_budget)
+        assert not violations, "\n".join(violations)
+
+    def test_import_breakdown_includes_main(self, startup_report):
+        """The import profile covers the application's own modules"""
+        modules = [row['module'] for row in startup_report['imports']['cumulative']]
+        assert 'main' in modules
+
+
+class TestLazyImports:
+    """Heavy libraries stay out of the window's import path"""
+
+    def test_main_does_not_import_excel_stack(self):
+        """pandas/openpyxl load after first paint, not when main.py is imported"""
+        probe = "import sys, main; print(','.join(m for m in ('pandas', 'openpyxl', 'numpy') if m in sys.modules))"
+        completed = subprocess.run(
+            [sys.executable, "-c", probe], cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+        )
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip() == ""
+
+
+class TestBudgetCheck:
+    """check_budget reports only exceeded budgets"""
+
+    def test_reports_violation(self):
+        results = {
+            'startup_first_window': {'0': {'median': 4.0}},
+            'startup_ready': {'0': {'median': 4.5}},
+        }
+        violations = check_budget(results, first_window_budget=3.0, ready_budget=5.0)
+        assert len(violations) == 1
+        assert 'startup_first_window' in violations[0]
+
+    def test_ready_budget_optional(self):
+        results = {'startup_ready': {'0': {'median': 100.0}}}
+        assert check_budget(results, first_window_budget=3.0, ready_budget=None) == []
@@ -0,0 +1,91 @@
+"""
+Integration tests for the warm worker pool
+"""
+
+import os
+import pytest
+import pandas as pd
+from concurrent.futures.process import BrokenProcessPool
+from openpyxl import Workbook
+
+from src.handlers.excel_exporter import ExcelExportError
+from src.handlers.parallel_ingest import SourceStatus, ingest_files, read_source
+from src.handlers.worker_pool import WorkerPool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Two warm workers shared by the tests in this module"""
+    pool = WorkerPool(max_workers=2).start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def orders(tmp_path):
+    """Small two-sheet order file"""
+    path = str(tmp_path / "orders.xlsx")
+    workbook = Workbook()
+    workbook.active.title = "주문"
+    for row in [['주문번호', '주문고유코드']] + [[i, f"D{i:08X}"] for i in range(50)]:
+        workbook.active.append(row)
+    workbook.create_sheet("추가").append(['주문고유코드'])
+    workbook["추가"].append(["E1"])
+    workbook.save(path)
+    return path
+
+
+class TestWorkerPool:
+    """Test suite for WorkerPool"""
+
+    def test_workers_started(self, pool):
+        """Test that start() brings up every worker"""
+        assert pool.is_running
+        pids = {pool.submit(os.getpid).result() for _ in range(8)}
+        assert os.getpid() not in pids
+        assert 1 <= len(pids) <= 2
+
+    def test_parse(self, pool, orders):
+        """Test that a parse task returns the same codes as reading in-process"""
+        result = pool.parse(orders)
+        assert result.status == SourceStatus.OK
+        assert list(result.codes) == list(read_source(orders).codes)
+        assert list(pool.parse(orders, sheet="추가").codes) == ["E1"]
+
+    def test_parse_failure_is_a_result(self, pool, tmp_path):
+        """Test that an unreadable file comes back as a failed source, not an exception"""
+        broken = tmp_path / "broken.xlsx"
+        broken.write_bytes(b"not a zip file")
+        result = pool.parse(str(broken))
+        assert result.status == SourceStatus.FAILED
+        assert result.error
+
+    def test_export(self, pool, tmp_path):
+        """Test that an export task writes the 3-column output"""
+        output = str(tmp_path / "out.xlsx")
+        codes = ["A1", "주문-2"]
+        numbers = ["20251001001004", "20251001001005"]
+
+        assert pool.export(codes, numbers, output) == 2
+        df = pd.read_excel(output, dtype=str)
+        assert list(df.columns) == ['주문고유코드', '송장번호', '택배사']
+        assert list(df['송장번호']) == numbers
+
+        with pytest.raises(ExcelExportError):
+            pool.export(codes, numbers[:1], str(tmp_path / "mismatch.xlsx"))
+
+    def test_ingest_files_on_pool(self, pool, orders):
+        """Test that ingest_files gives the same results on the pool as in-process"""
+        pooled = ingest_files([orders], pool=pool)
+        local = ingest_files([orders], max_workers=1)
+        assert [(r.name, list(r.codes)) for r in pooled] == [(r.name, list(r.codes)) for r in local]
+
+    def test_restart_after_worker_death(self, orders):
+        """Test that a pool broken by a dying worker recovers on the next task"""
+        pool = WorkerPool(max_workers=1).start()
+        try:
+            with pytest.raises(BrokenProcessPool):
+                pool.submit(os._exit, 1).result()
+            assert pool.parse(orders).status == SourceStatus.OK
+        finally:
+            pool.shutdown()
@@ -0,0 +1,85 @@
+"""
+Unit tests for order code normalization
+"""
+
+import random
+from collections import Counter
+
+from src.core.code_normalizer import CodeIssue, normalize_codes
+from src.core.compact import CompactStrings
+
+
+def reference(values):
+    """Plain Python normalization to compare the vectorized one against"""
+    codes = []
+    for value in values:
+        text = value.strip()
+        if text in ("", "nan"):
+            continue
+        if text.endswith(".0") and text[:-2].isdigit() and text[:-2].isascii():
+            text = text[:-2]
+        codes.append(text)
+    return codes
+
+
+class TestNormalizeCodes:
+    """Test suite for normalize_codes"""
+
+    def test_trim_float_and_empty(self):
+        """Test that whitespace is trimmed, float text repaired and blanks dropped"""
+        result = normalize_codes([" A1 ", "12345.0", "nan", "", "　주문-1", "1.5", "B2"])
+
+        assert list(result.codes) == ["A1", "12345", "주문-1", "1.5", "B2"]
+        assert list(result.source_rows) == [0, 1, 4, 5, 6]
+        assert result.rows_with(CodeIssue.TRIMMED) == [0, 4]
+        assert result.rows_with(CodeIssue.FLOAT) == [1]
+        assert result.rows_with(CodeIssue.EMPTY) == [2, 3]
+
+    def test_keep_empty(self):
+        """Test that keep_empty keeps row positions and flags the blanks"""
+        result = normalize_codes(["A", " nan ", "B"], keep_empty=True)
+
+        assert list(result.codes) == ["A", "", "B"]
+        assert result.source_rows is None
+        assert result.rows_with(CodeIssue.EMPTY) == [1]
+
+    def test_duplicates(self):
+        """Test that duplicates are flagged after normalization, blanks excluded"""
+        result = normalize_codes(["A1", "B2", " A1", "nan", "nan", "7.0", "7", "주문", "주문"])
+
+        assert result.rows_with(CodeIssue.DUPLICATE) == [0, 2, 5, 6, 7, 8]
+        assert result.summary() == {
+            'rows': 9, 'codes': 7, 'empty': 2, 'trimmed': 1, 'float': 1, 'duplicate': 6
+        }
+        assert normalize_codes(["A1", "A1"], find_duplicates=False).rows_with(CodeIssue.DUPLICATE) == []
+
+    def test_clean_input_reused(self):
+        """Test that clean CompactStrings input is returned without a copy"""
+        codes = CompactStrings(["DA616E9F6", "DA616E9F7"])
+        result = normalize_codes(codes)
+
+        assert result.codes is codes
+        assert result.summary()['duplicate'] == 0
+
+    def test_spilled_input(self, tmp_path):
+        """Test that a spilled source gives a spilled result"""
+        codes = CompactStrings([" A", "B", "nan"])
+        codes.spill(str(tmp_path))
+        result = normalize_codes(codes)
+
+        assert list(result.codes) == ["A", "B"]
+        assert result.codes.is_spilled
+
+    def test_matches_reference(self):
+        """Test random mixed input against the plain Python version"""
+        rng = random.Random(7)
+        pieces = ["A1", "12345", "12345.0", " ", "nan", "", "주문", "\t", "1.50", "B", "0.0", "x.0"]
+        values = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 3))) for _ in range(5000)]
+        result = normalize_codes(values)
+
+        expected = reference(values)
+        assert list(result.codes) == expected
+        duplicates = {code for code, count in Counter(expected).items() if count > 1}
+        flagged = {result.codes[index] for index, row in enumerate(result.source_rows)
+                   if result.issues[row] & CodeIssue.DUPLICATE}
+        assert flagged == duplicates
@@ -0,0 +1,92 @@
+"""
+Unit tests for compact session sequences
+"""
+
+import pickle
+import pytest
+
+from src.core.compact import CompactStrings, CompactNumbers
+
+
+class TestCompactStrings:
+    """Test suite for CompactStrings"""
+
+    def test_round_trip(self):
+        """Test that strings (including non-ASCII and empty) come back unchanged"""
+        values = ["DA616E9F6", "주문-1", "", "nan"]
+        codes = CompactStrings(values)
+
+        assert len(codes) == 4
+        assert list(codes) == values
+        assert codes[1] == "주문-1"
+        assert codes[-1] == "nan"
+        assert codes[1:3] == ["주문-1", ""]
+
+    def test_extend_in_chunks(self):
+        """Test that building from several chunks equals building at once"""
+        codes = CompactStrings()
+        codes.extend(["A", "B"])
+        codes.extend([])
+        codes.extend(["C"])
+        assert list(codes) == ["A", "B", "C"]
+
+    def test_index_out_of_range(self):
+        """Test list-like IndexError"""
+        with pytest.raises(IndexError):
+            CompactStrings(["A"])[1]
+
+    def test_smaller_than_list(self):
+        """Test that the packed form is far smaller than a list of str"""
+        import sys
+        values = [f"D{i:08X}" for i in range(10000)]
+        list_bytes = sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+        assert CompactStrings(values).nbytes * 3 < list_bytes
+
+    def test_spill_round_trip(self, tmp_path):
+        """Test that a spilled buffer reads back the same and keeps only offsets in memory"""
+        values = [f"D{i:08X}" for i in range(1000)] + ["주문-1", ""]
+        codes = CompactStrings(spill=True, spill_dir=str(tmp_path))
+        codes.extend(values[:500])
+        codes.extend(values[500:])
+
+        assert codes.is_spilled
+        assert list(codes) == values
+        assert codes[-2] == "주문-1"
+        assert codes.nbytes == 8 * (len(values) + 1)
+
+    def test_pickle(self, tmp_path):
+        """Test that pickling (e.g. to a worker process) keeps the values, spilled or not"""
+        values = ["DA616E9F6", "주문-1", ""]
+        spilled = CompactStrings(values, spill=True, spill_dir=str(tmp_path))
+
+        assert list(pickle.loads(pickle.dumps(CompactStrings(values)))) == values
+        restored = pickle.loads(pickle.dumps(spilled))
+        assert list(restored) == values
+        assert not restored.is_spilled
+        assert list(pickle.loads(pickle.dumps(CompactNumbers(["20251001001004"])))) == ["20251001001004"]
+
+
+class TestCompactNumbers:
+    """Test suite for CompactNumbers"""
+
+    def test_round_trip(self):
+        """Test that numbers come back as the same 14-digit strings"""
+        numbers = ["20251001001004", "20259999999904"]
+        compact = CompactNumbers(numbers)
+
+        assert list(compact) == numbers
+        assert compact[1] == numbers[1]
+        assert compact[:1] == numbers[:1]
+        assert compact.nbytes == 16
+
+    def test_chunks(self):
+        """Test chunked string output for the exporter"""
+        numbers = [f"2025{i:010d}" for i in range(5)]
+        assert list(CompactNumbers(numbers).chunks(2)) == [numbers[:2], numbers[2:4], numbers[4:]]
+
+    def test_rejects_malformed(self):
+        """Test that anything but 14 digits is rejected"""
+        with pytest.raises(ValueError):
+            CompactNumbers(["2025"])
+        with pytest.raises(ValueError):
+            CompactNumbers(["2025100100100A"])
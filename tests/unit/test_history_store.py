@@ -0,0 +1,141 @@
+"""
+Unit tests for history_store
+
+Tests compact store round-trips and multi-machine history merging.
+"""
+
+import json
+import os
+import threading
+from array import array
+
+import pytest
+from src.core import history_store
+from src.core.history_store import (
+    HistoryArchive,
+    HistoryStoreError,
+    is_compact_store,
+    iter_store_days,
+    load_store_numbers,
+    merge_stores,
+    write_store,
+)
+from src.core.keyspace import compose_number
+from src.core.uniqueness_checker import UniquenessChecker
+
+
+def _write_json(path, numbers):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(numbers, f)
+
+
+class TestHistoryStore:
+    """Test suite for compact history stores"""
+
+    def test_write_and_read_roundtrip(self, tmp_path):
+        """Test compact store preserves days and indices"""
+        path = str(tmp_path / "store.gsjh")
+        total = write_store(path, [("20251103", [1, 5, 9]), ("20251104", [0, 809999])])
+
+        assert total == 5
+        assert is_compact_store(path)
+        days = [(day, list(indices)) for day, indices in iter_store_days(path)]
+        assert days == [("20251103", [1, 5, 9]), ("20251104", [0, 809999])]
+
+    def test_days_must_be_ordered(self, tmp_path):
+        """Test out-of-order days are rejected"""
+        with pytest.raises(HistoryStoreError):
+            write_store(str(tmp_path / "bad.gsjh"), [("20251104", [1]), ("20251103", [1])])
+
+    def test_truncated_store(self, tmp_path):
+        """Test truncated stores raise instead of loading partial data"""
+        path = str(tmp_path / "store.gsjh")
+        write_store(path, [("20251104", list(range(1000)))])
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 10)
+
+        with pytest.raises(HistoryStoreError):
+            list(iter_store_days(path))
+
+    def test_merge_reports_duplicates(self, tmp_path):
+        """Test merging JSON histories reports numbers issued twice"""
+        pc1 = str(tmp_path / "pc1.json")
+        pc2 = str(tmp_path / "pc2.json")
+        _write_json(pc1, ["20253291170804", "20251111111104", "20251231231103"])
+        _write_json(pc2, ["20253291170804", "20259991199904"])
+
+        output = str(tmp_path / "merged.gsjh")
+        report = merge_stores([pc1, pc2], output)
+
+        assert report['input_numbers'] == 5
+        assert report['numbers'] == 4
+        assert report['days'] == 2
+        assert report['duplicates'] == [{'number': "20253291170804", 'sources': [pc1, pc2]}]
+        assert load_store_numbers(output) == {
+            "20253291170804", "20251111111104", "20251231231103", "20259991199904"
+        }
+
+    def test_merge_compact_and_json_sources(self, tmp_path):
+        """Test compact stores can be merged again with JSON files"""
+        first = str(tmp_path / "first.gsjh")
+        pc3 = str(tmp_path / "pc3.json")
+        merge_stores([self._json(tmp_path, "pc1.json", ["20251111111104"])], first)
+        _write_json(pc3, ["20252222222204"])
+
+        output = str(tmp_path / "merged.gsjh")
+        report = merge_stores([first, pc3], output)
+
+        assert report['numbers'] == 2
+        assert report['duplicates'] == []
+
+    def test_checker_loads_compact_store(self, tmp_path):
+        """Test merged stores can be used as a history file"""
+        output = str(tmp_path / "merged.gsjh")
+        merge_stores([self._json(tmp_path, "pc1.json", ["20251111111104"])], output)
+
+        checker = UniquenessChecker(history_file=output)
+
+        assert checker.get_count() == 1
+        assert not checker.is_unique("20251111111104")
+
+    @staticmethod
+    def _json(tmp_path, name, numbers):
+        path = str(tmp_path / name)
+        _write_json(path, numbers)
+        return path
+
+
+class TestHistoryArchive:
+    """Test suite for HistoryArchive"""
+
+    def test_lookup_during_freeze(self, tmp_path, monkeypatch):
+        """Test that a lookup racing a freeze never reads the new file at old offsets"""
+        archive = HistoryArchive(str(tmp_path / "archive.gsjh"))
+        archive.freeze({"20250101": array('I', range(0, 20000, 2))})
+        number = compose_number("20250101", 1234)
+        results = []
+
+        def lookup():
+            try:
+                results.append(archive.contains(number))
+            except Exception as e:
+                results.append(e)
+
+        original = history_store.write_store
+        lookups = []
+
+        def write_then_look_up(path, days):
+            # The file has been replaced but the index not yet rebuilt
+            total = original(path, days)
+            lookups.append(threading.Thread(target=lookup))
+            lookups[-1].start()
+            lookups[-1].join(timeout=0.2)
+            return total
+
+        monkeypatch.setattr(history_store, 'write_store', write_then_look_up)
+        archive.freeze({"20241201": array('I', range(5000))})
+        lookups[0].join()
+
+        assert results == [True]
+        assert archive.days() == ["20241201", "20250101"]
+        assert len(list(archive.iter_numbers())) == 15000
@@ -0,0 +1,95 @@
+"""
+Unit tests for HistoryWriter
+
+Tests debounced background persistence and flush durability.
+"""
+
+import threading
+import time
+
+from src.core.history_writer import HistoryWriter
+from src.core.uniqueness_checker import UniquenessChecker
+
+
+class TestHistoryWriter:
+    """Test suite for HistoryWriter class"""
+
+    def test_changes_are_coalesced(self):
+        """Test that many changes within the debounce window cause one save"""
+        saves = []
+        writer = HistoryWriter(lambda: saves.append(time.monotonic()) or True, debounce_seconds=0.2)
+
+        for _ in range(100):
+            writer.mark_dirty()
+        time.sleep(0.5)
+
+        assert len(saves) == 1
+        assert not writer.is_dirty
+        writer.close()
+
+    def test_flush_saves_immediately(self):
+        """Test that flush does not wait for the debounce interval"""
+        saves = []
+        writer = HistoryWriter(lambda: saves.append(1) or True, debounce_seconds=60)
+
+        writer.mark_dirty()
+        start = time.monotonic()
+        assert writer.flush(timeout=5) is True
+
+        assert time.monotonic() - start < 5
+        assert saves == [1]
+        writer.close()
+
+    def test_flush_reports_failure(self):
+        """Test that flush returns False when saving fails"""
+        writer = HistoryWriter(lambda: False, debounce_seconds=60)
+
+        writer.mark_dirty()
+
+        assert writer.flush(timeout=5) is False
+        assert writer.is_dirty
+        writer.close(timeout=1)
+
+    def test_close_flushes_pending_changes(self):
+        """Test that close writes pending changes"""
+        saves = []
+        writer = HistoryWriter(lambda: saves.append(1) or True, debounce_seconds=60)
+
+        writer.mark_dirty()
+
+        assert writer.close() is True
+        assert saves == [1]
+
+
+def test_checker_background_save(tmp_path):
+    """Test registrations become durable after flush"""
+    history_file = str(tmp_path / "history.json")
+    checker = UniquenessChecker(history_file=history_file, background_save=True)
+    numbers = ["20251111111111", "20252222222222"]
+
+    checker.register_batch(numbers)
+    assert checker.flush(timeout=5) is True
+
+    reloaded = UniquenessChecker(history_file=history_file, retention_days=None)
+    assert reloaded.used_numbers == set(numbers)
+    checker.close()
+
+
+def test_checker_background_save_concurrent_registration(tmp_path):
+    """Test saving while other threads register numbers"""
+    history_file = str(tmp_path / "history.json")
+    checker = UniquenessChecker(history_file=history_file, background_save=True)
+
+    def register(prefix):
+        for i in range(200):
+            checker.register_number(f"2025{prefix}{i:09d}")
+
+    threads = [threading.Thread(target=register, args=(p,)) for p in "1234"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert checker.close() is True
+    reloaded = UniquenessChecker(history_file=history_file, retention_days=None)
+    assert reloaded.get_count() == 800
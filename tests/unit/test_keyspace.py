@@ -0,0 +1,126 @@
+"""
+Unit tests for KeyspacePartition
+
+Tests the keyed per-day permutation, shard disjointness and shard-aware generation.
+"""
+
+import os
+import tempfile
+
+import pytest
+from src.core.keyspace import (
+    KeyspacePartition,
+    compose_number,
+    split_number,
+    number_day,
+)
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+from src.utils.constants import DAILY_KEYSPACE_SIZE
+
+
+DAY = "20251104"
+
+
+class TestKeyspacePartition:
+    """Test suite for KeyspacePartition class"""
+
+    @pytest.fixture
+    def temp_history_file(self):
+        """Create temporary history file for testing"""
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        os.remove(path)
+        yield path
+        if os.path.exists(path):
+            os.remove(path)
+
+    def test_split_and_compose_roundtrip(self):
+        """Test number <-> (day, index) conversion"""
+        number = "20253291170804"
+        day, index = split_number(number)
+
+        assert day == "20251104"
+        assert compose_number(day, index) == number
+
+    def test_unsharded_owns_everything(self):
+        """Test default partition is a no-op"""
+        partition = KeyspacePartition()
+
+        assert not partition.is_sharded
+        assert partition.capacity == DAILY_KEYSPACE_SIZE
+        assert partition.owns("20253291170804")
+
+    def test_invalid_configuration(self):
+        """Test invalid node configuration is rejected"""
+        with pytest.raises(ValueError):
+            KeyspacePartition(node_id=3, node_count=3)
+        with pytest.raises(ValueError):
+            KeyspacePartition(node_id=0, node_count=0)
+
+    def test_capacities_cover_keyspace(self):
+        """Test shard capacities add up to the daily keyspace"""
+        node_count = 7
+        total = sum(KeyspacePartition(k, node_count).capacity for k in range(node_count))
+        assert total == DAILY_KEYSPACE_SIZE
+
+    def test_shards_are_disjoint(self):
+        """Test that two shards never map to the same index"""
+        shard0 = KeyspacePartition(node_id=0, node_count=2)
+        shard1 = KeyspacePartition(node_id=1, node_count=2)
+
+        indices0 = {shard0.position_to_index(DAY, p) for p in range(0, shard0.capacity, 7)}
+        indices1 = {shard1.position_to_index(DAY, p) for p in range(0, shard1.capacity, 7)}
+
+        assert not indices0 & indices1
+        assert all(shard0.owner_of_index(DAY, i) == 0 for i in list(indices0)[:1000])
+        assert all(shard1.owner_of_index(DAY, i) == 1 for i in list(indices1)[:1000])
+
+    def test_permutation_depends_on_day_and_key(self):
+        """Test that the partition differs per day and per key"""
+        a = KeyspacePartition(node_id=0, node_count=2, key="site-a")
+        b = KeyspacePartition(node_id=0, node_count=2, key="site-b")
+
+        same_key_days = [a.position_to_index(DAY, p) for p in range(50)]
+        other_day = [a.position_to_index("20251105", p) for p in range(50)]
+        other_key = [b.position_to_index(DAY, p) for p in range(50)]
+
+        assert same_key_days != other_day
+        assert same_key_days != other_key
+
+    def test_sharded_generator_stays_in_shard(self):
+        """Test generator only issues numbers owned by its shard"""
+        partition = KeyspacePartition(node_id=2, node_count=3)
+        generator = TrackingNumberGenerator(partition=partition)
+
+        numbers = generator.generate_batch(200)
+
+        assert generator.get_daily_capacity() == partition.capacity
+        assert all(partition.owns(number) for number in numbers)
+
+    def test_checker_refuses_foreign_numbers(self, temp_history_file):
+        """Test checker only registers its own shard"""
+        mine = KeyspacePartition(node_id=0, node_count=2)
+        other = KeyspacePartition(node_id=1, node_count=2)
+        checker = UniquenessChecker(history_file=temp_history_file, partition=mine)
+
+        own_number = compose_number(DAY, mine.position_to_index(DAY, 0))
+        foreign_number = compose_number(DAY, other.position_to_index(DAY, 0))
+
+        assert checker.register_number(own_number) is True
+        assert checker.register_number(foreign_number) is False
+        assert checker.register_batch([foreign_number]) == 0
+
+    def test_capacity_report(self, temp_history_file):
+        """Test per-shard capacity reporting"""
+        partition = KeyspacePartition(node_id=1, node_count=4)
+        checker = UniquenessChecker(history_file=temp_history_file, partition=partition)
+        numbers = [compose_number(DAY, partition.position_to_index(DAY, p)) for p in range(10)]
+        checker.register_batch(numbers)
+
+        report = checker.get_capacity_report(DAY)
+
+        assert report['capacity'] == partition.capacity
+        assert report['used'] == 10
+        assert report['remaining'] == partition.capacity - 10
+        assert all(number_day(n) == DAY for n in numbers)
@@ -0,0 +1,153 @@
+"""
+Unit tests for NumberPool
+
+Tests refill, O(1) serving, persistence across restarts and midnight rollover.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.core.number_pool import NumberPool
+from src.core.tracking_generator import TrackingNumberGenerator
+from src.core.uniqueness_checker import UniquenessChecker
+
+
+@pytest.fixture
+def checker(tmp_path):
+    """Checker with a fresh history file"""
+    checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+    yield checker
+    checker.close()
+
+
+def make_pool(checker, tmp_path, **kwargs):
+    """Pool with small sizes, stored next to the history"""
+    options = {'target_size': 50, 'low_water_mark': 10, 'lease_block': 8}
+    options.update(kwargs)
+    return NumberPool(checker, pool_file=str(tmp_path / "pool.json"), **options)
+
+
+class TestNumberPool:
+    """Test suite for NumberPool class"""
+
+    def test_refill_registers_numbers(self, checker, tmp_path):
+        """Test that pooled numbers are registered before they are served"""
+        pool = make_pool(checker, tmp_path)
+
+        assert pool.refill() == 50
+        assert pool.size == 50
+        assert checker.get_count() == 50
+
+    def test_take_does_not_generate(self, checker, tmp_path, monkeypatch):
+        """Test that serving from the pool never draws random numbers"""
+        pool = make_pool(checker, tmp_path)
+        pool.refill()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("numbers generated on the request path")
+
+        # take() tops up through generate_and_register, which draws through the random source
+        for generator in (pool.generator, pool._demand_generator):
+            monkeypatch.setattr(generator, "generate_and_register", fail)
+            monkeypatch.setattr(generator.random_source, "randbelow", fail)
+            monkeypatch.setattr(generator.random_source, "randbelow_many", fail)
+        numbers = pool.take(5)
+
+        assert len(numbers) == 5
+        assert pool.size == 45
+        assert checker.get_count() == 50
+
+    def test_take_beyond_pool_generates_rest(self, checker, tmp_path):
+        """Test that large requests are topped up with fresh numbers"""
+        pool = make_pool(checker, tmp_path)
+        pool.refill()
+
+        numbers = pool.take(60)
+
+        assert len(set(numbers)) == 60
+        assert pool.size == 0
+        assert checker.get_count() == 60
+
+    def test_restart_never_reissues(self, checker, tmp_path):
+        """Test that served numbers stay served after a restart"""
+        pool = make_pool(checker, tmp_path)
+        pool.refill()
+        served = pool.take(3)
+
+        restarted = make_pool(checker, tmp_path)
+        remaining = restarted.take(restarted.size)
+
+        assert not set(served) & set(remaining)
+        assert len(remaining) == 50 - (3 + 8)  # served numbers plus the rest of their lease block
+
+    def test_midnight_rollover(self, checker, tmp_path):
+        """Test that yesterday's pool is dropped and today's numbers are issued"""
+        pool = make_pool(checker, tmp_path)
+        pool.refill()
+        pool._day = "20000101"
+
+        numbers = pool.take(2)
+
+        assert pool.size == 0
+        assert all(number[:4] != "2000" for number in numbers)
+        with open(tmp_path / "pool.json", encoding="utf-8") as f:
+            assert json.load(f)['day'] != "20000101"
+
+    def test_background_refill_at_low_water_mark(self, checker, tmp_path):
+        """Test that the refiller tops up once the pool runs low"""
+        pool = make_pool(checker, tmp_path).start()
+        try:
+            deadline = time.time() + 10
+            while pool.size < 50 and time.time() < deadline:
+                time.sleep(0.01)
+            pool.take(45)
+
+            deadline = time.time() + 10
+            while pool.size < 50 and time.time() < deadline:
+                time.sleep(0.01)
+            assert pool.size == 50
+        finally:
+            pool.close()
+
+    def test_generator_issues_from_pool(self, checker, tmp_path):
+        """Test TrackingNumberGenerator.issue serves from a configured pool"""
+        pool = make_pool(checker, tmp_path)
+        pool.refill()
+        generator = TrackingNumberGenerator(pool=pool)
+
+        assert len(generator.issue(4)) == 4
+        assert pool.size == 46
+
+    def test_refiller_has_own_random_source(self, checker, tmp_path):
+        """Test that take() top-ups never draw from the refiller's random source"""
+        pool = make_pool(checker, tmp_path)
+
+        assert pool._demand_generator.random_source is not pool.generator.random_source
+        assert pool._demand_generator.partition is pool.generator.partition
+
+    def test_concurrent_take_and_refill(self, checker, tmp_path):
+        """Test that top-ups racing the refiller never issue a number twice"""
+        pool = make_pool(checker, tmp_path, target_size=200, low_water_mark=150).start()
+        served = []
+        try:
+            takers = [
+                threading.Thread(target=lambda: [served.extend(pool.take(25)) for _ in range(20)])
+                for _ in range(4)
+            ]
+            for taker in takers:
+                taker.start()
+            for taker in takers:
+                taker.join()
+        finally:
+            pool.close()
+
+        assert len(served) == 2000
+        assert len(set(served)) == 2000
+
+    def test_invalid_watermarks(self, checker, tmp_path):
+        """Test that a low-water mark above the target is rejected"""
+        with pytest.raises(ValueError):
+            make_pool(checker, tmp_path, target_size=10, low_water_mark=20)
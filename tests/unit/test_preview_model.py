@@ -0,0 +1,54 @@
+"""
+Unit tests for OrderPreviewModel (lazy preview table model)
+"""
+
+import pytest
+from PyQt5.QtCore import Qt
+
+from src.ui.preview_model import OrderPreviewModel
+
+
+@pytest.fixture
+def model():
+    """Model exposing 100 rows per fetch"""
+    return OrderPreviewModel(fetch_batch=100)
+
+
+class TestOrderPreviewModel:
+    """Test suite for OrderPreviewModel"""
+
+    def test_rows_exposed_in_batches(self, model):
+        """Test that a large source is exposed one batch at a time"""
+        model.set_codes([f"C{i}" for i in range(250)])
+        assert model.rowCount() == 100
+        assert model.total_rows == 250
+
+        model.fetchMore()
+        assert model.rowCount() == 200
+        model.fetchMore()
+        assert model.rowCount() == 250
+        assert not model.canFetchMore()
+
+    def test_cells_read_from_source(self, model):
+        """Test that codes show immediately and numbers once generated"""
+        model.set_codes(["A", "B"])
+        assert model.data(model.index(1, 0)) == "B"
+        assert model.data(model.index(1, 1)) == ""
+
+        model.set_numbers(["20260001", "20260002"])
+        assert model.data(model.index(1, 1)) == "20260002"
+        assert model.headerData(1, Qt.Horizontal) == "송장번호"
+
+    def test_source_not_copied(self, model):
+        """Test that the model keeps a reference instead of copying rows"""
+        codes = [f"C{i}" for i in range(10)]
+        model.set_codes(codes)
+        assert model._codes is codes
+
+    def test_clear(self, model):
+        """Test that clear drops rows and numbers"""
+        model.set_codes(["A"])
+        model.set_numbers(["1"])
+        model.clear()
+        assert model.rowCount() == 0
+        assert model.total_rows == 0
@@ -0,0 +1,89 @@
+"""
+Unit tests for random sources
+
+Tests value ranges, uniformity, determinism and generator integration.
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.core import random_source
+from src.core.random_source import RandomSource, SeededRandomSource, SystemRandomSource
+from src.core.tracking_generator import TrackingNumberGenerator
+
+
+class TestSystemRandomSource:
+    """Test suite for SystemRandomSource class"""
+
+    def test_values_in_range(self):
+        """Test that draws stay within [0, bound), across buffer refills"""
+        source = SystemRandomSource(buffer_bytes=64)
+        values = [source.randbelow(810000) for _ in range(1000)]
+        assert all(0 <= value < 810000 for value in values)
+
+    def test_randbelow_many(self):
+        """Test that bulk draws return exactly the requested count"""
+        source = SystemRandomSource(buffer_bytes=256)
+        values = source.randbelow_many(900, 5000)
+        assert len(values) == 5000
+        assert all(0 <= value < 900 for value in values)
+
+    def test_roughly_uniform(self):
+        """Test that every value of a small bound is drawn about equally often"""
+        counts = Counter(SystemRandomSource().randbelow_many(10, 100000))
+        assert set(counts) == set(range(10))
+        assert all(9000 < count < 11000 for count in counts.values())
+
+    def test_bulk_path_matches_fallback(self, monkeypatch):
+        """Test that the numpy bulk path draws exactly what the plain loop draws from the same bytes"""
+        pytest.importorskip("numpy")
+
+        def draws(numpy_module):
+            monkeypatch.setattr(random_source, "_numpy_module", numpy_module)
+            stream = random.Random(3)
+            monkeypatch.setattr(random_source.os, "urandom", stream.randbytes)
+            source = SystemRandomSource(buffer_bytes=1024)
+            # Bounds with heavy rejection, none (2^32) and a single value, across buffer refills
+            return [source.randbelow_many(bound, 3000) for bound in (3 << 30, 810000, 1 << 32, 1)]
+
+        bulk = draws(None)
+        assert random_source._numpy_module  # numpy was used
+        assert bulk == draws(False)
+        assert all(0 <= value < 3 << 30 for value in bulk[0]) and len(bulk[0]) == 3000
+
+    def test_invalid_bound(self):
+        """Test that bounds outside 1..2^32 are rejected"""
+        with pytest.raises(ValueError):
+            SystemRandomSource().randbelow(0)
+        with pytest.raises(ValueError):
+            SystemRandomSource().randbelow((1 << 32) + 1)
+
+
+class TestRandomSource:
+    """Test suite for the RandomSource interface"""
+
+    def test_randbelow_required(self):
+        """Test that a source without randbelow can't be created"""
+        class NoDraws(RandomSource):
+            pass
+
+        with pytest.raises(TypeError):
+            NoDraws()
+
+
+class TestSeededRandomSource:
+    """Test suite for SeededRandomSource class"""
+
+    def test_deterministic(self):
+        """Test that equal seeds give equal sequences"""
+        first = SeededRandomSource(42).randbelow_many(810000, 100)
+        second = SeededRandomSource(42).randbelow_many(810000, 100)
+        assert first == second
+
+    def test_generator_reproducible(self):
+        """Test that a seeded generator produces a reproducible batch"""
+        first = TrackingNumberGenerator(random_source=SeededRandomSource(7)).generate_batch(50)
+        second = TrackingNumberGenerator(random_source=SeededRandomSource(7)).generate_batch(50)
+        assert first == second
@@ -0,0 +1,104 @@
+"""
+Unit tests for SpeculativeBatch
+
+Tests background reservation, commit hand-over and cancellation.
+"""
+
+from src.core.speculation import SpeculativeBatch
+from src.core.uniqueness_checker import UniquenessChecker
+
+
+class TestSpeculativeBatch:
+    """Test suite for SpeculativeBatch class"""
+
+    def test_commit_hands_over_reserved_numbers(self, tmp_path):
+        """Test that commit registers exactly the requested count"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        batch = SpeculativeBatch(2500, checker).start()
+
+        numbers = batch.commit()
+
+        assert len(numbers) == 2500
+        assert len(set(numbers)) == 2500
+        assert checker.get_count() == 2500
+        assert checker.reserved_day() == frozenset()
+
+    def test_cancel_releases_everything(self, tmp_path):
+        """Test that a cancelled batch burns no keyspace"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        batch = SpeculativeBatch(3000, checker).start()
+        batch._thread.join()
+
+        assert batch.cancel() == 3000
+        assert checker.get_count() == 0
+        assert checker.reserved_day() == frozenset()
+
+    def test_commit_generates_shortfall(self, tmp_path):
+        """Test that numbers lost from the reservation are regenerated on commit"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        batch = SpeculativeBatch(100, checker).start()
+        batch._thread.join()
+        checker.release(batch._reserved[:10])
+
+        numbers = batch.commit()
+
+        assert len(numbers) == 100
+        assert len(set(numbers)) == 100
+        assert checker.get_count() == 100
+
+    def test_commit_does_not_wait_for_whole_reservation(self, tmp_path):
+        """Test that committing mid-reservation stops it after one chunk and generates the rest"""
+        import time
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        batch = SpeculativeBatch(20000, checker)
+        reserve = batch.generator.generate_and_reserve
+
+        def slow_reserve(*args, **kwargs):
+            time.sleep(0.2)  # 20 chunks would take 4 s
+            return reserve(*args, **kwargs)
+
+        batch.generator.generate_and_reserve = slow_reserve
+        batch.start()
+        time.sleep(0.3)
+        progress = []
+
+        start = time.perf_counter()
+        numbers = batch.commit(callback=lambda current, total: progress.append((current, total)))
+
+        assert time.perf_counter() - start < 2.0
+        assert len(set(numbers)) == 20000
+        assert checker.get_count() == 20000
+        assert checker.reserved_day() == frozenset()
+        assert 0 < progress[0][0] < 20000
+        assert progress[-1] == (20000, 20000)
+
+    def test_reservations_skipped_by_regular_generation(self, tmp_path):
+        """Test that a parallel job never receives speculatively reserved numbers"""
+        from src.core.tracking_generator import TrackingNumberGenerator
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        batch = SpeculativeBatch(2000, checker).start()
+        other = TrackingNumberGenerator().generate_and_register(2000, checker)
+        reserved = batch.commit()
+
+        assert not set(other) & set(reserved)
+        assert checker.get_count() == 4000
+
+    def test_mismatched_batch_released_by_worker(self, tmp_path, monkeypatch):
+        """Test that a generation for another count releases the speculative reservation"""
+        from src.ui import main_window
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        monkeypatch.setattr(main_window, 'get_uniqueness_checker', lambda: checker)
+        batch = SpeculativeBatch(1000, checker).start()
+        batch._thread.join()
+        results = []
+
+        worker = main_window.GenerationWorker(400, speculative=batch)
+        worker.finished.connect(results.append)
+        worker.run()
+
+        assert len(results[0]) == 400
+        assert checker.get_count() == 400
+        assert checker.reserved_day() == frozenset()
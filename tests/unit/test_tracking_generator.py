@@ -5,7 +5,11 @@ Tests tracking number generation logic, format validation, and uniqueness guaran
 """
 
 import pytest
+from datetime import date, timedelta
+from src.core.keyspace import day_key, number_day
 from src.core.tracking_generator import TrackingNumberGenerator, generate_tracking_numbers
+from src.core.uniqueness_checker import UniquenessChecker
+from src.utils.constants import MAX_SHIP_DAYS_AHEAD
 from src.utils.validators import validate_tracking_number
 
 
@@ -197,3 +201,70 @@ def test_batch_generation_error_handling():
         assert len(numbers) == 100
     except RuntimeError:
         pytest.fail("Batch generation failed unexpectedly")
+
+
+class TestGenerationSession:
+    """Test suite for GenerationSession (pinned ship date)"""
+
+    def test_session_pins_date(self):
+        """Test that every number in a session carries the pinned date"""
+        session = TrackingNumberGenerator().session()
+        today = date.today()
+        for number in session.generate_many(1000):
+            assert number[:4] == f"{today.year}"
+            assert number[7:9] == f"{today.month:02d}"
+            assert number[12:14] == f"{today.day:02d}"
+
+    def test_future_ship_date(self, tmp_path):
+        """Test pre-issuing numbers for tomorrow's dispatch"""
+        tomorrow = date.today() + timedelta(days=1)
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        numbers = TrackingNumberGenerator().generate_and_register(100, checker, ship_date=tomorrow)
+
+        assert {number_day(number) for number in numbers} == {day_key(tomorrow)}
+        assert checker.get_day_count(day_key(tomorrow)) == 100
+        assert checker.get_day_count(day_key(date.today())) == 0
+
+    def test_invalid_ship_dates(self):
+        """Test that past dates and dates beyond the horizon are rejected"""
+        generator = TrackingNumberGenerator()
+        with pytest.raises(ValueError):
+            generator.session(date.today() - timedelta(days=1))
+        with pytest.raises(ValueError):
+            generator.session(date.today() + timedelta(days=MAX_SHIP_DAYS_AHEAD + 1))
+
+
+class TestStreamingGeneration:
+    """Test suite for iter_generate_and_register (chunked generation)"""
+
+    def test_blocks_are_registered_as_yielded(self, tmp_path):
+        """Test that each block is registered before it reaches the consumer"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        blocks = TrackingNumberGenerator().iter_generate_and_register(2500, checker, chunk_size=1000)
+
+        seen = []
+        for block in blocks:
+            assert not any(checker.is_unique(number) for number in block)
+            seen.extend(block)
+            assert checker.get_count() == len(seen)
+
+        assert len(set(seen)) == 2500
+
+    def test_block_sizes(self, tmp_path):
+        """Test that blocks respect chunk_size"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        sizes = [len(block) for block in TrackingNumberGenerator().iter_generate_and_register(250, checker, chunk_size=100)]
+        assert sizes == [100, 100, 50]
+
+    def test_lazy_until_first_block(self, tmp_path):
+        """Test that nothing is generated until the first block is requested"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        blocks = TrackingNumberGenerator().iter_generate_and_register(100, checker)
+        assert checker.get_count() == 0
+        assert len(next(blocks)) == 100
+
+    def test_invalid_count(self, tmp_path):
+        """Test that a non-positive count fails on first use"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        with pytest.raises(ValueError):
+            next(TrackingNumberGenerator().iter_generate_and_register(0, checker))
@@ -19,9 +19,10 @@ class TestUniquenessChecker:
         fd, path = tempfile.mkstemp(suffix='.json')
         os.close(fd)
         yield path
-        # Cleanup
-        if os.path.exists(path):
-            os.remove(path)
+        # Cleanup (history file and archive of frozen days)
+        for leftover in (path, path + ".archive"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
 
     def test_initialization(self, temp_history_file):
         """Test checker initialization"""
@@ -240,3 +241,195 @@ def test_history_file_missing_directory():
     import shutil
     if os.path.exists("/tmp/non_existent_dir"):
         shutil.rmtree("/tmp/non_existent_dir")
+
+
+class TestHistoryRetention:
+    """Test suite for archiving past days out of the hot set"""
+
+    PAST_NUMBERS = ["20241111111111", "20242222222222"]
+
+    def test_past_days_archived_on_load(self, tmp_path):
+        """Test that past days move to the archive but stay visible"""
+        history_file = str(tmp_path / "history.json")
+        UniquenessChecker(history_file=history_file, retention_days=None).register_batch(self.PAST_NUMBERS)
+
+        checker = UniquenessChecker(history_file=history_file)
+
+        assert checker.used_numbers == set()
+        assert checker.get_count() == 2
+        assert not checker.is_unique("20241111111111")
+        assert os.path.exists(history_file + ".archive")
+
+    def test_today_stays_hot(self, tmp_path):
+        """Test that today's numbers are never archived"""
+        from src.core.tracking_generator import TrackingNumberGenerator
+
+        history_file = str(tmp_path / "history.json")
+        today_numbers = TrackingNumberGenerator().generate_batch(5)
+        UniquenessChecker(history_file=history_file).register_batch(today_numbers + self.PAST_NUMBERS)
+
+        checker = UniquenessChecker(history_file=history_file)
+
+        assert checker.used_numbers == set(today_numbers)
+        assert checker.get_count() == 7
+
+    def test_retention_days_keeps_recent_days_hot(self, tmp_path):
+        """Test that retention_days keeps recent past days in the hot set"""
+        history_file = str(tmp_path / "history.json")
+        checker = UniquenessChecker(history_file=history_file, retention_days=100000)
+        checker.register_batch(self.PAST_NUMBERS)
+
+        assert checker.compact_history() == 0
+        assert checker.compact_history(retention_days=0) == 2
+        assert checker.used_numbers == set()
+
+    def test_failed_freeze_retried(self, tmp_path, monkeypatch):
+        """Test that a failed freeze leaves the day uncompacted and is retried after the back-off"""
+        import src.core.uniqueness_checker as uniqueness_checker
+        from src.core.history_store import HistoryArchive
+
+        history_file = str(tmp_path / "history.json")
+        UniquenessChecker(history_file=history_file, retention_days=None).register_batch(self.PAST_NUMBERS)
+
+        def disk_full(archive, days):
+            raise IOError("No space left on device")
+
+        freeze = HistoryArchive.freeze
+        monkeypatch.setattr(HistoryArchive, 'freeze', disk_full)
+        checker = UniquenessChecker(history_file=history_file)
+        assert checker.used_numbers == set(self.PAST_NUMBERS)
+
+        # Within the back-off, registrations don't retry
+        monkeypatch.setattr(HistoryArchive, 'freeze', freeze)
+        checker.register_number("20243333333333")
+        assert checker.used_numbers == set(self.PAST_NUMBERS) | {"20243333333333"}
+
+        monkeypatch.setattr(uniqueness_checker, 'ARCHIVE_RETRY_SECONDS', 0)
+        checker.register_number("20244444444444")
+        assert checker.used_numbers == {"20244444444444"}
+        assert checker.get_count() == 4
+
+    def test_archive_audit_and_export(self, tmp_path):
+        """Test archived days can be audited and exported"""
+        history_file = str(tmp_path / "history.json")
+        checker = UniquenessChecker(history_file=history_file, retention_days=None)
+        checker.register_batch(self.PAST_NUMBERS)
+        checker.compact_history(retention_days=0)
+
+        assert list(checker.archive.iter_day_numbers("20241111")) == ["20241111111111"]
+
+        export_path = str(tmp_path / "export.json")
+        assert checker.export_history(export_path)
+        exported = UniquenessChecker(history_file=export_path, retention_days=None)
+        assert exported.used_numbers == set(self.PAST_NUMBERS)
+
+    def test_clear_history_clears_archive(self, tmp_path):
+        """Test clearing history also removes archived days"""
+        history_file = str(tmp_path / "history.json")
+        checker = UniquenessChecker(history_file=history_file, retention_days=None)
+        checker.register_batch(self.PAST_NUMBERS)
+        checker.compact_history(retention_days=0)
+
+        checker.clear_history()
+
+        assert checker.get_count() == 0
+        assert checker.is_unique("20241111111111")
+
+
+class TestConcurrentAccess:
+    """Test suite for snapshot reads and atomic claims"""
+
+    def test_snapshot_is_immutable(self, tmp_path):
+        """Test that a snapshot doesn't change when numbers are registered"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        checker.register_number("20251111111111")
+
+        snapshot = checker.snapshot()
+        checker.register_number("20252222222222")
+
+        assert set(snapshot) == {"20251111111111"}
+        assert "20252222222222" in checker.snapshot()
+        assert checker.snapshot_day("20251111") == frozenset({"20251111111111"})
+
+    def test_claim_batch_grants_each_number_once(self, tmp_path):
+        """Test that concurrent claims never hand out a number twice"""
+        import threading
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        candidates = [f"2025{i:03d}11{i:03d}11" for i in range(100, 600)]
+        results = []
+
+        def claim():
+            results.append(checker.claim_batch(candidates))
+
+        threads = [threading.Thread(target=claim) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        claimed = [number for result in results for number in result]
+        assert sorted(claimed) == sorted(candidates)
+
+    def test_parallel_generation_jobs(self, tmp_path):
+        """Test several generation jobs sharing one checker never collide"""
+        import threading
+        from src.core.tracking_generator import TrackingNumberGenerator
+
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        results = []
+
+        def job():
+            results.append(TrackingNumberGenerator().generate_and_register(2000, checker))
+
+        threads = [threading.Thread(target=job) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        numbers = [number for result in results for number in result]
+        assert len(numbers) == 8000
+        assert len(set(numbers)) == 8000
+        assert checker.get_count() == 8000
+
+
+class TestReservations:
+    """Test suite for uncommitted reservations"""
+
+    def test_reserved_numbers_are_not_registered_or_saved(self, tmp_path):
+        """Test that reserving neither registers nor persists numbers"""
+        history = str(tmp_path / "history.json")
+        checker = UniquenessChecker(history_file=history)
+
+        assert checker.reserve(["20251111111111"]) == ["20251111111111"]
+        assert checker.is_unique("20251111111111")
+        assert checker.get_count() == 0
+        assert UniquenessChecker(history_file=history).reserved_day("20251111") == frozenset()
+
+    def test_reservation_blocks_other_jobs(self, tmp_path):
+        """Test that claims and reservations skip numbers reserved by someone else"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        checker.reserve(["20251111111111"])
+
+        assert checker.claim_batch(["20251111111111", "20252222222211"]) == ["20252222222211"]
+        assert checker.reserve(["20251111111111"]) == []
+        assert checker.get_capacity_report("20251111")['reserved'] == 1
+
+    def test_commit_reservation(self, tmp_path):
+        """Test that committing registers the numbers and drops the reservation"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        held = checker.reserve(["20251111111111", "20252222222211"])
+
+        assert checker.commit_reservation(held) == held
+        assert not checker.is_unique("20251111111111")
+        assert checker.reserved_day("20251111") == frozenset()
+
+    def test_release_returns_numbers(self, tmp_path):
+        """Test that released numbers can be claimed and aren't committable"""
+        checker = UniquenessChecker(history_file=str(tmp_path / "history.json"))
+        held = checker.reserve(["20251111111111"])
+
+        assert checker.release(held) == 1
+        assert checker.commit_reservation(held) == []
+        assert checker.claim_batch(held) == held